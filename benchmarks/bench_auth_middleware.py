@@ -0,0 +1,109 @@
+"""
+Per-request overhead of the auth layer as BaseHTTPMiddleware (the previous
+app.middleware("http") registration) against the pure ASGI AuthMiddleware,
+on the unauthenticated ping route and on an authenticated route.
+
+    python -m benchmarks.bench_auth_middleware [requests]
+"""
+import asyncio
+import sys
+import time
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from source.handlers.authHandler import createJWTToken, verify_token
+from source.handlers.pingHandler import ping
+from source.middleware import AuthMiddleware, UNAUTH_PATHS
+
+
+async def legacy_auth_middleware(request: Request, call_next):
+    # The function-based middleware this benchmark compares against
+    path = request.url.path
+    if path in UNAUTH_PATHS or path.startswith("/docs"):
+        return await call_next(request)
+
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme != "Bearer" or not token:
+        return JSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": "Invalid Authorization header format"},
+        )
+
+    try:
+        request.state.user = verify_token(token)
+    except Exception as e:
+        return JSONResponse(status_code=status.HTTP_401_UNAUTHORIZED, content={"detail": str(e)})
+
+    return await call_next(request)
+
+
+def make_app(asgi: bool) -> FastAPI:
+    app = FastAPI()
+    app.add_api_route("/v1", ping, methods=["GET"])
+    app.add_api_route("/v1/ping", ping, methods=["GET"])
+
+    if asgi:
+        app.add_middleware(AuthMiddleware)
+    else:
+        app.add_middleware(BaseHTTPMiddleware, dispatch=legacy_auth_middleware)
+    return app
+
+
+def make_scope(path: str, token: str = None) -> dict:
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers,
+        "client": ("bench", 1),
+        "server": ("bench", 80),
+    }
+
+
+async def run(app, scope: dict, count: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200
+
+    # Warm-up also fills the token cache
+    for _ in range(100):
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        await app(dict(scope), receive, send)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    token = createJWTToken(10001)
+
+    cases = [
+        ("ping", make_scope("/v1")),
+        ("auth ping", make_scope("/v1/ping", token)),
+    ]
+
+    for label, scope in cases:
+        timings = {}
+        for name, asgi in (("BaseHTTP", False), ("ASGI", True)):
+            elapsed = asyncio.run(run(make_app(asgi), scope, count))
+            timings[name] = elapsed
+            print(f"{label:<10} {name:<9} {elapsed / count * 1e6:>8.1f} us/request")
+        print(f"{label:<10} speedup   {timings['BaseHTTP'] / timings['ASGI']:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Checks/sec of the url and urlArray rules with urlparse per URL against the
+is_http_url fast path. URLs are distinct so urlsplit's own LRU cache does
+not flatter the baseline.
+
+    python -m benchmarks.bench_url_check [values]
+"""
+import sys
+import time
+from urllib.parse import urlparse
+
+from source.utility.validators import url_array_check, url_check
+
+
+def urlparse_url(v):
+    p = urlparse(v)
+    return p.scheme in ("http", "https") and bool(p.netloc)
+
+
+def urlparse_url_array(v):
+    parts = [x.strip() for x in v.strip().split("|") if x.strip()]
+    return all(urlparse_url(url) for url in parts)
+
+
+def make_values(count: int):
+    urls = [
+        f"https://cdn.example.com/catalog/{i % 997}/image-{i}.jpg?w=800"
+        for i in range(count)
+    ]
+    arrays = [
+        " | ".join(f"https://cdn.example.com/{i}/{n}.jpg" for n in range(4))
+        for i in range(count)
+    ]
+    return urls, arrays
+
+
+def bench(label, check, values):
+    start = time.perf_counter()
+    for v in values:
+        check(v)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<20} {len(values) / elapsed:>12,.0f} checks/sec  ({elapsed:.3f}s)")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    urls, arrays = make_values(count)
+
+    base = bench("url urlparse", urlparse_url, urls)
+    fast = bench("url fast", url_check({}), urls)
+    print(f"speedup              {base / fast:.2f}x")
+
+    base = bench("urlArray urlparse", urlparse_url_array, arrays)
+    fast = bench("urlArray fast", url_array_check({}), arrays)
+    print(f"speedup              {base / fast:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Rows/sec of the interpreted validator (iter_validate_rows over DictReader
+rows) against a compiled positional ValidationPlan over csv.reader records,
+with and without per-column memoized checks.
+
+    python -m benchmarks.bench_validation_plan [rows]
+"""
+import csv
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+from tests.referenceValidator import prepare_validation, iter_validate_rows
+from source.utility.validationPlan import compile_plan
+from source.utility.verdictCache import VerdictCaches
+
+TEST_DIR = Path(__file__).resolve().parents[1] / "tests"
+
+
+def make_csv(row_count: int) -> str:
+    with open(TEST_DIR / "sample.csv", newline="", encoding="utf-8") as f:
+        header, *samples = list(csv.reader(f))
+
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(header)
+    sku = header.index("SKU")
+    for i in range(row_count):
+        record = list(samples[i % len(samples)])
+        record[sku] = str(i)
+        writer.writerow(record)
+    return out.getvalue()
+
+
+def bench(label, fn, row_count):
+    start = time.perf_counter()
+    total = sum(1 for _ in fn())
+    elapsed = time.perf_counter() - start
+    assert total == row_count
+    print(f"{label:<12} {row_count / elapsed:>12,.0f} rows/sec  ({elapsed:.3f}s)")
+    return elapsed
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    mapping = json.loads((TEST_DIR / "seller_1_mapping.json").read_text())["mapping"]
+    template_fields = json.loads((TEST_DIR / "seller_1_myntra_template.json").read_text())["fields"]
+    data = make_csv(row_count)
+
+    def interpreted():
+        reader = csv.DictReader(io.StringIO(data))
+        rows = (
+            {k: "" if v is None else str(v).strip() for k, v in row.items()}
+            for row in reader
+        )
+        context = prepare_validation(mapping, template_fields, reader.fieldnames)
+        return iter_validate_rows(rows, context)
+
+    def compiled():
+        reader = csv.reader(io.StringIO(data))
+        plan = compile_plan(template_fields, mapping, next(reader))
+        return plan.new_run().results(reader)
+
+    def memoized():
+        reader = csv.reader(io.StringIO(data))
+        plan = compile_plan(template_fields, mapping, next(reader))
+        return plan.new_run(verdicts=VerdictCaches()).results(reader)
+
+    base = bench("interpreted", interpreted, row_count)
+    fast = bench("compiled", compiled, row_count)
+    memo = bench("memoized", memoized, row_count)
+    print(f"speedup      {base / fast:.2f}x")
+    print(f"memoized     {base / memo:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
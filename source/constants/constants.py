@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parents[2]
@@ -6,11 +7,58 @@ SECRET_KEY = "Streamoid.ai"
 ALGORITHM = "HS256"
 
 SAMPLE_ROW_COUNT = 10
+ROWS_PAGE_SIZE = 100
+ROWS_PAGE_MAX = 1000
+# Compressed uploads are stored as received and decompressed while read
+CSV_FILE_SUFFIXES = (".csv", ".csv.gz", ".csv.zst")
 ENCODING = "utf-8"
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+NDJSON_BATCH_ROWS = 256
+REPORT_BATCH_ROWS = 256
+PLAN_CACHE_SIZE = 128
+JSON_CACHE_SIZE = 256
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "1024"))
+COLUMNAR_BATCH_ROWS = 65536
+PARALLEL_WORKERS = os.cpu_count() or 1
+PARALLEL_MIN_SHARD_BYTES = 8 * 1024 * 1024
+SHARD_SCAN_BLOCK_SIZE = 4 * 1024 * 1024
+UNIQUE_SPILL_BUDGET_BYTES = int(os.getenv("UNIQUE_SPILL_BUDGET_BYTES", str(64 * 1024 * 1024)))
+UNIQUE_SPILL_DIR = os.getenv("UNIQUE_SPILL_DIR") or None
+SPILL_MERGE_FAN_IN = 64
+SPILL_READ_RECORDS = 8192
+VERDICT_CACHE_TYPES = ("url", "urlArray")
+VERDICT_CACHE_MAX_DISTINCT = 65536
+VERDICT_CACHE_SAMPLE = 2048
+VERDICT_CACHE_MIN_HIT_RATE = 0.5
+RESULT_CACHE_MAX_BYTES = int(os.getenv("RESULT_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+# Bump when a change to validation alters results, so cached results are not served
+VALIDATION_ENGINE_VERSION = "1"
+# Larger uploads are validated record by record instead of loaded as a list
+VALIDATION_IN_MEMORY_MAX_ROWS = 100000
+PREVIEW_HEAD_ROWS = 1000
+PREVIEW_SAMPLE_ROWS = 1000
+PREVIEW_ROWS_MAX = 100000
+PREVIEW_SAMPLE_MAX = 10000
+PREVIEW_CONFIDENCE = 0.95
+MAX_UPLOAD_CHUNKS = 10000
+
+JOB_QUEUE_BACKEND = os.getenv("JOB_QUEUE_BACKEND", "postgres")
+JOB_WORKERS = 4
+JOB_POLL_INTERVAL = 2.0
+JOB_PROGRESS_EVERY = 10000
+# A running job whose heartbeat is older than the lease lost its worker
+JOB_HEARTBEAT_INTERVAL = 30.0
+JOB_LEASE_SECONDS = 300
+JOB_MAX_ATTEMPTS = 3
 
 ENDPOINT = "/v1"
 
 TEMPLATE_DIR = BASE_DIR / "templates"
 UPLOAD_DIR = BASE_DIR / "uploads"
 MAPPING_UPLOAD_DIR = BASE_DIR / "mapping"
+ROW_VERDICT_DIR = BASE_DIR / "verdicts"
+# Content-addressed uploads: BLOB_DIR/ab/cd/abcd...
+BLOB_DIR = BASE_DIR / "blobs"
+# Chunks of resumable uploads until they are finalized
+UPLOAD_SESSION_DIR = BASE_DIR / "upload_sessions"
 LOG_FILE_PATH = BASE_DIR / "logs" / "app.log"
@@ -0,0 +1,58 @@
+import logging
+
+from sqlalchemy.orm import Session
+
+from source.db.model import MarketplaceTemplate, SellerTemplateMapping, Files
+from source.db.session import SessionLocal
+from source.utility.fileHelper import load_json_file
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def _backfill(db: Session, model, file_id_column) -> int:
+    filled = 0
+    last_id = 0
+
+    while True:
+        batch = (
+            db.query(model, Files.file_path)
+            .join(Files, file_id_column == Files.id)
+            .filter(model.content.is_(None), model.id > last_id)
+            .order_by(model.id)
+            .limit(BACKFILL_BATCH_SIZE)
+            .all()
+        )
+        if not batch:
+            return filled
+
+        for record, file_path in batch:
+            last_id = record.id
+            try:
+                record.content = load_json_file(file_path)
+                filled += 1
+            except Exception:
+                logger.warning(
+                    f"JSON content backfill skipped | table={model.__tablename__} | id={record.id} | path={file_path}"
+                )
+
+        db.commit()
+
+
+def backfill_json_content():
+    """Copies template and mapping JSON from disk into their content columns."""
+    db: Session = SessionLocal()
+    try:
+        templates = _backfill(db, MarketplaceTemplate, MarketplaceTemplate.file_id)
+        mappings = _backfill(db, SellerTemplateMapping, SellerTemplateMapping.mapping_file_id)
+
+        if templates or mappings:
+            logger.info(
+                f"JSON content backfilled | templates={templates} | mappings={mappings}"
+            )
+    except Exception:
+        db.rollback()
+        logger.exception("JSON content backfill failed")
+    finally:
+        db.close()
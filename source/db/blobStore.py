@@ -0,0 +1,150 @@
+import hashlib
+import logging
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from source.constants.constants import BLOB_DIR
+from source.db.model import StoredBlob
+from source.utility.rowIndex import index_path
+
+logger = logging.getLogger(__name__)
+
+
+def blob_path(sha256: str, root: Path = None) -> Path:
+    """Sharded location of a blob: two levels of two hex digits keep directories small."""
+    root = Path(BLOB_DIR if root is None else root)
+    return root / sha256[:2] / sha256[2:4] / sha256
+
+
+@dataclass
+class WrittenBlob:
+    sha256: str
+    path: str
+    size: int
+    created: bool
+
+
+class BlobWriter:
+    """
+    Streams bytes to a temporary file in the blob store while hashing them;
+    commit() moves the file to its content address, or drops it when a blob
+    with the same digest is already stored. seal() finishes the digest
+    without storing, so the blob can be acquired before its file appears.
+    Leaving the `with` block without commit() discards the temporary file.
+    """
+
+    def __init__(self, root: Path = None):
+        self.root = Path(BLOB_DIR if root is None else root)
+        tmp_dir = self.root / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        self.tmp_path = tmp_dir / uuid.uuid4().hex
+        self.hasher = hashlib.sha256()
+        self.size = 0
+        self.committed = False
+        self._file = open(self.tmp_path, "wb")
+
+    def write(self, data) -> int:
+        self.hasher.update(data)
+        self.size += len(data)
+        return self._file.write(data)
+
+    def seal(self) -> WrittenBlob:
+        """Digest, address and size of the written bytes; nothing is stored until commit()."""
+        self._file.close()
+        sha256 = self.hasher.hexdigest()
+        return WrittenBlob(sha256, str(blob_path(sha256, self.root)), self.size, False)
+
+    def commit(self) -> WrittenBlob:
+        blob = self.seal()
+        path = Path(blob.path)
+
+        if path.exists():
+            os.remove(self.tmp_path)
+            created = False
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Atomic; a concurrent writer of the same digest leaves identical bytes
+            os.replace(self.tmp_path, path)
+            created = True
+
+        self.committed = True
+        logger.info(f"Blob stored | sha256={blob.sha256} | size={blob.size} | created={created}")
+        return WrittenBlob(blob.sha256, blob.path, blob.size, created)
+
+    def discard(self):
+        self._file.close()
+        if self.tmp_path.exists():
+            os.remove(self.tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.committed:
+            self.discard()
+        return False
+
+
+def write_blob(data: bytes, root: Path = None) -> WrittenBlob:
+    with BlobWriter(root) as writer:
+        writer.write(data)
+        return writer.commit()
+
+
+def store_blob(db: Session, data: bytes, root: Path = None) -> WrittenBlob:
+    """write_blob for a new Files row: the blob is acquired in the caller's transaction first."""
+    with BlobWriter(root) as writer:
+        writer.write(data)
+        acquire_blob(db, writer.seal())
+        return writer.commit()
+
+
+def acquire_blob(db: Session, blob: WrittenBlob):
+    """
+    Counts one more Files row referencing `blob`, in the caller's
+    transaction. Call it before committing the blob's file: the upsert
+    holds the blob's row lock until the caller commits, so a concurrent
+    release_blob cannot remove the file in between.
+    """
+    stmt = insert(StoredBlob).values(
+        sha256=blob.sha256,
+        file_path=blob.path,
+        size_bytes=blob.size,
+        ref_count=1
+    )
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[StoredBlob.sha256],
+        set_={"ref_count": StoredBlob.ref_count + 1}
+    ))
+
+
+def release_blob(db: Session, sha256: str, file_path: str) -> bool:
+    """
+    Counts one Files row less for the blob, in the caller's transaction.
+    Only a Files row stored at the blob's path holds a reference: files
+    kept at their original paths may have their sha256 recorded later
+    (ensure_csv_sha256) without ever acquiring the blob. When no reference
+    is left its row is deleted and its file (with the row index beside it)
+    removed while the row lock is held; the caller should commit right away.
+    Returns whether the blob was removed.
+    """
+    blob = db.query(StoredBlob).filter(StoredBlob.sha256 == sha256).with_for_update().first()
+    if blob is None or blob.file_path != file_path:
+        return False
+
+    blob.ref_count -= 1
+    if blob.ref_count > 0:
+        return False
+
+    db.delete(blob)
+    for path in (blob.file_path, index_path(blob.file_path)):
+        if os.path.exists(path):
+            os.remove(path)
+
+    logger.info(f"Blob removed | sha256={sha256}")
+    return True
@@ -1,7 +1,17 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 
 from source.db.base import Base
-from source.db.model import MarketplaceTemplate, SellerCsvUpload, Files, SellerTemplateMapping
+from source.db.model import (
+    MarketplaceTemplate,
+    SellerCsvUpload,
+    Files,
+    SellerTemplateMapping,
+    ValidationJob,
+    ValidationResult,
+    StoredBlob,
+    UploadSession,
+    UploadChunk,
+)
 import os 
 
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -14,6 +24,34 @@ engine = create_engine(
     echo=False  # shows logs
 )
 
+# create_all only creates missing tables; columns and indexes added to
+# existing tables are applied here. Every statement must be idempotent.
+SCHEMA_UPGRADES = [
+    "ALTER TABLE marketplace_templates ADD COLUMN IF NOT EXISTS content JSONB",
+    "ALTER TABLE seller_template_mappings ADD COLUMN IF NOT EXISTS content JSONB",
+    "CREATE INDEX IF NOT EXISTS ix_seller_csv_uploads_seller_created "
+    "ON seller_csv_uploads (seller_id, created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_seller_template_mappings_seller_mapping_file "
+    "ON seller_template_mappings (seller_id, mapping_file_id)",
+    "ALTER TABLE files ADD COLUMN IF NOT EXISTS content_sha256 VARCHAR(64)",
+    # Files rows with equal content share a blob path
+    "ALTER TABLE files DROP CONSTRAINT IF EXISTS files_file_path_key",
+    "CREATE INDEX IF NOT EXISTS ix_files_file_path ON files (file_path)",
+    "ALTER TABLE seller_csv_uploads ADD COLUMN IF NOT EXISTS headers JSONB",
+    "ALTER TABLE seller_csv_uploads ADD COLUMN IF NOT EXISTS row_count BIGINT",
+    "ALTER TABLE seller_csv_uploads ADD COLUMN IF NOT EXISTS sample_rows JSONB",
+    "ALTER TABLE seller_csv_uploads ADD COLUMN IF NOT EXISTS size_bytes BIGINT",
+    "ALTER TABLE validation_jobs ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMPTZ",
+    "ALTER TABLE validation_jobs ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0",
+]
+
+
+def upgrade_schema():
+    with engine.begin() as conn:
+        for statement in SCHEMA_UPGRADES:
+            conn.execute(text(statement))
+
 
 def init_db():
     Base.metadata.create_all(bind=engine)
+    upgrade_schema()
@@ -1,4 +1,4 @@
-from sqlalchemy import (Column,BigInteger,String,DateTime,func, UniqueConstraint,ForeignKey)
+from sqlalchemy import (Column,BigInteger,Integer,String,Text,DateTime,func, UniqueConstraint,ForeignKey,Index)
 from sqlalchemy.dialects.postgresql import JSONB
 from source.db.base import Base 
 
@@ -29,6 +29,12 @@ class MarketplaceTemplate(Base):
         unique=True
     )
 
+    # Template JSON; NULL only for rows created before it was stored here
+    content = Column(
+        JSONB,
+        nullable=True
+    )
+
     created_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -62,8 +68,23 @@ class SellerCsvUpload(Base):
         nullable=False
     )
 
+    # Computed once while the upload is stored; NULL for uploads made before
+    headers = Column(JSONB, nullable=True)
+
+    row_count = Column(BigInteger, nullable=True)
+
+    sample_rows = Column(JSONB, nullable=True)
+
+    # Stored (possibly compressed) size
+    size_bytes = Column(BigInteger, nullable=True)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # Latest upload per seller
+        Index("ix_seller_csv_uploads_seller_created", seller_id, created_at.desc()),
+    )
+
 class SellerTemplateMapping(Base):
     __tablename__ = "seller_template_mappings"
 
@@ -85,6 +106,9 @@ class SellerTemplateMapping(Base):
         nullable=False
     )
 
+    # Mapping JSON; NULL only for rows created before it was stored here
+    content = Column(JSONB, nullable=True)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (
@@ -93,6 +117,7 @@ class SellerTemplateMapping(Base):
             "template_id",
             name="uq_seller_template_mapping"
         ),
+        Index("ix_seller_template_mappings_seller_mapping_file", "seller_id", "mapping_file_id"),
     )
     
 class Files(Base):
@@ -109,10 +134,11 @@ class Files(Base):
         nullable=False
     )
 
+    # Rows with the same content share one StoredBlob path
     file_path = Column(
         String(1024),
         nullable=False,
-        unique=True
+        index=True
     )
 
     file_type = Column(
@@ -120,8 +146,150 @@ class Files(Base):
         nullable=False
     )
 
+    # Hex sha256 of the stored bytes (the StoredBlob key); NULL for files
+    # stored before it was recorded
+    content_sha256 = Column(
+        String(64),
+        nullable=True
+    )
+
     created_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False
-    )
\ No newline at end of file
+    )
+
+
+class StoredBlob(Base):
+    """One content-addressed file on disk, shared by every Files row with its sha256."""
+
+    __tablename__ = "stored_blobs"
+
+    sha256 = Column(String(64), primary_key=True)
+
+    file_path = Column(String(1024), nullable=False)
+
+    size_bytes = Column(BigInteger, nullable=False)
+
+    # Files rows referencing the blob; the file is removed when it drops to 0
+    ref_count = Column(BigInteger, nullable=False, default=0)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class UploadSession(Base):
+    """Resumable CSV upload; chunks are kept on disk until it is finalized."""
+
+    __tablename__ = "upload_sessions"
+
+    # uuid4 hex, also the chunk directory name
+    id = Column(String(32), primary_key=True)
+
+    seller_id = Column(String, nullable=False, index=True)
+
+    file_name = Column(String(255), nullable=False)
+
+    chunk_count = Column(BigInteger, nullable=False)
+
+    status = Column(String(20), nullable=False, default="open")
+
+    # Set once finalized
+    csv_upload_id = Column(BigInteger, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class UploadChunk(Base):
+    __tablename__ = "upload_chunks"
+
+    upload_id = Column(
+        String(32),
+        ForeignKey("upload_sessions.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    chunk_index = Column(BigInteger, primary_key=True)
+
+    size_bytes = Column(BigInteger, nullable=False)
+
+    sha256 = Column(String(64), nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class ValidationJob(Base):
+    __tablename__ = "validation_jobs"
+
+    id = Column(BigInteger, primary_key=True)
+
+    seller_id = Column(String, nullable=False, index=True)
+
+    mapping_file_id = Column(BigInteger, nullable=False)
+
+    # Upload chosen at submit, so a later re-upload does not change what the job validates
+    csv_upload_id = Column(BigInteger, nullable=False)
+
+    engine = Column(String(20), nullable=False)
+
+    status = Column(String(20), nullable=False, default="queued")
+
+    rows_processed = Column(BigInteger, nullable=False, default=0)
+
+    result = Column(JSONB, nullable=True)
+
+    error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    started_at = Column(DateTime(timezone=True), nullable=True)
+
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_validation_jobs_status_created", "status", "created_at"),
+    )
+
+
+class ValidationResult(Base):
+    __tablename__ = "validation_results"
+
+    id = Column(BigInteger, primary_key=True)
+
+    csv_sha256 = Column(String(64), nullable=False)
+
+    mapping_sha256 = Column(String(64), nullable=False)
+
+    template_sha256 = Column(String(64), nullable=False)
+
+    engine_version = Column(String(20), nullable=False)
+
+    # Request options that change results (unique tracking)
+    options = Column(String(40), nullable=False)
+
+    # {"total", "valid", "errors"} with failing rows only
+    result = Column(JSONB, nullable=False)
+
+    size_bytes = Column(BigInteger, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "csv_sha256",
+            "mapping_sha256",
+            "template_sha256",
+            "engine_version",
+            "options",
+            name="uq_validation_result_key"
+        ),
+        # Least recently used results are evicted first
+        Index("ix_validation_results_last_used", "last_used_at"),
+    )
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import logging
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from source.constants.constants import RESULT_CACHE_MAX_BYTES, VALIDATION_ENGINE_VERSION
+from source.db.model import Files, ValidationResult
+from source.utility.fileHelper import file_sha256
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(obj) -> str:
+    """sha256 of canonical JSON, so equal content hashes equally however it was stored."""
+    canonical = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def result_key(csv_sha256: str, mapping: dict, template_fields: dict, options: str) -> dict:
+    return {
+        "csv_sha256": csv_sha256,
+        "mapping_sha256": content_hash(mapping),
+        "template_sha256": content_hash(template_fields),
+        "engine_version": VALIDATION_ENGINE_VERSION,
+        "options": options
+    }
+
+
+def ensure_csv_sha256(db: Session, csv_path: str, csv_sha256: str = None) -> str:
+    """Hash recorded at upload; files stored before that are hashed once and recorded."""
+    if csv_sha256:
+        return csv_sha256
+
+    csv_sha256 = file_sha256(csv_path)
+    db.query(Files).filter(Files.file_path == str(csv_path)).update(
+        {Files.content_sha256: csv_sha256}, synchronize_session=False
+    )
+    db.commit()
+    logger.info(f"CSV content hash recorded | path={csv_path}")
+    return csv_sha256
+
+
+def load_result(db: Session, key: dict):
+    """Stored compact result for `key`, or None. Marks it as recently used."""
+    record = db.query(ValidationResult).filter_by(**key).first()
+    if record is None:
+        return None
+
+    result = record.result
+    record.last_used_at = func.now()
+    db.commit()
+    return result
+
+
+def save_result(db: Session, key: dict, result: dict, max_bytes: int = RESULT_CACHE_MAX_BYTES):
+    """Stores (or replaces) the compact result for `key`, then evicts down to `max_bytes`."""
+    size = len(json.dumps(result, default=str))
+    if size > max_bytes:
+        logger.info(f"Validation result too large to store | size_bytes={size}")
+        return
+
+    stmt = insert(ValidationResult).values(**key, result=result, size_bytes=size)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_validation_result_key",
+        set_={
+            "result": stmt.excluded.result,
+            "size_bytes": stmt.excluded.size_bytes,
+            "created_at": func.now(),
+            "last_used_at": func.now()
+        }
+    )
+    db.execute(stmt)
+    evicted = evict_results(db, max_bytes)
+    db.commit()
+
+    logger.info(f"Validation result stored | size_bytes={size} | evicted={evicted}")
+
+
+def evict_results(db: Session, max_bytes: int = RESULT_CACHE_MAX_BYTES) -> int:
+    """Deletes least recently used results beyond a total of `max_bytes`."""
+    running = select(
+        ValidationResult.id,
+        func.sum(ValidationResult.size_bytes).over(
+            order_by=(ValidationResult.last_used_at.desc(), ValidationResult.id.desc())
+        ).label("running_bytes")
+    ).subquery()
+
+    return (
+        db.query(ValidationResult)
+        .filter(ValidationResult.id.in_(
+            select(running.c.id).where(running.c.running_bytes > max_bytes)
+        ))
+        .delete(synchronize_session=False)
+    )
+
+
+def compact_result(results: list) -> dict:
+    """Summary and failing rows; valid rows are implied by "total"."""
+    return {
+        "total": len(results),
+        "valid": sum(r["valid"] for r in results),
+        "errors": [r for r in results if not r["valid"]]
+    }
+
+
+def expand_result(compact: dict) -> list:
+    """Per-row results of a compact result, as a validation run returns them."""
+    failing = {r["row"]: r for r in compact["errors"]}
+    return [
+        failing.get(row) or {"row": row, "valid": True, "errors": {}}
+        for row in range(1, compact["total"] + 1)
+    ]
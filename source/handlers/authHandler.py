@@ -5,6 +5,7 @@ import jwt
 from datetime import datetime, timezone, timedelta
 
 from source.constants.constants import SECRET_KEY, ALGORITHM
+from source.utility.cache import token_cache
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +26,18 @@ def createJWTToken(userId: int):
 
 
 def verify_token(token: str):
+    # Repeat requests with the same bearer token skip signature verification
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached
+
     try:
         decoded_data = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        logger.debug(f"JWT token verified successfully for sub={decoded_data.get('sub')}")
+        logger.debug("JWT token verified successfully for sub=%s", decoded_data.get("sub"))
+
+        # Tokens without exp are never cached: there is no safe expiry
+        if "exp" in decoded_data:
+            token_cache.put(token, decoded_data, decoded_data["exp"])
         return decoded_data
 
     except jwt.ExpiredSignatureError:
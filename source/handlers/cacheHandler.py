@@ -0,0 +1,11 @@
+import logging
+
+from source.utility.cache import cache_stats
+
+logger = logging.getLogger(__name__)
+
+
+def get_cache_stats():
+    stats = cache_stats()
+    logger.debug(f"Cache stats requested | stats={stats}")
+    return {"caches": stats}
@@ -1,18 +1,101 @@
 import logging
-import csv
-import uuid
-from pathlib import Path
+import os
+from typing import BinaryIO
 
 from fastapi import UploadFile, File, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from source.constants.constants import ENCODING, SAMPLE_ROW_COUNT, UPLOAD_DIR
+from source.constants.constants import (
+    SAMPLE_ROW_COUNT,
+    UPLOAD_CHUNK_SIZE,
+    CSV_FILE_SUFFIXES,
+    ROWS_PAGE_SIZE,
+    ROWS_PAGE_MAX,
+)
 from source.db.session import SessionLocal
 from source.db.model import Files, SellerCsvUpload
+from source.db.blobStore import BlobWriter, acquire_blob, release_blob
+from source.utility.rowIndex import RowIndexBuilder, save_row_index, read_rows
+from source.utility.fileHelper import (
+    MultiSink,
+    open_tee_text,
+    scan_csv_stream,
+    UnsupportedCompression,
+    DECOMPRESSION_ERRORS,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def is_csv_file_name(file_name: str) -> bool:
+    return file_name.lower().endswith(CSV_FILE_SUFFIXES)
+
+
+def store_csv_upload(db: Session, seller_id: str, file_name: str, source: BinaryIO) -> dict:
+    """
+    Stores the CSV read from `source` as a blob and adds its Files and
+    SellerCsvUpload rows, with the headers, row count, sample rows and size
+    found in the same pass, to the caller's transaction (not committed).
+    A row offset index is written beside plain CSVs. Returns the upload
+    response.
+    """
+    # Single pass: chunks are written to the blob store and hashed as the CSV parser pulls them
+    row_index = RowIndexBuilder()
+    with BlobWriter() as blob_writer:
+        try:
+            stream = open_tee_text(source, MultiSink(blob_writer, row_index), UPLOAD_CHUNK_SIZE)
+            headers, row_count, sample_rows = scan_csv_stream(stream, SAMPLE_ROW_COUNT)
+        except UnsupportedCompression as e:
+            raise HTTPException(400, str(e))
+        except DECOMPRESSION_ERRORS:
+            raise HTTPException(400, "Compressed file is corrupt or truncated")
+        acquire_blob(db, blob_writer.seal())
+        blob = blob_writer.commit()
+
+    offsets = row_index.finish(row_count)
+    if offsets is not None:
+        try:
+            save_row_index(blob.path, offsets)
+        except OSError:
+            # Row reads fall back to streaming the CSV
+            logger.exception(f"Storing row index failed | path={blob.path}")
+    logger.info(f"CSV file saved | path={blob.path} | new_blob={blob.created}")
+
+    logger.info(
+        f"CSV parsed successfully | rows={row_count} | headers={len(headers)}"
+    )
+
+    db_file = Files(
+        file_name=file_name,
+        file_path=blob.path,
+        file_type="csv",
+        content_sha256=blob.sha256
+    )
+    db.add(db_file)
+    db.flush()
+
+    # Persisted so upload details and validation never re-read the file for them
+    csv_upload = SellerCsvUpload(
+        seller_id=seller_id,
+        csv_file_id=db_file.id,
+        headers=headers,
+        row_count=row_count,
+        sample_rows=sample_rows,
+        size_bytes=blob.size
+    )
+    db.add(csv_upload)
+    db.flush()
+
+    # Read the generated ids before commit expires the instances
+    return {
+        "csvUploadId": csv_upload.id,
+        "fileId": db_file.id,
+        "headers": headers,
+        "rowCount": row_count,
+        "sampleRows": sample_rows
+    }
+
+
 def uploadfile(
     seller_id: str = Query(...),
     file: UploadFile = File(...)
@@ -23,72 +106,151 @@ def uploadfile(
 
     db: Session = SessionLocal()
     try:
-        if Path(file.filename).suffix.lower() != ".csv":
+        if not is_csv_file_name(file.filename):
             logger.warning(
                 f"Invalid file type uploaded | seller_id={seller_id} | filename={file.filename}"
             )
-            raise HTTPException(400, "Only CSV files allowed")
+            raise HTTPException(400, "Only CSV files (.csv, .csv.gz, .csv.zst) allowed")
 
-        upload_uuid = str(uuid.uuid4())
-        file_path = UPLOAD_DIR / f"{upload_uuid}.csv"
+        response = store_csv_upload(db, seller_id, file.filename, file.file)
+        db.commit()
 
-        with open(file_path, "wb") as f:
-            f.write(file.file.read())
+        logger.info(
+            f"Seller CSV upload created | csv_upload_id={response['csvUploadId']} | "
+            f"file_id={response['fileId']} | seller_id={seller_id}"
+        )
 
-        logger.info(f"CSV file saved | path={file_path}")
+        return response
 
-        with open(file_path, newline="", encoding=ENCODING) as f:
-            reader = csv.DictReader(f)
-            headers = reader.fieldnames or []
-            row_count = 0
-            sample_rows = []
+    except Exception:
+        logger.exception(
+            f"CSV upload failed | seller_id={seller_id} | filename={file.filename}"
+        )
+        raise
 
-            for row in reader:
-                row_count += 1
-                if len(sample_rows) < SAMPLE_ROW_COUNT:
-                    sample_rows.append(row)
+    finally:
+        db.close()
+        logger.debug("Database session closed for CSV upload")
 
-        logger.info(
-            f"CSV parsed successfully | rows={row_count} | headers={len(headers)}"
-        )
 
-        db_file = Files(
-            file_name=file.filename,
-            file_path=str(file_path),
-            file_type="csv"
+def _find_upload(db: Session, csv_upload_id: int, seller_id: str):
+    record = (
+        db.query(SellerCsvUpload, Files)
+        .join(Files, Files.id == SellerCsvUpload.csv_file_id)
+        .filter(
+            SellerCsvUpload.id == csv_upload_id,
+            SellerCsvUpload.seller_id == seller_id
         )
-        db.add(db_file)
-        db.commit()
-        db.refresh(db_file)
+        .first()
+    )
+    if not record:
+        logger.warning(
+            f"CSV upload not found | csv_upload_id={csv_upload_id} | seller_id={seller_id}"
+        )
+        raise HTTPException(404, "CSV upload not found")
+    return record
 
-        logger.info(f"File record created | file_id={db_file.id}")
 
-        csv_upload = SellerCsvUpload(
-            seller_id=seller_id,
-            csv_file_id=db_file.id
+def get_upload_details(
+    csv_upload_id: int,
+    seller_id: str = Query(...)
+):
+    db: Session = SessionLocal()
+    try:
+        csv_upload, db_file = _find_upload(db, csv_upload_id, seller_id)
+
+        return {
+            "csvUploadId": csv_upload.id,
+            "fileId": db_file.id,
+            "fileName": db_file.file_name,
+            "headers": csv_upload.headers,
+            "rowCount": csv_upload.row_count,
+            "sampleRows": csv_upload.sample_rows,
+            "sizeBytes": csv_upload.size_bytes,
+            "contentSha256": db_file.content_sha256,
+            "createdAt": csv_upload.created_at
+        }
+
+    finally:
+        db.close()
+
+
+def delete_upload(
+    csv_upload_id: int,
+    seller_id: str = Query(...)
+):
+    db: Session = SessionLocal()
+    try:
+        csv_upload, db_file = _find_upload(db, csv_upload_id, seller_id)
+        file_id = db_file.id
+
+        db.delete(csv_upload)
+        db.delete(db_file)
+        # Files stored before content addressing hold no blob reference, even once hashed
+        blob_removed = bool(db_file.content_sha256) and release_blob(
+            db, db_file.content_sha256, db_file.file_path
         )
-        db.add(csv_upload)
         db.commit()
-        db.refresh(csv_upload)
 
         logger.info(
-            f"Seller CSV upload created | csv_upload_id={csv_upload.id} | seller_id={seller_id}"
+            f"Seller CSV upload deleted | csv_upload_id={csv_upload_id} | file_id={file_id} | "
+            f"seller_id={seller_id} | blob_removed={blob_removed}"
         )
 
         return {
-            "csvUploadId": csv_upload.id,
-            "fileId": db_file.id,
-            "headers": headers,
-            "rowCount": row_count,
-            "sampleRows": sample_rows
+            "csvUploadId": csv_upload_id,
+            "fileId": file_id,
+            "blobRemoved": blob_removed
         }
 
     except Exception:
-        logger.exception(
-            f"CSV upload failed | seller_id={seller_id} | filename={file.filename}"
-        )
+        db.rollback()
+        logger.exception(f"CSV upload delete failed | csv_upload_id={csv_upload_id}")
         raise
 
     finally:
         db.close()
-        logger.debug("Database session closed for CSV upload")
+
+
+def get_upload_rows(
+    csv_upload_id: int,
+    seller_id: str = Query(...),
+    start: int = Query(1),
+    limit: int = Query(ROWS_PAGE_SIZE)
+):
+    if start < 1:
+        raise HTTPException(400, "start must be at least 1")
+    if not 1 <= limit <= ROWS_PAGE_MAX:
+        raise HTTPException(400, f"limit must be between 1 and {ROWS_PAGE_MAX}")
+
+    db: Session = SessionLocal()
+    try:
+        csv_upload, db_file = _find_upload(db, csv_upload_id, seller_id)
+        row_count = csv_upload.row_count
+        file_path = db_file.file_path
+    finally:
+        db.close()
+
+    if not os.path.exists(file_path):
+        logger.error(f"CSV file missing on disk | path={file_path}")
+        raise HTTPException(500, "CSV file missing")
+
+    header, records, indexed_rows = read_rows(file_path, start, limit)
+    if row_count is None:
+        row_count = indexed_rows
+
+    end = start + len(records)
+    has_more = len(records) == limit and (row_count is None or end <= row_count)
+
+    return {
+        "csvUploadId": csv_upload_id,
+        "start": start,
+        "limit": limit,
+        "rowCount": row_count,
+        "headers": header,
+        "rows": [
+            {"row": row, "values": dict(zip(header, record))}
+            for row, record in enumerate(records, start=start)
+        ],
+        "nextStart": end if has_more else None
+    }
@@ -0,0 +1,152 @@
+import logging
+from datetime import datetime, timezone
+from typing import Literal
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from source.constants.constants import JOB_PROGRESS_EVERY
+from source.db.session import SessionLocal
+from source.handlers.mappingHandler import load_validation_inputs, latest_csv_upload_id
+from source.jobs.jobQueue import get_job_queue, JOB_SUCCEEDED, JOB_FAILED
+from source.jobs.worker import notify_job_workers
+from source.utility.uniqueTracker import UniqueTrackers
+from source.utility.verdictCache import VerdictCaches
+from source.utility.validationHelper import iter_validate_file
+
+logger = logging.getLogger(__name__)
+
+
+def submit_validation_job(
+    seller_id: str,
+    mapping_file_id: int,
+    engine: Literal["compiled", "columnar", "parallel"] = "compiled"
+):
+    # The job validates the upload that is latest now, whatever is uploaded before it runs
+    db: Session = SessionLocal()
+    try:
+        csv_upload_id = latest_csv_upload_id(db, seller_id)
+    finally:
+        db.close()
+
+    if csv_upload_id is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "No CSV uploaded for seller")
+
+    job = get_job_queue().enqueue(seller_id, mapping_file_id, engine, csv_upload_id)
+    notify_job_workers()
+
+    logger.info(
+        f"Validation job queued | job_id={job['id']} | seller_id={seller_id} | "
+        f"mapping_file_id={mapping_file_id} | csv_upload_id={csv_upload_id}"
+    )
+
+    return {
+        "job_id": job["id"],
+        "csv_upload_id": csv_upload_id,
+        "status": job["status"]
+    }
+
+
+def _get_job(job_id: int) -> dict:
+    job = get_job_queue().get(job_id)
+    if not job:
+        logger.warning(f"Validation job not found | job_id={job_id}")
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Job not found")
+    return job
+
+
+def _throughput(job: dict) -> float:
+    if not job["started_at"]:
+        return 0.0
+    end = job["finished_at"] or datetime.now(timezone.utc)
+    elapsed = (end - job["started_at"]).total_seconds()
+    if elapsed <= 0:
+        return 0.0
+    return round(job["rows_processed"] / elapsed, 1)
+
+
+def get_validation_job(job_id: int):
+    job = _get_job(job_id)
+
+    return {
+        "job_id": job["id"],
+        "seller_id": job["seller_id"],
+        "mapping_file_id": job["mapping_file_id"],
+        "csv_upload_id": job["csv_upload_id"],
+        "engine": job["engine"],
+        "status": job["status"],
+        "rows_processed": job["rows_processed"],
+        "rows_per_second": _throughput(job),
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+        "attempts": job["attempts"],
+        "error": job["error"]
+    }
+
+
+def get_validation_job_result(job_id: int):
+    job = _get_job(job_id)
+
+    if job["status"] == JOB_FAILED:
+        raise HTTPException(status.HTTP_409_CONFLICT, f"Job failed: {job['error']}")
+
+    if job["status"] != JOB_SUCCEEDED:
+        raise HTTPException(status.HTTP_409_CONFLICT, f"Job is {job['status']}")
+
+    return job["result"]
+
+
+def run_validation_job(job: dict, report_progress):
+    seller_id = job["seller_id"]
+    mapping_file_id = job["mapping_file_id"]
+
+    db: Session = SessionLocal()
+    try:
+        mapping_json, template_fields, csv_path, plan_key, _, csv_rows = load_validation_inputs(
+            db, seller_id, mapping_file_id, job["csv_upload_id"]
+        )
+    finally:
+        db.close()
+
+    unique_seen = UniqueTrackers()
+    verdicts = VerdictCaches()
+
+    try:
+        results = iter_validate_file(
+            csv_path, mapping_json, template_fields, job["engine"], plan_key, unique_seen, verdicts,
+            row_count=csv_rows
+        )
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except KeyError as e:
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Template configuration error: missing {e}"
+        )
+
+    total = 0
+    valid = 0
+    errors = []
+
+    for result in results:
+        total += 1
+        if result["valid"]:
+            valid += 1
+        else:
+            errors.append(result)
+
+        if total % JOB_PROGRESS_EVERY == 0:
+            report_progress(total)
+
+    # Only failing rows are kept; valid rows are implied by "total"
+    return total, {
+        "seller_id": seller_id,
+        "mapping_file_id": mapping_file_id,
+        "csv_upload_id": job["csv_upload_id"],
+        "total": total,
+        "valid": valid,
+        "unique_memory_bytes": unique_seen.memory(),
+        "column_cache": verdicts.stats(),
+        "errors": errors
+    }
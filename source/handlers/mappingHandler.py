@@ -1,11 +1,13 @@
 import logging
 import json
 import os
-import uuid
 from pathlib import Path
+from typing import Literal, Optional
 
 from fastapi import HTTPException, Query, UploadFile, File, status
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session, aliased
 
 from source.model.mapper.mapping_request import MappingRequest
 from source.db.model import (
@@ -15,9 +17,34 @@ from source.db.model import (
     Files,
 )
 from source.db.session import SessionLocal
-from source.utility.fileHelper import load_json_file, read_csv_rows
-from source.utility.validationHelper import validate_csv
-from source.constants.constants import MAPPING_UPLOAD_DIR, ENCODING
+from source.db.blobStore import store_blob
+from source.utility.fileHelper import load_json_file, read_csv_rows, iter_csv_records
+from source.utility.validationHelper import validate_csv, iter_validate_file, error_limit, rows_after, ErrorLimit
+from source.utility.columnarValidation import columnar_available
+from source.utility.previewValidation import preview_file
+from source.utility.errorReport import iter_report, gzip_chunks
+from source.utility.validationPlan import normalize_mapping, required_fields_of, check_required_columns
+from source.utility.incrementalValidation import RowVerdicts, store_path
+from source.db.resultStore import (
+    result_key,
+    ensure_csv_sha256,
+    load_result,
+    save_result,
+    compact_result,
+    expand_result,
+)
+from source.utility.cache import json_cache, invalidate_json_files
+from source.utility.uniqueTracker import UniqueTrackers, DIGEST_TRACKERS, check_tracker_options
+from source.utility.verdictCache import VerdictCaches
+from source.constants.constants import (
+    ENCODING,
+    NDJSON_BATCH_ROWS,
+    PREVIEW_HEAD_ROWS,
+    PREVIEW_SAMPLE_ROWS,
+    PREVIEW_ROWS_MAX,
+    PREVIEW_SAMPLE_MAX,
+    VALIDATION_IN_MEMORY_MAX_ROWS,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,13 +76,10 @@ def mapper(
                 detail="Template not found"
             )
 
-        upload_uuid = str(uuid.uuid4())
-        file_path = MAPPING_UPLOAD_DIR / f"{upload_uuid}{file_ext}"
-
         content = file.file.read()
 
         try:
-            json.loads(content.decode(ENCODING))
+            mapping_content = json.loads(content.decode(ENCODING))
         except Exception:
             logger.warning("Invalid JSON mapping file uploaded")
             raise HTTPException(
@@ -63,38 +87,44 @@ def mapper(
                 detail="Invalid JSON mapping file"
             )
 
-        with open(file_path, "wb") as f:
-            f.write(content)
+        blob = store_blob(db, content)
 
-        logger.info(f"Mapping file saved to disk | path={file_path}")
+        logger.info(f"Mapping file saved to disk | path={blob.path} | new_blob={blob.created}")
 
         db_file = Files(
             file_name=file.filename,
-            file_path=str(file_path),
-            file_type="json"
+            file_path=blob.path,
+            file_type="json",
+            content_sha256=blob.sha256
         )
         db.add(db_file)
-        db.commit()
-        db.refresh(db_file)
-
-        logger.info(f"Mapping file DB record created | file_id={db_file.id}")
+        db.flush()
+
+        # Older mapping files of this seller and template are superseded
+        previous_file_ids = [
+            file_id for (file_id,) in (
+                db.query(SellerTemplateMapping.mapping_file_id)
+                .filter(
+                    SellerTemplateMapping.seller_id == seller_id,
+                    SellerTemplateMapping.template_id == template.id
+                )
+                .all()
+            )
+        ]
 
         mapping = SellerTemplateMapping(
             seller_id=seller_id,
             marketplace=template.template_name,
             template_id=template.id,
-            mapping_file_id=db_file.id
+            mapping_file_id=db_file.id,
+            content=mapping_content
         )
 
         db.add(mapping)
-        db.commit()
-        db.refresh(mapping)
+        db.flush()
 
-        logger.info(
-            f"Seller template mapping created | mapping_id={mapping.id} | seller_id={seller_id}"
-        )
-
-        return {
+        # Read the generated ids before commit expires the instances
+        response = {
             "status": "success",
             "mapping_id": mapping.id,
             "mapping_file_id": db_file.id,
@@ -102,6 +132,16 @@ def mapper(
             "marketplace": template.template_name
         }
 
+        db.commit()
+        invalidate_json_files(previous_file_ids)
+
+        logger.info(
+            f"Seller template mapping created | mapping_id={response['mapping_id']} | "
+            f"mapping_file_id={response['mapping_file_id']} | seller_id={seller_id}"
+        )
+
+        return response
+
     except HTTPException:
         db.rollback()
         raise
@@ -114,6 +154,26 @@ def mapper(
         logger.debug("DB session closed for mapping upload")
 
 
+def _read_mapping_file(file: Files):
+    file_path = Path(file.file_path)
+
+    if not file_path.exists():
+        logger.error(f"Mapping file missing on disk | file={file.file_name}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Mapping file missing on disk: {file.file_name}"
+        )
+
+    try:
+        return load_cached_json(file)
+    except Exception:
+        logger.exception(f"Failed to read mapping file | file={file.file_name}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to read mapping file: {file.file_name}"
+        )
+
+
 def get_mappings_by_seller(seller_id: str = Query(...)):
     logger.info(f"Fetching mappings for seller | seller_id={seller_id}")
 
@@ -136,24 +196,9 @@ def get_mappings_by_seller(seller_id: str = Query(...)):
         response = []
 
         for mapping, file in results:
-            file_path = Path(file.file_path)
-
-            if not file_path.exists():
-                logger.error(f"Mapping file missing on disk | file={file.file_name}")
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Mapping file missing on disk: {file.file_name}"
-                )
-
-            try:
-                with open(file_path, "r", encoding=ENCODING) as f:
-                    mapping_json = json.load(f)
-            except Exception:
-                logger.exception(f"Failed to read mapping file | file={file.file_name}")
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Failed to read mapping file: {file.file_name}"
-                )
+            mapping_json = mapping.content
+            if mapping_json is None:
+                mapping_json = _read_mapping_file(file)
 
             response.append({
                 "mapping_id": mapping.id,
@@ -189,18 +234,20 @@ def get_mapping_by_id(id: int):
             logger.warning(f"Mapping not found | mapping_id={id}")
             raise HTTPException(status_code=404, detail="Mapping not found")
 
-        file = (
-            db.query(Files)
-            .filter(Files.id == mapping_record.mapping_file_id)
-            .first()
-        )
+        mapping_content = mapping_record.content
+
+        if mapping_content is None:
+            file = (
+                db.query(Files)
+                .filter(Files.id == mapping_record.mapping_file_id)
+                .first()
+            )
 
-        if not file or not os.path.exists(file.file_path):
-            logger.error(f"Mapping file missing | mapping_id={id}")
-            raise HTTPException(status_code=404, detail="Mapping file not found")
+            if not file or not os.path.exists(file.file_path):
+                logger.error(f"Mapping file missing | mapping_id={id}")
+                raise HTTPException(status_code=404, detail="Mapping file not found")
 
-        with open(file.file_path, "r", encoding=ENCODING) as f:
-            mapping_content = json.load(f)
+            mapping_content = load_cached_json(file)
 
         logger.info(f"Mapping fetched successfully | mapping_id={id}")
 
@@ -219,72 +266,367 @@ def get_mapping_by_id(id: int):
         db.close()
         logger.debug("DB session closed for get_mapping_by_id")
 
-def validate_file(seller_id: str, mapping_file_id: int):
+def _ndjson_line(obj) -> str:
+    return json.dumps(obj, default=str) + "\n"
+
+
+def _ndjson_validation_stream(
+    seller_id, mapping_file_id, results, unique_seen, verdicts, limit, has_more, row_verdicts
+):
+    total = 0
+    valid = 0
+    batch = []
+
+    try:
+        for result in limit.apply(results, has_more):
+            total += 1
+            valid += result["valid"]
+            batch.append(_ndjson_line(result))
+
+            if len(batch) >= NDJSON_BATCH_ROWS:
+                yield "".join(batch)
+                batch = []
+
+    except Exception:
+        logger.exception("Unexpected CSV validation error while streaming")
+        batch.append(_ndjson_line({"error": "Internal validation error"}))
+
     logger.info(
-        f"CSV validation started | seller_id={seller_id} | mapping_file_id={mapping_file_id}"
+        f"CSV validation stream completed | seller_id={seller_id} | total={total} | valid={valid} | "
+        f"truncated={limit.truncated}"
     )
 
-    db: Session = SessionLocal()
-    try:
-        mapping = (
-            db.query(SellerTemplateMapping)
-            .filter(
-                SellerTemplateMapping.seller_id == seller_id,
-                SellerTemplateMapping.mapping_file_id == mapping_file_id
-            )
-            .first()
-        )
+    summary = {
+        "seller_id": seller_id,
+        "mapping_file_id": mapping_file_id,
+        "total": total,
+        "valid": valid,
+        **limit.summary(),
+        "unique_memory_bytes": unique_seen.memory(),
+        "column_cache": verdicts.stats()
+    }
+    if row_verdicts is not None:
+        summary["incremental"] = row_verdicts.stats()
+
+    batch.append(_ndjson_line({"summary": summary}))
+    yield "".join(batch)
+
+
+def stream_validation(
+    seller_id,
+    mapping_file_id,
+    csv_path,
+    mapping_json,
+    template_fields,
+    engine="compiled",
+    plan_key=None,
+    unique_seen=None,
+    verdicts=None,
+    limit=None,
+    row_verdicts=None,
+    row_count=None
+):
+    if unique_seen is None:
+        unique_seen = UniqueTrackers()
+    if verdicts is None:
+        verdicts = VerdictCaches()
+    if limit is None:
+        limit = ErrorLimit()
+
+    # Header problems must surface as a 400 before the response starts
+    results = iter_validate_file(
+        csv_path, mapping_json, template_fields, engine, plan_key, unique_seen, verdicts, row_verdicts,
+        row_count
+    )
+
+    return StreamingResponse(
+        _ndjson_validation_stream(
+            seller_id,
+            mapping_file_id,
+            results,
+            unique_seen,
+            verdicts,
+            limit,
+            rows_after(csv_path, row_count),
+            row_verdicts
+        ),
+        media_type="application/x-ndjson"
+    )
 
-        if not mapping:
-            raise HTTPException(status.HTTP_404_NOT_FOUND, "Seller mapping not found")
 
-        mapping_file = db.query(Files).get(mapping.mapping_file_id)
-        if not mapping_file:
-            raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Mapping file missing")
+def load_cached_json(file: Files):
+    """Parsed JSON of a stored file, cached by Files.id (stored files never change)."""
+    return json_cache.get_or_load(file.id, lambda: load_json_file(file.file_path))
 
-        mapping_json = load_json_file(mapping_file.file_path).get("mapping")
-        if not mapping_json:
-            raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid mapping file")
 
-        template = db.query(MarketplaceTemplate).get(mapping.template_id)
-        if not template:
-            raise HTTPException(status.HTTP_404_NOT_FOUND, "Template not found")
+def load_stored_json(db: Session, content, file_id: int, missing_detail: str):
+    """JSON content column, falling back to the file for rows not yet backfilled."""
+    if content is not None:
+        return content
 
-        template_file = db.query(Files).get(template.file_id)
-        if not template_file:
-            raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Template file missing")
+    file = db.query(Files).get(file_id)
+    if not file:
+        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, missing_detail)
+    return load_cached_json(file)
 
-        template_json = load_json_file(template_file.file_path)
-        template_fields = template_json.get("fields")
-        if not template_fields:
-            raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid template file")
 
-        csv_upload = (
-            db.query(SellerCsvUpload)
-            .filter(SellerCsvUpload.seller_id == seller_id)
+def latest_csv_upload_id(db: Session, seller_id: str):
+    """Id of the seller's latest CSV upload, or None."""
+    return (
+        db.query(SellerCsvUpload.id)
+        .filter(SellerCsvUpload.seller_id == seller_id)
+        .order_by(SellerCsvUpload.created_at.desc())
+        .limit(1)
+        .scalar()
+    )
+
+
+def fetch_validation_records(db: Session, seller_id: str, mapping_file_id: int, csv_upload_id: int = None):
+    """
+    Mapping, its template and a CSV upload of the seller in one query: the
+    one with `csv_upload_id`, or the seller's latest. Returns (mapping,
+    template, csv_upload, csv_file_path, csv_sha256) or None.
+    """
+    if csv_upload_id is None:
+        csv_upload_id = (
+            select(SellerCsvUpload.id)
+            .where(SellerCsvUpload.seller_id == SellerTemplateMapping.seller_id)
             .order_by(SellerCsvUpload.created_at.desc())
-            .first()
+            .limit(1)
+            .correlate(SellerTemplateMapping)
+            .scalar_subquery()
+        )
+    csv_upload = aliased(SellerCsvUpload)
+    csv_file = aliased(Files)
+
+    return (
+        db.query(
+            SellerTemplateMapping,
+            MarketplaceTemplate,
+            csv_upload,
+            csv_file.file_path,
+            csv_file.content_sha256
         )
+        .outerjoin(MarketplaceTemplate, MarketplaceTemplate.id == SellerTemplateMapping.template_id)
+        .outerjoin(
+            csv_upload,
+            and_(csv_upload.id == csv_upload_id, csv_upload.seller_id == SellerTemplateMapping.seller_id)
+        )
+        .outerjoin(csv_file, csv_file.id == csv_upload.csv_file_id)
+        .filter(
+            SellerTemplateMapping.seller_id == seller_id,
+            SellerTemplateMapping.mapping_file_id == mapping_file_id
+        )
+        .first()
+    )
 
-        if not csv_upload:
-            raise HTTPException(status.HTTP_404_NOT_FOUND, "No CSV uploaded for seller")
 
-        csv_file = db.query(Files).get(csv_upload.csv_file_id)
-        if not csv_file:
-            raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "CSV file missing")
+def load_validation_inputs(db: Session, seller_id: str, mapping_file_id: int, csv_upload_id: int = None):
+    """
+    Returns (mapping, template_fields, csv_path, plan_key, csv_sha256,
+    csv_rows) for the upload with `csv_upload_id`, or the seller's latest.
+    csv_rows is the row count recorded at upload, None for uploads made
+    before it was recorded. Required columns are checked against the
+    recorded headers without opening the CSV.
+    """
+    record = fetch_validation_records(db, seller_id, mapping_file_id, csv_upload_id)
 
-        rows = read_csv_rows(csv_file.file_path)
-        rows = [
-            {k: "" if v is None else str(v).strip() for k, v in row.items()}
-            for row in rows
-        ]
+    if not record:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Seller mapping not found")
 
+    mapping, template, csv_upload, csv_path, csv_sha256 = record
+
+    mapping_json = load_stored_json(
+        db, mapping.content, mapping.mapping_file_id, "Mapping file missing"
+    ).get("mapping")
+    if not mapping_json:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid mapping file")
+
+    if not template:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Template not found")
+
+    template_json = load_stored_json(
+        db, template.content, template.file_id, "Template file missing"
+    )
+    template_fields = template_json.get("fields")
+    if not template_fields:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid template file")
+
+    if csv_upload is None:
+        if csv_upload_id is not None:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "CSV upload not found")
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "No CSV uploaded for seller")
+
+    if not csv_path:
+        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, "CSV file missing")
+
+    # Files without data rows validate to an empty result whatever their header
+    if csv_upload.headers is not None and csv_upload.row_count:
         try:
-            result = validate_csv(
-                rows=rows,
-                mapping=mapping_json,
-                template_fields=template_fields
+            check_required_columns(
+                normalize_mapping(mapping_json),
+                required_fields_of(template_fields),
+                csv_upload.headers
             )
+        except ValueError as e:
+            logger.warning(f"CSV validation failed | seller_id={seller_id} | reason={str(e)}")
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Identifies the compiled plan without serializing mapping and template
+    plan_key = (template.file_id, mapping.mapping_file_id)
+
+    return mapping_json, template_fields, csv_path, plan_key, csv_sha256, csv_upload.row_count
+
+
+def _result_options(unique_tracker: str, exact_unique: bool) -> str:
+    """Options that change results; engines and memoization do not."""
+    if exact_unique and unique_tracker in DIGEST_TRACKERS:
+        return f"{unique_tracker}+exact"
+    return unique_tracker
+
+
+def validate_file(
+    seller_id: str,
+    mapping_file_id: int,
+    stream: bool = False,
+    engine: Literal["compiled", "columnar", "parallel"] = "compiled",
+    unique_tracker: Literal["set", "digest64", "digest128", "spill"] = "set",
+    exact_unique: bool = False,
+    max_errors: Optional[int] = None,
+    fail_fast: bool = False,
+    preview: bool = False,
+    preview_rows: int = PREVIEW_HEAD_ROWS,
+    sample_size: int = PREVIEW_SAMPLE_ROWS,
+    incremental: bool = False,
+    refresh: bool = False
+):
+    logger.info(
+        f"CSV validation started | seller_id={seller_id} | mapping_file_id={mapping_file_id} | "
+        f"engine={engine} | unique_tracker={unique_tracker} | max_errors={max_errors} | fail_fast={fail_fast}"
+    )
+
+    if engine == "columnar" and not columnar_available():
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST,
+            detail="Columnar engine is not available on this server"
+        )
+
+    try:
+        limit = error_limit(max_errors, fail_fast)
+        check_tracker_options(unique_tracker, exact_unique)
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if preview and not 0 <= preview_rows <= PREVIEW_ROWS_MAX:
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST,
+            detail=f"preview_rows must be between 0 and {PREVIEW_ROWS_MAX}"
+        )
+
+    if preview and not 0 <= sample_size <= PREVIEW_SAMPLE_MAX:
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST,
+            detail=f"sample_size must be between 0 and {PREVIEW_SAMPLE_MAX}"
+        )
+
+    db: Session = SessionLocal()
+    try:
+        mapping_json, template_fields, csv_path, plan_key, csv_sha256, csv_rows = load_validation_inputs(
+            db, seller_id, mapping_file_id
+        )
+
+        # Complete, non-streamed results are stored by content; refresh recomputes them
+        cache_key = None
+        if not (stream or preview or limit.max_errors is not None):
+            cache_key = result_key(
+                ensure_csv_sha256(db, csv_path, csv_sha256),
+                mapping_json,
+                template_fields,
+                _result_options(unique_tracker, exact_unique)
+            )
+
+            cached = None if refresh else load_result(db, cache_key)
+            if cached is not None:
+                logger.info(
+                    f"CSV validation served from result store | seller_id={seller_id} | "
+                    f"total={cached['total']} | valid={cached['valid']}"
+                )
+                return {
+                    "seller_id": seller_id,
+                    "mapping_file_id": mapping_file_id,
+                    "total": cached["total"],
+                    "valid": cached["valid"],
+                    **limit.summary(),
+                    "cached": True,
+                    "unique_memory_bytes": {},
+                    "column_cache": {},
+                    "errors": expand_result(cached)
+                }
+
+        unique_seen = UniqueTrackers(unique_tracker, exact_unique)
+        verdicts = VerdictCaches()
+        row_verdicts = RowVerdicts(store_path(seller_id, plan_key)) if incremental else None
+
+        try:
+            if preview:
+                return {
+                    "seller_id": seller_id,
+                    "mapping_file_id": mapping_file_id,
+                    "preview": True,
+                    **preview_file(
+                        csv_path,
+                        mapping_json,
+                        template_fields,
+                        preview_rows,
+                        sample_size,
+                        plan_key
+                    )
+                }
+
+            if stream:
+                return stream_validation(
+                    seller_id,
+                    mapping_file_id,
+                    csv_path,
+                    mapping_json,
+                    template_fields,
+                    engine,
+                    plan_key,
+                    unique_seen,
+                    verdicts,
+                    limit,
+                    row_verdicts,
+                    csv_rows
+                )
+
+            # Limited, incremental and large runs read the file lazily record by record
+            lazy = csv_rows is not None and csv_rows > VALIDATION_IN_MEMORY_MAX_ROWS
+            if engine != "compiled" or limit.max_errors is not None or incremental or lazy:
+                result = list(limit.apply(iter_validate_file(
+                    csv_path,
+                    mapping_json,
+                    template_fields,
+                    engine,
+                    plan_key,
+                    unique_seen,
+                    verdicts,
+                    row_verdicts,
+                    csv_rows
+                ), rows_after(csv_path, csv_rows)))
+            else:
+                rows = read_csv_rows(csv_path)
+                rows = [
+                    {k: "" if v is None else str(v).strip() for k, v in row.items()}
+                    for row in rows
+                ]
+
+                result = validate_csv(
+                    rows=rows,
+                    mapping=mapping_json,
+                    template_fields=template_fields,
+                    unique_seen=unique_seen,
+                    verdicts=verdicts
+                )
         except ValueError as e:
             logger.warning(
                 f"CSV validation failed | seller_id={seller_id} | reason={str(e)}"
@@ -310,17 +652,124 @@ def validate_file(seller_id: str, mapping_file_id: int):
 
         logger.info(
             f"CSV validation completed | seller_id={seller_id} | total={len(result)} | "
-            f"valid={sum(r['valid'] for r in result)}"
+            f"valid={sum(r['valid'] for r in result)} | truncated={limit.truncated}"
         )
 
-        return {
+        if cache_key is not None:
+            try:
+                save_result(db, cache_key, compact_result(result))
+            except Exception:
+                db.rollback()
+                logger.exception(f"Storing validation result failed | seller_id={seller_id}")
+
+        response = {
             "seller_id": seller_id,
             "mapping_file_id": mapping_file_id,
             "total": len(result),
             "valid": sum(r["valid"] for r in result),
+            **limit.summary(),
+            "cached": False,
+            "unique_memory_bytes": unique_seen.memory(),
+            "column_cache": verdicts.stats(),
             "errors": result
         }
+        if row_verdicts is not None:
+            response["incremental"] = row_verdicts.stats()
+
+        return response
 
     finally:
         db.close()
         logger.debug("DB session closed for validate_file")
+
+
+def _logged_report(seller_id, mapping_file_id, chunks):
+    try:
+        yield from chunks
+    except Exception:
+        # Headers are already sent; the client sees an incomplete download
+        logger.exception(
+            f"Validation report failed while streaming | seller_id={seller_id} | "
+            f"mapping_file_id={mapping_file_id}"
+        )
+        raise
+    finally:
+        chunks.close()
+
+
+def validation_report(
+    seller_id: str,
+    mapping_file_id: int,
+    only_invalid: bool = False,
+    gzip: bool = False,
+    engine: Literal["compiled", "columnar", "parallel"] = "compiled",
+    unique_tracker: Literal["set", "digest64", "digest128", "spill"] = "set",
+    exact_unique: bool = False
+):
+    logger.info(
+        f"Validation report started | seller_id={seller_id} | mapping_file_id={mapping_file_id} | "
+        f"only_invalid={only_invalid} | gzip={gzip} | engine={engine}"
+    )
+
+    if engine == "columnar" and not columnar_available():
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST,
+            detail="Columnar engine is not available on this server"
+        )
+
+    try:
+        check_tracker_options(unique_tracker, exact_unique)
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    db: Session = SessionLocal()
+    try:
+        mapping_json, template_fields, csv_path, plan_key, _, csv_rows = load_validation_inputs(
+            db, seller_id, mapping_file_id
+        )
+    finally:
+        db.close()
+
+    # Header problems must surface as a 400 before the response starts
+    try:
+        results = iter_validate_file(
+            csv_path,
+            mapping_json,
+            template_fields,
+            engine,
+            plan_key,
+            UniqueTrackers(unique_tracker, exact_unique),
+            VerdictCaches(),
+            row_count=csv_rows
+        )
+    except ValueError as e:
+        logger.warning(f"Validation report failed | seller_id={seller_id} | reason={str(e)}")
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except KeyError as e:
+        logger.error(f"Template configuration error | missing key={e}")
+        raise HTTPException(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Template configuration error: missing {e}"
+        )
+
+    # The original records are read alongside the results, so any engine can be used
+    records = iter_csv_records(csv_path)
+    header = next(records, None) or []
+
+    chunks = _logged_report(
+        seller_id, mapping_file_id, iter_report(header, records, results, only_invalid)
+    )
+    file_name = f"validation-report-{mapping_file_id}.csv"
+
+    if gzip:
+        return StreamingResponse(
+            gzip_chunks(chunks),
+            media_type="application/gzip",
+            headers={"Content-Disposition": f'attachment; filename="{file_name}.gz"'}
+        )
+
+    return StreamingResponse(
+        chunks,
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{file_name}"'}
+    )
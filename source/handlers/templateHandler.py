@@ -1,5 +1,4 @@
 import logging
-import uuid
 import os
 import json
 
@@ -8,7 +7,9 @@ from fastapi import HTTPException, UploadFile, File
 
 from source.db.session import SessionLocal
 from source.db.model import MarketplaceTemplate, Files
-from source.constants.constants import TEMPLATE_DIR
+from source.db.blobStore import store_blob
+from source.utility.cache import json_cache, invalidate_json_files
+from source.utility.fileHelper import load_json_file
 
 logger = logging.getLogger(__name__)
 
@@ -55,41 +56,44 @@ def uploadTemplate(file: UploadFile = File(...)):
                 detail="Template already exists for this marketplace and version"
             )
 
-        template_uuid = str(uuid.uuid4())
-        file_path = TEMPLATE_DIR / f"{template_uuid}.json"
+        blob = store_blob(db, json.dumps(template_json, indent=2).encode("utf-8"))
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(template_json, f, indent=2)
-
-        logger.info(f"Template file saved to disk | path={file_path}")
+        logger.info(f"Template file saved to disk | path={blob.path} | new_blob={blob.created}")
 
         db_file = Files(
             file_name=file.filename,
-            file_path=str(file_path),
-            file_type="json"
+            file_path=blob.path,
+            file_type="json",
+            content_sha256=blob.sha256
         )
 
         db.add(db_file)
-        db.commit()
-        db.refresh(db_file)
-
-        logger.info(f"Template file DB record created | file_id={db_file.id}")
+        db.flush()
 
         db_template = MarketplaceTemplate(
             template_name=templateName,
             version=version,
-            file_id=db_file.id
+            file_id=db_file.id,
+            content=template_json
         )
 
         db.add(db_template)
-        db.commit()
-        db.refresh(db_template)
-
-        logger.info(
-            f"Marketplace template created | template_id={db_template.id} | marketplace={templateName} | version={version}"
-        )
+        db.flush()
+
+        # Plans built from earlier versions of this template are superseded
+        previous_file_ids = [
+            file_id for (file_id,) in (
+                db.query(MarketplaceTemplate.file_id)
+                .filter(
+                    MarketplaceTemplate.template_name == templateName,
+                    MarketplaceTemplate.id != db_template.id
+                )
+                .all()
+            )
+        ]
 
-        return {
+        # Read the generated ids before commit expires the instances
+        response = {
             "message": "Template uploaded successfully",
             "templateId": db_template.id,
             "fileId": db_file.id,
@@ -97,6 +101,16 @@ def uploadTemplate(file: UploadFile = File(...)):
             "version": version
         }
 
+        db.commit()
+        invalidate_json_files(previous_file_ids)
+
+        logger.info(
+            f"Marketplace template created | template_id={response['templateId']} | "
+            f"file_id={response['fileId']} | marketplace={templateName} | version={version}"
+        )
+
+        return response
+
     except Exception:
         logger.exception("Template upload failed")
         raise
@@ -121,22 +135,24 @@ def getTemplate(marketplace_name: str):
             logger.warning(f"Template not found | marketplace={marketplace_name}")
             return {"message": "Template not found"}
 
-        file = (
-            db.query(Files)
-            .filter(Files.id == template.file_id)
-            .first()
-        )
+        content = template.content
+
+        if content is None:
+            file = (
+                db.query(Files)
+                .filter(Files.id == template.file_id)
+                .first()
+            )
 
-        if not file:
-            logger.error(f"Template file DB record missing | template_id={template.id}")
-            return {"message": "File not found"}
+            if not file:
+                logger.error(f"Template file DB record missing | template_id={template.id}")
+                return {"message": "File not found"}
 
-        if not os.path.exists(file.file_path):
-            logger.error(f"Template file missing on disk | path={file.file_path}")
-            return {"message": "File missing on disk"}
+            if not os.path.exists(file.file_path):
+                logger.error(f"Template file missing on disk | path={file.file_path}")
+                return {"message": "File missing on disk"}
 
-        with open(file.file_path, "r", encoding="utf-8") as f:
-            content = json.load(f)
+            content = json_cache.get_or_load(file.id, lambda: load_json_file(file.file_path))
 
         logger.info(f"Template fetched successfully | marketplace={marketplace_name}")
 
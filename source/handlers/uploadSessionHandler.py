@@ -0,0 +1,210 @@
+import logging
+import re
+import uuid
+
+from fastapi import UploadFile, File, HTTPException, Query, status
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from source.constants.constants import MAX_UPLOAD_CHUNKS
+from source.db.session import SessionLocal
+from source.db.model import UploadSession, UploadChunk
+from source.handlers.csvhandler import is_csv_file_name, store_csv_upload
+from source.utility.chunkStore import (
+    ChunkChecksumError,
+    write_chunk,
+    chunk_paths,
+    remove_session_dir,
+)
+from source.utility.fileHelper import ConcatReader
+
+logger = logging.getLogger(__name__)
+
+SESSION_OPEN = "open"
+SESSION_COMPLETED = "completed"
+
+_SHA256 = re.compile(r"[0-9a-fA-F]{64}")
+
+
+def _get_session(db: Session, upload_id: str, seller_id: str, lock: str = None) -> UploadSession:
+    query = db.query(UploadSession).filter(
+        UploadSession.id == upload_id,
+        UploadSession.seller_id == seller_id
+    )
+    if lock is not None:
+        # "share" lets chunks be written concurrently; "update" waits for them
+        query = query.with_for_update(read=lock == "share")
+
+    session = query.first()
+    if session is None:
+        logger.warning(f"Upload session not found | upload_id={upload_id} | seller_id={seller_id}")
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Upload not found")
+    return session
+
+
+def _require_open(session: UploadSession):
+    if session.status != SESSION_OPEN:
+        raise HTTPException(status.HTTP_409_CONFLICT, f"Upload is {session.status}")
+
+
+def initiate_upload(
+    seller_id: str = Query(...),
+    filename: str = Query(...),
+    chunk_count: int = Query(...)
+):
+    if not is_csv_file_name(filename):
+        raise HTTPException(400, "Only CSV files (.csv, .csv.gz, .csv.zst) allowed")
+
+    if not 1 <= chunk_count <= MAX_UPLOAD_CHUNKS:
+        raise HTTPException(400, f"chunk_count must be between 1 and {MAX_UPLOAD_CHUNKS}")
+
+    upload_id = uuid.uuid4().hex
+
+    db: Session = SessionLocal()
+    try:
+        db.add(UploadSession(
+            id=upload_id,
+            seller_id=seller_id,
+            file_name=filename,
+            chunk_count=chunk_count,
+            status=SESSION_OPEN
+        ))
+        db.commit()
+    finally:
+        db.close()
+
+    logger.info(
+        f"Upload session created | upload_id={upload_id} | seller_id={seller_id} | chunks={chunk_count}"
+    )
+
+    return {
+        "uploadId": upload_id,
+        "chunkCount": chunk_count,
+        "status": SESSION_OPEN
+    }
+
+
+def get_upload(upload_id: str, seller_id: str = Query(...)):
+    db: Session = SessionLocal()
+    try:
+        session = _get_session(db, upload_id, seller_id)
+        received = [
+            index for (index,) in db.query(UploadChunk.chunk_index)
+            .filter(UploadChunk.upload_id == upload_id)
+            .order_by(UploadChunk.chunk_index)
+            .all()
+        ]
+        received_set = set(received)
+
+        return {
+            "uploadId": session.id,
+            "fileName": session.file_name,
+            "status": session.status,
+            "chunkCount": session.chunk_count,
+            "receivedChunks": received,
+            "missingChunks": (
+                [i for i in range(session.chunk_count) if i not in received_set]
+                if session.status == SESSION_OPEN else []
+            ),
+            "csvUploadId": session.csv_upload_id
+        }
+    finally:
+        db.close()
+
+
+def put_chunk(
+    upload_id: str,
+    chunk_index: int,
+    seller_id: str = Query(...),
+    sha256: str = Query(...),
+    file: UploadFile = File(...)
+):
+    if not _SHA256.fullmatch(sha256):
+        raise HTTPException(400, "sha256 must be a hex encoded SHA-256 digest")
+
+    db: Session = SessionLocal()
+    try:
+        session = _get_session(db, upload_id, seller_id, lock="share")
+        _require_open(session)
+
+        if not 0 <= chunk_index < session.chunk_count:
+            raise HTTPException(
+                400, f"chunk_index must be between 0 and {session.chunk_count - 1}"
+            )
+
+        try:
+            size, digest = write_chunk(upload_id, chunk_index, file.file, sha256)
+        except ChunkChecksumError as e:
+            logger.warning(f"Upload chunk rejected | upload_id={upload_id} | {e}")
+            raise HTTPException(400, str(e))
+
+        # A re-sent chunk replaces the previous one
+        stmt = insert(UploadChunk).values(
+            upload_id=upload_id,
+            chunk_index=chunk_index,
+            size_bytes=size,
+            sha256=digest
+        )
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[UploadChunk.upload_id, UploadChunk.chunk_index],
+            set_={"size_bytes": size, "sha256": digest, "created_at": func.now()}
+        ))
+        db.commit()
+
+        return {
+            "uploadId": upload_id,
+            "chunkIndex": chunk_index,
+            "size": size,
+            "sha256": digest
+        }
+    finally:
+        db.close()
+
+
+def complete_upload(upload_id: str, seller_id: str = Query(...)):
+    logger.info(f"Upload finalize started | upload_id={upload_id} | seller_id={seller_id}")
+
+    db: Session = SessionLocal()
+    try:
+        session = _get_session(db, upload_id, seller_id, lock="update")
+        _require_open(session)
+
+        received = dict(
+            db.query(UploadChunk.chunk_index, UploadChunk.sha256)
+            .filter(UploadChunk.upload_id == upload_id)
+            .all()
+        )
+        missing = [i for i in range(session.chunk_count) if i not in received]
+        if missing:
+            raise HTTPException(400, {"message": "Upload is missing chunks", "missingChunks": missing})
+
+        # The recorded digest names the file, so a concurrent re-send of a chunk
+        # cannot pair its bytes with another request's row
+        digests = [received[i] for i in range(session.chunk_count)]
+
+        # Chunks are streamed in order through the same single pass as uploadfile
+        with ConcatReader(chunk_paths(upload_id, digests)) as source:
+            response = store_csv_upload(db, seller_id, session.file_name, source)
+
+        session.status = SESSION_COMPLETED
+        session.csv_upload_id = response["csvUploadId"]
+        session.completed_at = func.now()
+        db.query(UploadChunk).filter(UploadChunk.upload_id == upload_id).delete()
+        db.commit()
+
+    except Exception:
+        logger.exception(f"Upload finalize failed | upload_id={upload_id} | seller_id={seller_id}")
+        raise
+
+    finally:
+        db.close()
+
+    remove_session_dir(upload_id)
+
+    logger.info(
+        f"Upload finalized | upload_id={upload_id} | csv_upload_id={response['csvUploadId']} | "
+        f"rows={response['rowCount']}"
+    )
+
+    return {"uploadId": upload_id, **response}
@@ -2,11 +2,16 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
 from source.db.db import init_db
+from source.db.backfill import backfill_json_content
 from source.logger.logger import init_logger
-from source.constants.constants import TEMPLATE_DIR, UPLOAD_DIR, MAPPING_UPLOAD_DIR, LOG_FILE_PATH
+from source.utility.parallelValidation import shutdown_executor
+from source.jobs.jobQueue import get_job_queue
+from source.jobs.worker import start_job_workers, stop_job_workers
+from source.handlers.jobHandler import run_validation_job
+from source.constants.constants import TEMPLATE_DIR, UPLOAD_DIR, MAPPING_UPLOAD_DIR, ROW_VERDICT_DIR, BLOB_DIR, UPLOAD_SESSION_DIR, LOG_FILE_PATH
 
 def init_dirs():
-    dirs = [TEMPLATE_DIR, UPLOAD_DIR, MAPPING_UPLOAD_DIR, Path(LOG_FILE_PATH).parent]
+    dirs = [TEMPLATE_DIR, UPLOAD_DIR, MAPPING_UPLOAD_DIR, ROW_VERDICT_DIR, BLOB_DIR, UPLOAD_SESSION_DIR, Path(LOG_FILE_PATH).parent]
     for d in dirs:
         Path(d).mkdir(parents=True, exist_ok=True)
 
@@ -15,4 +20,8 @@ async def initialize(app: FastAPI):
     init_dirs()
     init_logger(LOG_FILE_PATH)
     init_db()
-    yield
\ No newline at end of file
+    backfill_json_content()
+    start_job_workers(get_job_queue(), run_validation_job)
+    yield
+    stop_job_workers()
+    shutdown_executor()
@@ -0,0 +1,276 @@
+import logging
+import threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from itertools import count
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from source.constants.constants import JOB_QUEUE_BACKEND, JOB_LEASE_SECONDS, JOB_MAX_ATTEMPTS
+from source.db.model import ValidationJob
+from source.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+LOST_WORKER_ERROR = "Validation worker stopped responding"
+
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+def _job_to_dict(job: ValidationJob) -> dict:
+    return {
+        "id": job.id,
+        "seller_id": job.seller_id,
+        "mapping_file_id": job.mapping_file_id,
+        "csv_upload_id": job.csv_upload_id,
+        "engine": job.engine,
+        "status": job.status,
+        "rows_processed": job.rows_processed or 0,
+        "result": job.result,
+        "error": job.error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "heartbeat_at": job.heartbeat_at,
+        "attempts": job.attempts or 0,
+        "finished_at": job.finished_at,
+    }
+
+
+class PostgresJobQueue:
+    """
+    Job queue on the validation_jobs table. Workers on any API node claim
+    jobs with SELECT ... FOR UPDATE SKIP LOCKED, so a job runs once.
+    Running jobs hold a lease that the worker renews through heartbeat_at;
+    claim hands jobs whose lease expired (worker died) to the next worker,
+    or fails them after max_attempts. Workers write under the attempt they
+    claimed, so a reclaimed job ignores its previous worker.
+    """
+
+    def __init__(self, lease_seconds: float = JOB_LEASE_SECONDS, max_attempts: int = JOB_MAX_ATTEMPTS):
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+    def enqueue(self, seller_id: str, mapping_file_id: int, engine: str, csv_upload_id: int) -> dict:
+        db: Session = SessionLocal()
+        try:
+            job = ValidationJob(
+                seller_id=seller_id,
+                mapping_file_id=mapping_file_id,
+                csv_upload_id=csv_upload_id,
+                engine=engine,
+                status=JOB_QUEUED,
+                rows_processed=0
+            )
+            db.add(job)
+            db.commit()
+            db.refresh(job)
+            return _job_to_dict(job)
+        finally:
+            db.close()
+
+    def _reclaim_stale(self, db: Session):
+        now = _now()
+        last_seen = func.coalesce(ValidationJob.heartbeat_at, ValidationJob.started_at)
+        stale = (
+            db.query(ValidationJob)
+            .filter(ValidationJob.status == JOB_RUNNING)
+            .filter(last_seen < now - timedelta(seconds=self.lease_seconds))
+        )
+
+        failed = stale.filter(ValidationJob.attempts >= self.max_attempts).update(
+            {"status": JOB_FAILED, "error": LOST_WORKER_ERROR, "finished_at": now},
+            synchronize_session=False
+        )
+        requeued = stale.filter(ValidationJob.attempts < self.max_attempts).update(
+            {"status": JOB_QUEUED, "rows_processed": 0, "started_at": None, "heartbeat_at": None},
+            synchronize_session=False
+        )
+        db.commit()
+
+        if failed or requeued:
+            logger.warning(f"Stale validation jobs reclaimed | requeued={requeued} | failed={failed}")
+
+    def claim(self):
+        db: Session = SessionLocal()
+        try:
+            self._reclaim_stale(db)
+
+            job = (
+                db.query(ValidationJob)
+                .filter(ValidationJob.status == JOB_QUEUED)
+                .order_by(ValidationJob.created_at, ValidationJob.id)
+                .with_for_update(skip_locked=True)
+                .first()
+            )
+            if not job:
+                db.rollback()
+                return None
+
+            job.status = JOB_RUNNING
+            job.started_at = _now()
+            job.heartbeat_at = job.started_at
+            job.attempts = (job.attempts or 0) + 1
+            db.commit()
+            db.refresh(job)
+            return _job_to_dict(job)
+        finally:
+            db.close()
+
+    def _update(self, job_id: int, attempt: int, **values) -> bool:
+        """
+        Applies `values` only while the job is still running under `attempt`,
+        the claim this worker holds; False when the lease has been lost.
+        """
+        db: Session = SessionLocal()
+        try:
+            updated = (
+                db.query(ValidationJob)
+                .filter(ValidationJob.id == job_id)
+                .filter(ValidationJob.status == JOB_RUNNING)
+                .filter(ValidationJob.attempts == attempt)
+                .update(values, synchronize_session=False)
+            )
+            db.commit()
+            return updated > 0
+        finally:
+            db.close()
+
+    def update_progress(self, job_id: int, attempt: int, rows_processed: int) -> bool:
+        return self._update(job_id, attempt, rows_processed=rows_processed, heartbeat_at=_now())
+
+    def heartbeat(self, job_id: int, attempt: int) -> bool:
+        return self._update(job_id, attempt, heartbeat_at=_now())
+
+    def complete(self, job_id: int, attempt: int, rows_processed: int, result: dict) -> bool:
+        return self._update(
+            job_id,
+            attempt,
+            status=JOB_SUCCEEDED,
+            rows_processed=rows_processed,
+            result=result,
+            finished_at=_now()
+        )
+
+    def fail(self, job_id: int, attempt: int, error: str) -> bool:
+        return self._update(job_id, attempt, status=JOB_FAILED, error=error, finished_at=_now())
+
+    def get(self, job_id: int):
+        db: Session = SessionLocal()
+        try:
+            job = db.query(ValidationJob).get(job_id)
+            return _job_to_dict(job) if job else None
+        finally:
+            db.close()
+
+
+class InMemoryJobQueue:
+    """In-process stand-in for PostgresJobQueue, used by tests and local runs."""
+
+    def __init__(self, lease_seconds: float = JOB_LEASE_SECONDS, max_attempts: int = JOB_MAX_ATTEMPTS):
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._jobs = {}
+        self._pending = deque()
+        self._ids = count(1)
+        self._lock = threading.Lock()
+
+    def enqueue(self, seller_id: str, mapping_file_id: int, engine: str, csv_upload_id: int) -> dict:
+        with self._lock:
+            job_id = next(self._ids)
+            self._jobs[job_id] = {
+                "id": job_id,
+                "seller_id": seller_id,
+                "mapping_file_id": mapping_file_id,
+                "csv_upload_id": csv_upload_id,
+                "engine": engine,
+                "status": JOB_QUEUED,
+                "rows_processed": 0,
+                "result": None,
+                "error": None,
+                "created_at": _now(),
+                "started_at": None,
+                "heartbeat_at": None,
+                "attempts": 0,
+                "finished_at": None,
+            }
+            self._pending.append(job_id)
+            return dict(self._jobs[job_id])
+
+    def _reclaim_stale(self):
+        now = _now()
+        expired = now - timedelta(seconds=self.lease_seconds)
+        for job in self._jobs.values():
+            if job["status"] != JOB_RUNNING or job["heartbeat_at"] >= expired:
+                continue
+            if job["attempts"] >= self.max_attempts:
+                job.update(status=JOB_FAILED, error=LOST_WORKER_ERROR, finished_at=now)
+            else:
+                job.update(status=JOB_QUEUED, rows_processed=0, started_at=None, heartbeat_at=None)
+                self._pending.append(job["id"])
+
+    def claim(self):
+        with self._lock:
+            self._reclaim_stale()
+            if not self._pending:
+                return None
+            job = self._jobs[self._pending.popleft()]
+            job["status"] = JOB_RUNNING
+            job["started_at"] = job["heartbeat_at"] = _now()
+            job["attempts"] += 1
+            return dict(job)
+
+    def _update(self, job_id: int, attempt: int, **values) -> bool:
+        with self._lock:
+            job = self._jobs[job_id]
+            if job["status"] != JOB_RUNNING or job["attempts"] != attempt:
+                return False
+            job.update(values)
+            return True
+
+    def update_progress(self, job_id: int, attempt: int, rows_processed: int) -> bool:
+        return self._update(job_id, attempt, rows_processed=rows_processed, heartbeat_at=_now())
+
+    def heartbeat(self, job_id: int, attempt: int) -> bool:
+        return self._update(job_id, attempt, heartbeat_at=_now())
+
+    def complete(self, job_id: int, attempt: int, rows_processed: int, result: dict) -> bool:
+        return self._update(
+            job_id,
+            attempt,
+            status=JOB_SUCCEEDED,
+            rows_processed=rows_processed,
+            result=result,
+            finished_at=_now()
+        )
+
+    def fail(self, job_id: int, attempt: int, error: str) -> bool:
+        return self._update(job_id, attempt, status=JOB_FAILED, error=error, finished_at=_now())
+
+    def get(self, job_id: int):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+
+_queue = None
+
+
+def get_job_queue():
+    global _queue
+    if _queue is None:
+        _queue = InMemoryJobQueue() if JOB_QUEUE_BACKEND == "memory" else PostgresJobQueue()
+        logger.info(f"Job queue initialised | backend={JOB_QUEUE_BACKEND}")
+    return _queue
+
+
+def set_job_queue(queue):
+    global _queue
+    _queue = queue
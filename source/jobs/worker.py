@@ -0,0 +1,144 @@
+import logging
+import threading
+
+from source.constants.constants import JOB_WORKERS, JOB_POLL_INTERVAL, JOB_HEARTBEAT_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseLost(Exception):
+    """The running job was reclaimed by another worker; its attempt must stop."""
+
+
+class JobWorkerPool:
+    """
+    Fixed number of threads that claim jobs from a queue and run them with
+    `run_job(job, report_progress)`, which returns (rows_processed, result).
+    While a job runs its lease is renewed every heartbeat_interval seconds,
+    including phases that report no progress. Every write names the attempt
+    that was claimed; once one is rejected the lease is lost, the next
+    progress report raises LeaseLost and the attempt's outcome is dropped.
+    """
+
+    def __init__(
+            self,
+            queue,
+            run_job,
+            workers: int = JOB_WORKERS,
+            poll_interval: float = JOB_POLL_INTERVAL,
+            heartbeat_interval: float = JOB_HEARTBEAT_INTERVAL
+    ):
+        self.queue = queue
+        self.run_job = run_job
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._threads = []
+
+    def start(self):
+        for n in range(self.workers):
+            thread = threading.Thread(
+                target=self._loop,
+                name=f"validation-job-worker-{n}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Job workers started | workers={self.workers}")
+
+    def stop(self, timeout: float = None):
+        self._stopping.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        logger.info("Job workers stopped")
+
+    def notify(self):
+        self._wake.set()
+
+    def _loop(self):
+        while not self._stopping.is_set():
+            try:
+                job = self.queue.claim()
+            except Exception:
+                logger.exception("Failed to claim validation job")
+                job = None
+
+            if job is None:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+                continue
+
+            self._process(job)
+
+    def _process(self, job: dict):
+        job_id = job["id"]
+        attempt = job["attempts"]
+        logger.info(f"Validation job started | job_id={job_id} | attempt={attempt}")
+
+        lost = threading.Event()
+
+        def report_progress(rows_processed: int):
+            if lost.is_set() or not self.queue.update_progress(job_id, attempt, rows_processed):
+                lost.set()
+                raise LeaseLost()
+
+        done = threading.Event()
+
+        def heartbeat():
+            while not done.wait(self.heartbeat_interval):
+                try:
+                    if not self.queue.heartbeat(job_id, attempt):
+                        lost.set()
+                        return
+                except Exception:
+                    logger.exception(f"Validation job heartbeat failed | job_id={job_id}")
+
+        threading.Thread(target=heartbeat, name=f"validation-job-heartbeat-{job_id}", daemon=True).start()
+
+        try:
+            rows_processed, result = self.run_job(job, report_progress)
+        except LeaseLost:
+            logger.warning(f"Validation job lease lost | job_id={job_id} | attempt={attempt}")
+            return
+        except Exception as e:
+            detail = getattr(e, "detail", None) or "Internal validation error"
+            logger.exception(f"Validation job failed | job_id={job_id}")
+            if not self.queue.fail(job_id, attempt, str(detail)):
+                logger.warning(f"Validation job lease lost | job_id={job_id} | attempt={attempt}")
+            return
+        finally:
+            done.set()
+
+        if not self.queue.complete(job_id, attempt, rows_processed, result):
+            logger.warning(
+                f"Validation job lease lost, result dropped | job_id={job_id} | attempt={attempt}"
+            )
+            return
+        logger.info(f"Validation job completed | job_id={job_id} | rows={rows_processed}")
+
+
+_pool = None
+
+
+def start_job_workers(queue, run_job):
+    global _pool
+    if _pool is None:
+        _pool = JobWorkerPool(queue, run_job)
+        _pool.start()
+    return _pool
+
+
+def stop_job_workers():
+    global _pool
+    if _pool is not None:
+        _pool.stop(timeout=JOB_POLL_INTERVAL)
+        _pool = None
+
+
+def notify_job_workers():
+    if _pool is not None:
+        _pool.notify()
@@ -2,12 +2,12 @@ from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 
 from source.initialize import initialize
-from source.middleware import auth_middleware, validation_exception_handler
+from source.middleware import AuthMiddleware, validation_exception_handler
 from source.register import registerRoutes
 
 app = FastAPI(lifespan=initialize)
 
-app.middleware("http")(auth_middleware)
+app.add_middleware(AuthMiddleware)
 
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
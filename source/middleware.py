@@ -1,6 +1,8 @@
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 from source.handlers.authHandler import verify_token
 import logging
 
@@ -8,35 +10,48 @@ logger = logging.getLogger(__name__)
 
 UNAUTH_PATHS = {"/v1", "/v1/", "/token", "/docs", "/openapi.json"}
 
-async def auth_middleware(request: Request, call_next):
-    path = request.url.path
-    if path in UNAUTH_PATHS or path.startswith("/docs"):
-        return await call_next(request)
-
-    auth_header = request.headers.get("Authorization")
-    if not auth_header:
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content={"detail": "Authorization header missing"},
-        )
-
-    scheme, _, token = auth_header.partition(" ")
-    if scheme != "Bearer" or not token:
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content={"detail": "Invalid Authorization header format"},
-        )
-
-    try:
-        payload = verify_token(token)
-        request.state.user = payload
-    except Exception as e:
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content={"detail": str(e)},
-        )
-
-    return await call_next(request)
+class AuthMiddleware:
+    """
+    Bearer-token check as plain ASGI middleware. Unlike BaseHTTPMiddleware
+    it adds no per-request task or body queue, so streamed uploads and
+    responses pass straight through. The verified payload is exposed to
+    handlers as request.state.user.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        path = scope["path"]
+        if path in UNAUTH_PATHS or path.startswith("/docs"):
+            return await self.app(scope, receive, send)
+
+        auth_header = Headers(scope=scope).get("Authorization")
+        if not auth_header:
+            return await _unauthorized("Authorization header missing")(scope, receive, send)
+
+        scheme, _, token = auth_header.partition(" ")
+        if scheme != "Bearer" or not token:
+            return await _unauthorized("Invalid Authorization header format")(scope, receive, send)
+
+        try:
+            payload = verify_token(token)
+        except Exception as e:
+            return await _unauthorized(str(e))(scope, receive, send)
+
+        # Request.state reads from scope["state"]
+        scope.setdefault("state", {})["user"] = payload
+        await self.app(scope, receive, send)
+
+
+def _unauthorized(detail: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        content={"detail": detail},
+    )
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     readable_errors = [
@@ -40,6 +40,48 @@ routes: list[RouteDef] = [
         "handler":"source.handlers.csvhandler:uploadfile",
         "description": "Endpoint to upload a csv file which will return discovered columns names, sample rows and row count"
     },
+    {
+        "method":"GET",
+        "path": ENDPOINT + "/uploadfile/{csv_upload_id}",
+        "handler":"source.handlers.csvhandler:get_upload_details",
+        "description": "Endpoint to view headers, row count, sample rows, size and hash of a csv upload"
+    },
+    {
+        "method":"DELETE",
+        "path": ENDPOINT + "/uploadfile/{csv_upload_id}",
+        "handler":"source.handlers.csvhandler:delete_upload",
+        "description": "Endpoint to delete a csv upload; its stored file is removed with the last reference"
+    },
+    {
+        "method":"GET",
+        "path": ENDPOINT + "/uploadfile/{csv_upload_id}/rows",
+        "handler":"source.handlers.csvhandler:get_upload_rows",
+        "description": "Endpoint to page through the rows of a csv upload, served from its row offset index"
+    },
+    {
+        "method":"POST",
+        "path": ENDPOINT + "/uploads",
+        "handler":"source.handlers.uploadSessionHandler:initiate_upload",
+        "description": "Endpoint to start a resumable chunked csv upload, returns the upload id"
+    },
+    {
+        "method":"GET",
+        "path": ENDPOINT + "/uploads/{upload_id}",
+        "handler":"source.handlers.uploadSessionHandler:get_upload",
+        "description": "Endpoint to view received and missing chunks of a resumable upload"
+    },
+    {
+        "method":"PUT",
+        "path": ENDPOINT + "/uploads/{upload_id}/chunks/{chunk_index}",
+        "handler":"source.handlers.uploadSessionHandler:put_chunk",
+        "description": "Endpoint to upload one numbered chunk with its sha256 checksum"
+    },
+    {
+        "method":"POST",
+        "path": ENDPOINT + "/uploads/{upload_id}/complete",
+        "handler":"source.handlers.uploadSessionHandler:complete_upload",
+        "description": "Endpoint to assemble the chunks into a csv upload, returns the same body as uploadfile"
+    },
     {
         "method":"POST",
         "path": ENDPOINT + "/sellermapping",
@@ -64,5 +106,35 @@ routes: list[RouteDef] = [
         "handler":"source.handlers.mappingHandler:validate_file",
         "description": "Endpoint to view a mapping details by seller"
     },
+    {
+        "method":"GET",
+        "path": ENDPOINT + "/mapping/report",
+        "handler":"source.handlers.mappingHandler:validation_report",
+        "description": "Endpoint to download the seller's csv with _valid and _errors columns, optionally failing rows only or gzipped"
+    },
+    {
+        "method":"POST",
+        "path": ENDPOINT + "/jobs/validation",
+        "handler":"source.handlers.jobHandler:submit_validation_job",
+        "description": "Endpoint to queue a background validation job, returns the job id"
+    },
+    {
+        "method":"GET",
+        "path": ENDPOINT + "/jobs/validation/{job_id}",
+        "handler":"source.handlers.jobHandler:get_validation_job",
+        "description": "Endpoint to view status, rows processed and throughput of a validation job"
+    },
+    {
+        "method":"GET",
+        "path": ENDPOINT + "/jobs/validation/{job_id}/result",
+        "handler":"source.handlers.jobHandler:get_validation_job_result",
+        "description": "Endpoint to fetch the result of a finished validation job"
+    },
+    {
+        "method":"GET",
+        "path": ENDPOINT + "/cache/stats",
+        "handler":"source.handlers.cacheHandler:get_cache_stats",
+        "description": "Endpoint to view size, hits and misses of the template/mapping and validation plan caches"
+    },
 ]
 
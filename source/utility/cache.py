@@ -0,0 +1,126 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from source.constants.constants import JSON_CACHE_SIZE, PLAN_CACHE_SIZE, TOKEN_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe bounded LRU cache with hit/miss counters."""
+
+    def __init__(self, name: str, maxsize: int):
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_load(self, key, loader):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            # Loaded outside the lock; concurrent misses may load twice
+            value = loader()
+            self.put(key, value)
+        return value
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_where(self, predicate):
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+class ExpiringLRUCache(LRUCache):
+    """LRUCache whose entries carry an absolute expiry time (epoch seconds)."""
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING and entry[1] <= time.time():
+                del self._data[key]
+                entry = _MISSING
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, expires_at: float):
+        if expires_at <= time.time():
+            return
+        super().put(key, (value, expires_at))
+
+
+# Parsed template/mapping JSON keyed by Files.id
+json_cache = LRUCache("json_files", JSON_CACHE_SIZE)
+
+# Compiled validation plans, keyed by ((template file id, mapping file id),
+# csv header, positional) or by the serialized plan inputs
+plan_cache = LRUCache("validation_plans", PLAN_CACHE_SIZE)
+
+# Verified JWT payloads keyed by the raw token, dropped at the token's exp
+token_cache = ExpiringLRUCache("jwt_tokens", TOKEN_CACHE_SIZE)
+
+
+def invalidate_json_files(file_ids):
+    file_ids = set(file_ids)
+    if not file_ids:
+        return
+
+    for file_id in file_ids:
+        json_cache.invalidate(file_id)
+
+    plan_cache.invalidate_where(
+        lambda key: isinstance(key[0], tuple) and bool(file_ids.intersection(key[0]))
+    )
+    logger.info(f"Cache entries invalidated | file_ids={sorted(file_ids)}")
+
+
+def cache_stats() -> dict:
+    return {
+        json_cache.name: json_cache.stats(),
+        plan_cache.name: plan_cache.stats(),
+        token_cache.name: token_cache.stats(),
+    }
@@ -0,0 +1,74 @@
+import hashlib
+import logging
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import BinaryIO, List, Tuple
+
+from source.constants.constants import UPLOAD_SESSION_DIR, UPLOAD_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkChecksumError(ValueError):
+    pass
+
+
+def session_dir(upload_id: str, root: Path = None) -> Path:
+    return Path(UPLOAD_SESSION_DIR if root is None else root) / upload_id
+
+
+def chunk_path(upload_id: str, chunk_index: int, sha256: str, root: Path = None) -> Path:
+    """Chunks are named by their digest, so a path always holds the bytes its name promises."""
+    return session_dir(upload_id, root) / f"{chunk_index:06d}.{sha256.lower()}.part"
+
+
+def write_chunk(
+    upload_id: str,
+    chunk_index: int,
+    source: BinaryIO,
+    sha256: str,
+    root: Path = None
+) -> Tuple[int, str]:
+    """
+    Copies one chunk to disk while hashing it. The chunk is only stored under
+    its digest's path once its sha256 matches, so a failed or corrupted retry
+    never leaves a partial chunk behind. Copies of the same index with other
+    digests stay until the session directory is removed. Returns (size, sha256).
+    """
+    path = chunk_path(upload_id, chunk_index, sha256, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    hasher = hashlib.sha256()
+    size = 0
+
+    try:
+        with open(tmp_path, "wb") as f:
+            for data in iter(lambda: source.read(UPLOAD_CHUNK_SIZE), b""):
+                hasher.update(data)
+                size += len(data)
+                f.write(data)
+
+        digest = hasher.hexdigest()
+        if digest != sha256.lower():
+            raise ChunkChecksumError(
+                f"Checksum mismatch for chunk {chunk_index}: expected {sha256}, got {digest}"
+            )
+
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            os.remove(tmp_path)
+
+    logger.debug(f"Upload chunk stored | upload_id={upload_id} | chunk={chunk_index} | size={size}")
+    return size, digest
+
+
+def chunk_paths(upload_id: str, digests: List[str], root: Path = None) -> List[str]:
+    """Paths of the chunks with the given sha256 digests, one per index in order."""
+    return [str(chunk_path(upload_id, i, sha256, root)) for i, sha256 in enumerate(digests)]
+
+
+def remove_session_dir(upload_id: str, root: Path = None):
+    shutil.rmtree(session_dir(upload_id, root), ignore_errors=True)
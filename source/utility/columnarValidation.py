@@ -0,0 +1,207 @@
+import logging
+from itertools import islice
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:  # optional: only the columnar engine needs numpy
+    np = None
+
+from source.constants.constants import COLUMNAR_BATCH_ROWS
+from source.utility.uniqueTracker import UniqueTrackers, duplicate_check
+from source.utility.verdictCache import VerdictCaches
+from source.utility.validationPlan import ValidationPlan
+
+logger = logging.getLogger(__name__)
+
+OK, MISSING, FAILED, DUPLICATE = 0, 1, 2, 3
+INVALID_PRICE, PRICE_OVER_MRP = 1, 2
+
+FIELD_MESSAGES = {
+    MISSING: "Required field missing",
+    FAILED: "Validation failed",
+    DUPLICATE: "Duplicate value",
+}
+CROSS_MESSAGES = {
+    INVALID_PRICE: "Invalid price/mrp",
+    PRICE_OVER_MRP: "Price cannot exceed MRP",
+}
+
+
+def columnar_available() -> bool:
+    return np is not None
+
+
+def _parse_floats(values: list):
+    """
+    Parses a batch in one numpy call. A single bad cell makes numpy reject
+    the whole batch, in which case cells are parsed one by one.
+    Returns (numbers, parsed_mask).
+    """
+    try:
+        return np.array(values, dtype=np.float64), np.ones(len(values), dtype=bool)
+    except ValueError:
+        pass
+
+    numbers = np.zeros(len(values), dtype=np.float64)
+    parsed = np.zeros(len(values), dtype=bool)
+
+    for i, v in enumerate(values):
+        try:
+            numbers[i] = float(v)
+            parsed[i] = True
+        except ValueError:
+            pass
+
+    return numbers, parsed
+
+
+def _check_values(rule: dict, check, values: list):
+    """Vectorized equivalent of check(v) for a batch of non-empty values."""
+    count = len(values)
+    kind = rule["type"]
+
+    if kind in ("int", "number"):
+        if kind == "int":
+            try:
+                numbers = np.array(values, dtype=np.int64)
+            except (ValueError, OverflowError):
+                # Rare: bad or unbounded ints keep exact Python semantics
+                return np.fromiter(map(check, values), dtype=bool, count=count)
+            parsed = np.ones(count, dtype=bool)
+        else:
+            numbers, parsed = _parse_floats(values)
+
+        min_v = rule.get("min")
+        if min_v is not None:
+            # NaN passes, as `n < min_v` is False for NaN
+            parsed &= ~(numbers < min_v)
+        return parsed
+
+    if kind == "enum":
+        allowed = set(rule.get("allowed", []))
+        return np.fromiter(map(allowed.__contains__, values), dtype=bool, count=count)
+
+    if kind == "string":
+        max_len = rule.get("maxLen")
+        if not max_len:
+            return np.ones(count, dtype=bool)
+        return np.fromiter(map(len, values), dtype=np.int64, count=count) <= max_len
+
+    return np.fromiter(map(check, values), dtype=bool, count=count)
+
+
+def _read_columns(plan: ValidationPlan, batch: list) -> list:
+    width = max(plan.keys) + 1 if plan.keys else 0
+    if batch and min(map(len, batch)) < width:
+        batch = [r if len(r) >= width else r + [""] * (width - len(r)) for r in batch]
+
+    columns = [
+        list(map(str.strip, map(itemgetter(key), batch)))
+        for key in plan.keys
+    ]
+    columns.append([""] * len(batch))
+    return columns
+
+
+def _cross_codes(plan: ValidationPlan, columns: list, count: int):
+    if plan.price_pos is None and plan.mrp_pos is None:
+        return None
+
+    def parse(pos):
+        if pos is None:
+            return np.zeros(count, dtype=np.float64), np.ones(count, dtype=bool)
+        return _parse_floats(columns[pos])
+
+    price, price_ok = parse(plan.price_pos)
+    mrp, mrp_ok = parse(plan.mrp_pos)
+
+    invalid = ~(price_ok & mrp_ok)
+    codes = np.zeros(count, dtype=np.int8)
+    codes[(price > mrp) & ~invalid] = PRICE_OVER_MRP
+    codes[invalid] = INVALID_PRICE
+    return codes
+
+
+def _validate_batch(plan: ValidationPlan, batch: list, start: int, unique_checks: dict, checks: dict):
+    count = len(batch)
+    columns = _read_columns(plan, batch)
+    any_error = np.zeros(count, dtype=bool)
+    field_codes = []
+
+    for field, pos, required, check in plan.fields:
+        values = columns[pos]
+        codes = np.zeros(count, dtype=np.int8)
+        present = np.fromiter(map(bool, values), dtype=bool, count=count)
+
+        if required:
+            codes[~present] = MISSING
+
+        idx = np.flatnonzero(present)
+        if idx.size:
+            if idx.size == count:
+                subset = values
+            else:
+                subset = np.array(values, dtype=object)[idx].tolist()
+            passed = _check_values(plan.rules[field], checks.get(field, check), subset)
+            codes[idx[~passed]] = FAILED
+
+            is_duplicate = unique_checks.get(field)
+            if is_duplicate is not None:
+                for i in idx[passed].tolist():
+                    if is_duplicate(values[i]):
+                        codes[i] = DUPLICATE
+
+        any_error |= codes != OK
+        field_codes.append((field, codes.tolist()))
+
+    cross = _cross_codes(plan, columns, count)
+    if cross is not None:
+        any_error |= cross != OK
+        cross = cross.tolist()
+
+    for i, has_error in enumerate(any_error.tolist()):
+        if not has_error:
+            yield {"row": start + i, "valid": True, "errors": {}}
+            continue
+
+        errors = {
+            field: FIELD_MESSAGES[codes[i]]
+            for field, codes in field_codes
+            if codes[i]
+        }
+        if cross is not None and cross[i]:
+            errors["price"] = CROSS_MESSAGES[cross[i]]
+
+        yield {"row": start + i, "valid": False, "errors": errors}
+
+
+def iter_columnar_results(
+    plan: ValidationPlan,
+    records,
+    batch_size: int = COLUMNAR_BATCH_ROWS,
+    unique_seen: UniqueTrackers = None,
+    verdicts: VerdictCaches = None
+):
+    """
+    Validates positional records column by column in batches of
+    `batch_size` rows and yields the same per-row results as plan runs.
+    """
+    if np is None:
+        raise RuntimeError("numpy is required for the columnar validation engine")
+
+    records = iter(records)
+    trackers = UniqueTrackers() if unique_seen is None else unique_seen
+    unique_checks = {f: duplicate_check(trackers[f]) for f in plan.unique_fields}
+    checks = verdicts.checks_for(plan) if verdicts is not None else {}
+    start = 1
+
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            break
+
+        yield from _validate_batch(plan, batch, start, unique_checks, checks)
+        start += len(batch)
+
+    logger.debug(f"Columnar validation completed | rows={start - 1}")
@@ -0,0 +1,85 @@
+import csv
+import io
+import logging
+import zlib
+from typing import Iterator, List
+
+from source.constants.constants import ENCODING, REPORT_BATCH_ROWS
+
+logger = logging.getLogger(__name__)
+
+VALID_COLUMN = "_valid"
+ERRORS_COLUMN = "_errors"
+# Added when only failing rows are written, so they can be found in the original
+ROW_COLUMN = "_row"
+
+
+def format_errors(errors: dict) -> str:
+    return "; ".join(f"{field}: {message}" for field, message in errors.items())
+
+
+def iter_report(
+    header: List[str],
+    records,
+    results,
+    only_invalid: bool = False,
+    batch_rows: int = REPORT_BATCH_ROWS
+) -> Iterator[str]:
+    """
+    CSV text of a validated file: every data record (or only failing ones)
+    followed by `_valid` and `_errors`. `records` are the file's data records
+    and `results` the validator's results for them, both read lazily and
+    consumed in step. Records are padded or cut to the header's width so the
+    added columns line up. Both iterators are closed when the report ends
+    or the consumer stops early.
+    """
+    width = len(header)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    columns = [ROW_COLUMN] if only_invalid else []
+    writer.writerow(header + columns + [VALID_COLUMN, ERRORS_COLUMN])
+    pending = 0
+    written = 0
+
+    try:
+        for record, result in zip(records, results, strict=True):
+            if only_invalid and result["valid"]:
+                continue
+
+            cells = record[:width] + [""] * (width - len(record))
+            if only_invalid:
+                cells.append(result["row"])
+            cells.append("true" if result["valid"] else "false")
+            cells.append(format_errors(result["errors"]))
+            writer.writerow(cells)
+
+            written += 1
+            pending += 1
+            if pending >= batch_rows:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+
+    finally:
+        for source in (records, results):
+            close = getattr(source, "close", None)
+            if close is not None:
+                close()
+
+    logger.info(f"Validation report completed | rows={written} | only_invalid={only_invalid}")
+    yield buffer.getvalue()
+
+
+def gzip_chunks(chunks: Iterator[str], level: int = 6) -> Iterator[bytes]:
+    """Streams `chunks` as one gzip member, compressing as they arrive."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    try:
+        for chunk in chunks:
+            data = compressor.compress(chunk.encode(ENCODING))
+            if data:
+                yield data
+    finally:
+        chunks.close()
+    yield compressor.flush()
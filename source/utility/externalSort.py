@@ -0,0 +1,131 @@
+import heapq
+import logging
+import os
+import shutil
+import sys
+import tempfile
+
+from source.constants.constants import (
+    UNIQUE_SPILL_BUDGET_BYTES,
+    UNIQUE_SPILL_DIR,
+    SPILL_MERGE_FAN_IN,
+    SPILL_READ_RECORDS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def split_budget(parts: int) -> int:
+    """Share of UNIQUE_SPILL_BUDGET_BYTES for each of `parts` sorters buffering at once."""
+    return max(UNIQUE_SPILL_BUDGET_BYTES // parts, 1)
+
+
+class ExternalSorter:
+    """
+    Sorts fixed-width byte records under a memory budget. Records are
+    buffered in memory; once the buffer exceeds `budget_bytes` it is sorted
+    and written to a run file, and sorted() merges the runs. Records compare
+    as bytes, so callers pack keys big-endian.
+    """
+
+    def __init__(
+        self,
+        record_size: int,
+        budget_bytes: int = None,
+        tmp_dir: str = None,
+        fan_in: int = SPILL_MERGE_FAN_IN
+    ):
+        self.record_size = record_size
+        self.budget_bytes = budget_bytes or UNIQUE_SPILL_BUDGET_BYTES
+        self.tmp_dir = tmp_dir or UNIQUE_SPILL_DIR
+        self.fan_in = fan_in
+        self.peak_bytes = 0
+        self.spilled_bytes = 0
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._runs = []
+        self._run_files = 0
+        self._dir = None
+
+    def add(self, record: bytes):
+        self._buffer.append(record)
+        # Object size plus its list slot
+        self._buffer_bytes += sys.getsizeof(record) + 8
+        if self._buffer_bytes > self.peak_bytes:
+            self.peak_bytes = self._buffer_bytes
+        if self._buffer_bytes >= self.budget_bytes:
+            self._spill()
+
+    def _run_path(self) -> str:
+        if self._dir is None:
+            self._dir = tempfile.mkdtemp(prefix="unique-spill-", dir=self.tmp_dir)
+        self._run_files += 1
+        return os.path.join(self._dir, f"run-{self._run_files}.bin")
+
+    def _write_run(self, records) -> str:
+        path = self._run_path()
+        written = 0
+        with open(path, "wb") as f:
+            for record in records:
+                f.write(record)
+                written += 1
+        self.spilled_bytes += written * self.record_size
+        return path
+
+    def _spill(self):
+        if not self._buffer:
+            return
+        self._buffer.sort()
+        self._runs.append(self._write_run(self._buffer))
+        self._buffer = []
+        self._buffer_bytes = 0
+
+    def _read_run(self, path: str):
+        size = self.record_size
+        with open(path, "rb") as f:
+            while True:
+                block = f.read(size * SPILL_READ_RECORDS)
+                if not block:
+                    break
+                for i in range(0, len(block), size):
+                    yield block[i:i + size]
+
+    def sorted(self):
+        """Yields all records in ascending order."""
+        if not self._runs:
+            self._buffer.sort()
+            yield from self._buffer
+            return
+
+        self._spill()
+
+        # Bounded number of open files: merge runs in groups first
+        while len(self._runs) > self.fan_in:
+            groups = [self._runs[i:i + self.fan_in] for i in range(0, len(self._runs), self.fan_in)]
+            self._runs = []
+            for group in groups:
+                merged = self._write_run(heapq.merge(*(self._read_run(p) for p in group)))
+                for path in group:
+                    os.remove(path)
+                self._runs.append(merged)
+
+        logger.debug(
+            f"External sort merge | runs={len(self._runs)} | spilled_bytes={self.spilled_bytes}"
+        )
+        yield from heapq.merge(*(self._read_run(p) for p in self._runs))
+
+    def nbytes(self) -> int:
+        return self.peak_bytes
+
+    def close(self):
+        self._buffer = []
+        self._runs = []
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._dir = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,12 +1,33 @@
 import logging
+import gzip
+import hashlib
+import io
 import json
 import csv
-from typing import List, Dict
+import zlib
+from typing import List, Dict, BinaryIO, Iterable, Iterator, Optional, TextIO, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional: only zstd-compressed uploads need it
+    zstandard = None
 
 from source.constants.constants import ENCODING
 
 logger = logging.getLogger(__name__)
 
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Raised while reading a corrupt or truncated compressed stream
+DECOMPRESSION_ERRORS = (gzip.BadGzipFile, EOFError, zlib.error) + (
+    (zstandard.ZstdError,) if zstandard is not None else ()
+)
+
+
+class UnsupportedCompression(ValueError):
+    pass
+
 
 def load_json_file(file_path: str) -> dict:
     logger.debug(f"Loading JSON file | path={file_path}")
@@ -20,19 +41,231 @@ def load_json_file(file_path: str) -> dict:
         raise
 
 
+class TeeReader(io.RawIOBase):
+    """
+    Raw stream that copies every chunk read from `source` into `sink`.
+    Lets an upload be written to disk and parsed in the same pass.
+    """
+
+    def __init__(self, source: BinaryIO, sink: BinaryIO):
+        self.source = source
+        self.sink = sink
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.source.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        if size:
+            self.sink.write(data)
+        return size
+
+
+class MultiSink:
+    """Writes every chunk to each of `sinks`, for a TeeReader feeding several consumers."""
+
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+    def write(self, data) -> int:
+        for sink in self.sinks:
+            sink.write(data)
+        return len(data)
+
+
+class RangeReader(io.RawIOBase):
+    """Raw stream over the byte range [start, end) of a binary file."""
+
+    def __init__(self, source: BinaryIO, start: int, end: int):
+        self.source = source
+        self.source.seek(start)
+        self.remaining = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self.remaining <= 0:
+            return 0
+        data = self.source.read(min(len(buffer), self.remaining))
+        size = len(data)
+        buffer[:size] = data
+        self.remaining -= size
+        return size
+
+
+class ConcatReader(io.RawIOBase):
+    """Raw stream over several files read back to back, one open at a time."""
+
+    def __init__(self, paths: List[str]):
+        self.paths = iter(paths)
+        self.current = None
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while True:
+            if self.current is None:
+                path = next(self.paths, None)
+                if path is None:
+                    return 0
+                self.current = open(path, "rb")
+
+            size = self.current.readinto(buffer)
+            if size:
+                return size
+            self.current.close()
+            self.current = None
+
+    def close(self):
+        if self.current is not None:
+            self.current.close()
+            self.current = None
+        super().close()
+
+
+def file_sha256(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def detect_compression(head: bytes) -> Optional[str]:
+    """"gzip" or "zstd" from the leading bytes of a file, None for plain text."""
+    if head.startswith(GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(ZSTD_MAGIC):
+        return "zstd"
+    return None
+
+
+def file_compression(file_path: str) -> Optional[str]:
+    with open(file_path, "rb") as f:
+        return detect_compression(f.read(len(ZSTD_MAGIC)))
+
+
+def _zstd_reader(source: BinaryIO) -> BinaryIO:
+    if zstandard is None:
+        raise UnsupportedCompression("zstd compressed files require the zstandard package")
+    return zstandard.ZstdDecompressor().stream_reader(source, read_across_frames=True)
+
+
+def decompressing_reader(source: io.BufferedReader) -> BinaryIO:
+    """
+    Wraps `source` in a streaming decompressor when it starts with a gzip or
+    zstd magic number; plain input is returned as is. Both decompressors read
+    `source` to its end, across concatenated members/frames.
+    """
+    compression = detect_compression(source.peek(len(ZSTD_MAGIC)))
+
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=source, mode="rb")
+    if compression == "zstd":
+        return _zstd_reader(source)
+    return source
+
+
+def open_csv_binary(file_path: str) -> BinaryIO:
+    """Decompressed bytes of a stored CSV, which may be gzip or zstd compressed."""
+    compression = file_compression(file_path)
+
+    if compression == "gzip":
+        return gzip.open(file_path, "rb")
+    if compression == "zstd":
+        f = open(file_path, "rb")
+        try:
+            # Closes `f` when closed
+            return io.BufferedReader(_zstd_reader(f))
+        except Exception:
+            f.close()
+            raise
+    return open(file_path, "rb")
+
+
+def open_csv_text(file_path: str) -> TextIO:
+    return io.TextIOWrapper(open_csv_binary(file_path), encoding=ENCODING, newline="")
+
+
+def open_tee_text(source: BinaryIO, sink: BinaryIO, chunk_size: int) -> TextIO:
+    """
+    Text stream over the decompressed `source` while the bytes as received
+    (compressed or not) are copied into `sink`.
+    """
+    raw = TeeReader(source, sink)
+    return io.TextIOWrapper(
+        decompressing_reader(io.BufferedReader(raw, buffer_size=chunk_size)),
+        encoding=ENCODING,
+        newline=""
+    )
+
+
+def scan_csv_stream(
+    stream: Iterable[str],
+    sample_size: int
+) -> Tuple[List[str], int, List[Dict[str, str]]]:
+    reader = csv.DictReader(stream)
+    headers = reader.fieldnames or []
+    row_count = 0
+    sample_rows: List[Dict[str, str]] = []
+
+    for row in reader:
+        row_count += 1
+        if len(sample_rows) < sample_size:
+            sample_rows.append(row)
+
+    return headers, row_count, sample_rows
+
+
+def iter_csv_rows(file_path: str) -> Iterator[Dict[str, str]]:
+    logger.debug(f"Streaming CSV file | path={file_path}")
+
+    with open_csv_text(file_path) as f:
+        reader = csv.DictReader(f)
+
+        for row in reader:
+            yield {
+                k: "" if v is None else str(v).strip()
+                for k, v in row.items()
+            }
+
+
+def iter_csv_records(file_path: str) -> Iterator[List[str]]:
+    """
+    Yields the header record followed by the raw data records.
+    Blank lines are skipped the same way csv.DictReader skips them.
+    """
+    logger.debug(f"Streaming CSV records | path={file_path}")
+
+    with open_csv_text(file_path) as f:
+        reader = csv.reader(f)
+
+        header = next(reader, None)
+        if header is None:
+            return
+        yield header
+
+        for record in reader:
+            if record:
+                yield record
+
+
+def count_csv_rows(file_path: str) -> int:
+    """Data rows of a CSV as the readers see them (blank lines skipped)."""
+    records = iter_csv_records(file_path)
+    next(records, None)
+    return sum(1 for _ in records)
+
+
 def read_csv_rows(file_path: str) -> List[Dict[str, str]]:
     logger.debug(f"Reading CSV file | path={file_path}")
-    rows: List[Dict[str, str]] = []
 
     try:
-        with open(file_path, newline="", encoding=ENCODING) as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                rows.append({
-                    k: "" if v is None else str(v).strip()
-                    for k, v in row.items()
-                })
+        rows = list(iter_csv_rows(file_path))
 
         logger.debug(
             f"CSV file read successfully | path={file_path} | rows={len(rows)}"
@@ -0,0 +1,274 @@
+import json
+import logging
+import os
+import uuid
+from array import array
+from bisect import bisect_left
+from hashlib import blake2b
+
+try:
+    import numpy as np
+except ImportError:  # optional: sorts the verdict keys without numpy too
+    np = None
+
+from source.constants.constants import ENCODING, ROW_VERDICT_DIR, VALIDATION_ENGINE_VERSION
+from source.utility.uniqueTracker import UniqueTrackers, duplicate_check
+from source.utility.validationPlan import EMPTY, ValidationPlan
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"RVS1\n"
+
+
+_SEPARATOR = "\x1f"
+
+
+def row_digest(record: list) -> int:
+    """
+    64-bit digest of a CSV record. Cells are joined with the unit separator;
+    records containing it are hashed through repr() so distinct records
+    never share an encoding.
+    """
+    joined = _SEPARATOR.join(record)
+    if joined.count(_SEPARATOR) != len(record) - 1:
+        joined = repr(record)
+    return int.from_bytes(blake2b(joined.encode(ENCODING), digest_size=8).digest(), "big")
+
+
+def store_path(seller_id: str, plan_key) -> str:
+    """Verdict store of a seller's uploads under one template and mapping (by Files ids)."""
+    seller = blake2b(seller_id.encode(ENCODING), digest_size=8).hexdigest()
+    template_file_id, mapping_file_id = plan_key
+    return str(ROW_VERDICT_DIR / f"{seller}-{template_file_id}-{mapping_file_id}.rvs")
+
+
+def store_key(csv_headers) -> dict:
+    """
+    What a stored verdict depends on besides the row: the CSV header (like
+    the plan cache key, since renamed or reordered columns change what each
+    cell is validated as) and the validation engine version.
+    """
+    return {"engine_version": VALIDATION_ENGINE_VERSION, "header": list(csv_headers)}
+
+
+class RowVerdictStore:
+    """
+    Row verdicts (errors without uniqueness) of one validated CSV, keyed by
+    row_digest: a sorted array of digests, a parallel array of indexes into
+    the distinct error dicts, 12 bytes per row.
+
+    File layout: magic line, a JSON header line ({"key", "rows",
+    "verdicts"}), then the digest and index arrays.
+    """
+
+    def __init__(self, digests: array, indexes: array, verdicts: list):
+        self.digests = digests
+        self.indexes = indexes
+        self.verdicts = verdicts
+
+    def __len__(self) -> int:
+        return len(self.digests)
+
+    def get(self, digest: int):
+        i = bisect_left(self.digests, digest)
+        if i < len(self.digests) and self.digests[i] == digest:
+            return self.verdicts[self.indexes[i]]
+        return None
+
+    @classmethod
+    def load(cls, path: str, key: dict = None):
+        """
+        The store at `path`, or None when there is none, it is unreadable or
+        it was written under a different store_key than `key`.
+        """
+        try:
+            with open(path, "rb") as f:
+                if f.readline() != _MAGIC:
+                    return None
+                header = json.loads(f.readline())
+                if header.get("key") != key:
+                    logger.info(f"Row verdict store key changed, not reused | path={path}")
+                    return None
+                count = header["rows"]
+                digests = array("Q")
+                digests.fromfile(f, count)
+                indexes = array("I")
+                indexes.fromfile(f, count)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, KeyError):
+            logger.warning(f"Unreadable row verdict store ignored | path={path}")
+            return None
+
+        return cls(digests, indexes, header["verdicts"])
+
+
+def _sorted_unique(digests: array, indexes: array):
+    """
+    Sorts the parallel digest and index arrays together by digest and keeps
+    the first entry of each digest.
+    """
+    if not digests:
+        return digests, indexes
+
+    if np is not None:
+        d = np.frombuffer(digests, dtype=np.uint64)
+        order = np.argsort(d, kind="stable")
+        d = d[order]
+        keep = np.empty(len(d), dtype=bool)
+        keep[0] = True
+        np.not_equal(d[1:], d[:-1], out=keep[1:])
+        return d[keep], np.frombuffer(indexes, dtype=np.uint32)[order][keep]
+
+    order = sorted(range(len(digests)), key=digests.__getitem__)
+    unique_digests, unique_indexes = array("Q"), array("I")
+    for i in order:
+        if unique_digests and unique_digests[-1] == digests[i]:
+            continue
+        unique_digests.append(digests[i])
+        unique_indexes.append(indexes[i])
+    return unique_digests, unique_indexes
+
+
+class RowVerdictWriter:
+    """Collects (digest, verdict) pairs of a run and writes them as a RowVerdictStore."""
+
+    def __init__(self, key: dict = None):
+        self.key = key
+        self._digests = array("Q")
+        self._indexes = array("I")
+        # Index 0 is the verdict of valid rows
+        self._verdicts = [{}]
+        self._verdict_index = {(): 0}
+
+    def add(self, digest: int, errors: dict):
+        index = 0
+        if errors:
+            key = tuple(errors.items())
+            index = self._verdict_index.get(key)
+            if index is None:
+                index = self._verdict_index[key] = len(self._verdicts)
+                self._verdicts.append(errors)
+        self._digests.append(digest)
+        self._indexes.append(index)
+
+    def save(self, path: str):
+        digests, indexes = _sorted_unique(self._digests, self._indexes)
+        header = {"key": self.key, "rows": len(digests), "verdicts": self._verdicts}
+
+        # Readers never see a partially written store; concurrent runs never share a temp file
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_MAGIC)
+                f.write(json.dumps(header).encode(ENCODING) + b"\n")
+                digests.tofile(f)
+                indexes.tofile(f)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class RowVerdicts:
+    """
+    Row verdict state of one incremental validation: the previous upload's
+    store at `path` (if any, and only when written for the same CSV header
+    and engine version) and the writer for this upload's verdicts, which
+    replace it once the run completes. open() is called with the CSV header
+    before the first row. Inspect with stats().
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.previous = None
+        self.writer = RowVerdictWriter()
+        self.reused = 0
+        self.validated = 0
+
+    def open(self, csv_headers):
+        key = store_key(csv_headers)
+        self.previous = RowVerdictStore.load(self.path, key)
+        self.writer = RowVerdictWriter(key)
+
+    def save(self):
+        self.writer.save(self.path)
+        logger.info(
+            f"Row verdict store saved | path={self.path} | reused={self.reused} | validated={self.validated}"
+        )
+
+    def stats(self) -> dict:
+        return {
+            "previous_rows": len(self.previous) if self.previous is not None else 0,
+            "reused": self.reused,
+            "validated": self.validated
+        }
+
+
+class IncrementalRun:
+    """
+    Compiled-plan run that reuses verdicts of unchanged rows from the
+    previous upload and validates only new or changed rows. Rows are keyed
+    by the digest of the whole record, so an unchanged row is never parsed
+    into mapped values. Uniqueness is still checked on every row, in file
+    order, so results equal a full run; rows with a duplicate are
+    re-validated to keep their error order.
+    """
+
+    def __init__(self, plan: ValidationPlan, row_verdicts: RowVerdicts, unique_seen: UniqueTrackers = None, verdicts=None):
+        trackers = UniqueTrackers() if unique_seen is None else unique_seen
+        checks = verdicts.checks_for(plan) if verdicts is not None else {}
+
+        self.row_verdicts = row_verdicts
+        self.unique_seen = {f: trackers[f] for f in plan.unique_fields}
+        # Unmapped unique fields are always empty and never duplicates
+        self.unique_cells = [
+            (field, plan.keys[pos], checks.get(field, check), duplicate_check(self.unique_seen[field]))
+            for field, pos, _, check in plan.fields
+            if field in self.unique_seen and pos != EMPTY
+        ]
+        self.duplicates = duplicates = set()
+        self.validate_base = plan.row_validator({}, checks)
+        # Replays the duplicate decisions already taken for the current row
+        self.validate_with_duplicates = plan.row_validator(
+            {field: (lambda _value, field=field: field in duplicates) for field in plan.unique_fields},
+            checks
+        )
+
+    def results(self, records, start: int = 1):
+        """Yields results like PlanRun.results; saves the new store after the last row."""
+        row_verdicts = self.row_verdicts
+        previous = row_verdicts.previous
+        writer = row_verdicts.writer
+        unique_cells = self.unique_cells
+        duplicates = self.duplicates
+        validate_base = self.validate_base
+
+        for idx, record in enumerate(records, start=start):
+            if duplicates:
+                duplicates.clear()
+            for field, key, check, is_duplicate in unique_cells:
+                try:
+                    value = record[key].strip()
+                except IndexError:
+                    continue
+                if value and check(value) and is_duplicate(value):
+                    duplicates.add(field)
+
+            digest = row_digest(record)
+            base = previous.get(digest) if previous is not None else None
+            if base is None:
+                base = validate_base(record)
+                row_verdicts.validated += 1
+            else:
+                row_verdicts.reused += 1
+            writer.add(digest, base)
+
+            errors = self.validate_with_duplicates(record) if duplicates else dict(base)
+            yield {
+                "row": idx,
+                "valid": not errors,
+                "errors": errors
+            }
+
+        row_verdicts.save()
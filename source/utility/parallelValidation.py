@@ -0,0 +1,288 @@
+import csv
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from source.constants.constants import (
+    ENCODING,
+    PARALLEL_WORKERS,
+    PARALLEL_MIN_SHARD_BYTES,
+    SHARD_SCAN_BLOCK_SIZE,
+)
+from source.utility.fileHelper import RangeReader, iter_csv_records, count_csv_rows
+from source.utility.uniqueTracker import UniqueTrackers, duplicate_check
+from source.utility.validationPlan import compile_plan
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE = "Duplicate value"
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # spawn: forking a threaded server process is not safe
+            _executor = ProcessPoolExecutor(
+                max_workers=PARALLEL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Validation process pool started | workers={PARALLEL_WORKERS}")
+        return _executor
+
+
+def shutdown_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(cancel_futures=True)
+            _executor = None
+            logger.info("Validation process pool stopped")
+
+
+def find_row_boundaries(f, targets: list, block_size: int = SHARD_SCAN_BLOCK_SIZE) -> list:
+    """
+    For each target byte offset, returns the offset just past the first
+    newline at or after it that lies outside a quoted field.
+
+    A newline is outside quotes when the number of '"' before it is even,
+    which holds for RFC 4180 CSVs (escaped quotes come in pairs).
+    """
+    targets = sorted(targets)
+    boundaries = []
+    parity = 0
+    base = 0
+    ti = 0
+
+    f.seek(0)
+    while ti < len(targets):
+        block = f.read(block_size)
+        if not block:
+            break
+
+        local = parity
+        cursor = 0
+        while ti < len(targets):
+            start = max(targets[ti] - base, cursor)
+            if start >= len(block):
+                break
+
+            nl = block.find(b"\n", start)
+            if nl == -1:
+                break
+
+            local = (local + block.count(b'"', cursor, nl)) % 2
+            cursor = nl
+
+            if local == 0:
+                boundary = base + nl + 1
+                boundaries.append(boundary)
+                while ti < len(targets) and targets[ti] < boundary:
+                    ti += 1
+            else:
+                targets[ti] = base + nl + 1
+
+        parity = (parity + block.count(b'"')) % 2
+        base += len(block)
+
+    return boundaries
+
+
+def plan_shards(csv_path: str, shard_count: int, min_shard_bytes: int = PARALLEL_MIN_SHARD_BYTES) -> list:
+    """Splits the data rows of a CSV into newline-aligned (start, end) byte ranges."""
+    size = os.path.getsize(csv_path)
+
+    with open(csv_path, "rb") as f:
+        header_end = find_row_boundaries(f, [0])
+        data_start = header_end[0] if header_end else size
+        data_size = size - data_start
+
+        shard_count = max(1, min(shard_count, data_size // min_shard_bytes))
+        targets = [
+            data_start + data_size * k // shard_count
+            for k in range(1, shard_count)
+        ]
+        cuts = find_row_boundaries(f, targets) if targets else []
+
+    edges = [data_start] + sorted(set(c for c in cuts if data_start < c < size)) + [size]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def validate_shard(csv_path, start, end, template_fields, mapping, header):
+    """
+    Worker: validates rows in [start, end) without global uniqueness.
+
+    Every unique value that passes its own check is recorded as a candidate
+    and provisionally flagged "Duplicate value", so the error dict keeps the
+    key order of a sequential run; the parent drops the flags that turn out
+    not to be duplicates. Returns the row count, the rows with other errors
+    as (local_row, errors, flagged_fields) and the candidates per field.
+    """
+    plan = compile_plan(template_fields, mapping, header)
+    current = [0]
+    flagged = []
+    candidates = {f: [] for f in plan.unique_fields}
+
+    def recorder(field):
+        found = candidates[field]
+
+        def is_duplicate(value) -> bool:
+            found.append((current[0], value))
+            flagged.append(field)
+            return True
+
+        return is_duplicate
+
+    validate_row = plan.row_validator({f: recorder(f) for f in plan.unique_fields})
+    invalid = []
+
+    with open(csv_path, "rb") as raw:
+        stream = io.TextIOWrapper(
+            io.BufferedReader(RangeReader(raw, start, end)),
+            encoding=ENCODING,
+            newline=""
+        )
+        for record in csv.reader(stream):
+            if not record:
+                continue
+            current[0] += 1
+            errors = validate_row(record)
+
+            if flagged:
+                if len(errors) > len(flagged) or any(errors[f] != DUPLICATE for f in flagged):
+                    invalid.append((current[0], errors, tuple(flagged)))
+                flagged.clear()
+            elif errors:
+                invalid.append((current[0], errors, ()))
+
+    return current[0], invalid, candidates
+
+
+def _resolve_flags(errors: dict, flagged, duplicates: set) -> dict:
+    for field in flagged:
+        if field in duplicates:
+            continue
+        if errors.get(field) == DUPLICATE:
+            del errors[field]
+        else:
+            # Overridden by the price/mrp cross-check, which a sequential
+            # run appends after the field errors
+            errors[field] = errors.pop(field)
+    return errors
+
+
+def _merged_results(shards, futures, field_order, unique_seen: UniqueTrackers):
+    unique_checks = {}
+    row_base = 0
+
+    for (start, end), future in zip(shards, futures):
+        row_count, invalid, candidates = future.result()
+
+        duplicates = {}
+        for field, pairs in candidates.items():
+            if field not in unique_checks:
+                unique_checks[field] = duplicate_check(unique_seen[field])
+            is_duplicate = unique_checks[field]
+            for local_row, value in pairs:
+                if is_duplicate(value):
+                    duplicates.setdefault(local_row, set()).add(field)
+
+        errors_by_row = {
+            local_row: _resolve_flags(errors, flagged, duplicates.get(local_row, ()))
+            for local_row, errors, flagged in invalid
+        }
+        for local_row, fields in duplicates.items():
+            if local_row not in errors_by_row:
+                errors_by_row[local_row] = {f: DUPLICATE for f in field_order if f in fields}
+
+        for local_row in range(1, row_count + 1):
+            errors = errors_by_row.get(local_row, {})
+            yield {
+                "row": row_base + local_row,
+                "valid": not errors,
+                "errors": errors
+            }
+
+        row_base += row_count
+
+
+class _Done:
+    """Future-like wrapper for a shard validated in-process."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def result(self):
+        return self.value
+
+
+def _sequential_results(csv_path, template_fields, mapping, header, unique_seen):
+    records = iter_csv_records(csv_path)
+    next(records, None)
+    plan = compile_plan(template_fields, mapping, header)
+    return plan.new_run(unique_seen).results(records)
+
+
+def iter_parallel_results(
+    csv_path: str,
+    template_fields: dict,
+    mapping: dict,
+    header: list,
+    workers: int = PARALLEL_WORKERS,
+    min_shard_bytes: int = PARALLEL_MIN_SHARD_BYTES,
+    unique_seen: UniqueTrackers = None,
+    expected_rows: int = None
+):
+    """
+    Validates byte-range shards of a stored CSV in the process pool and
+    yields results in file order with global row numbers. Duplicates of
+    `unique` fields are resolved in the parent in row order, so they match
+    a sequential run exactly.
+
+    Shard edges rely on quote parity, which a stray '"' inside an unquoted
+    field breaks. The shard row counts are therefore checked against
+    `expected_rows` (the CSV parser's count; counted here when None) before
+    anything is yielded, and the file is validated sequentially when they
+    disagree.
+    """
+    plan = compile_plan(template_fields, mapping, header)
+    field_order = [field for field, _, _, _ in plan.fields]
+    if unique_seen is None:
+        unique_seen = UniqueTrackers()
+    if expected_rows is None:
+        expected_rows = count_csv_rows(csv_path)
+
+    shards = plan_shards(csv_path, workers * 2, min_shard_bytes)
+    logger.info(f"Parallel validation started | path={csv_path} | shards={len(shards)}")
+
+    if len(shards) == 1:
+        start, end = shards[0]
+        futures = [_Done(validate_shard(csv_path, start, end, template_fields, mapping, header))]
+    else:
+        executor = get_executor()
+        futures = [
+            executor.submit(validate_shard, csv_path, start, end, template_fields, mapping, header)
+            for start, end in shards
+        ]
+
+    try:
+        sharded_rows = sum(future.result()[0] for future in futures)
+        if sharded_rows != expected_rows:
+            logger.warning(
+                f"Shard rows do not match CSV rows, validating sequentially | path={csv_path} | "
+                f"sharded_rows={sharded_rows} | expected_rows={expected_rows}"
+            )
+            yield from _sequential_results(csv_path, template_fields, mapping, header, unique_seen)
+            return
+
+        yield from _merged_results(shards, futures, field_order, unique_seen)
+    finally:
+        for future in futures:
+            if not isinstance(future, _Done):
+                future.cancel()
@@ -0,0 +1,225 @@
+import csv
+import logging
+import math
+import random
+from statistics import NormalDist
+
+from source.constants.constants import PREVIEW_CONFIDENCE
+from source.utility.fileHelper import open_csv_text
+from source.utility.rowIndex import read_indexed_rows, read_indexed_sample
+from source.utility.validationPlan import compile_plan
+
+logger = logging.getLogger(__name__)
+
+# Counted alongside field keys for the share of rows with any error
+INVALID_ROW = "_row"
+
+_Z = NormalDist().inv_cdf((1 + PREVIEW_CONFIDENCE) / 2)
+
+
+def _read_head(reader, head_rows: int) -> list:
+    head = []
+    while len(head) < head_rows:
+        record = next(reader, None)
+        if record is None:
+            break
+        if record:
+            head.append(record)
+    return head
+
+
+def _stream_sample(csv_path: str, head_rows: int, sample_size: int, rng: random.Random):
+    """
+    sample_records for CSVs without a row index (compressed or older
+    uploads): the rest of the file is read once and reservoir sampled, which
+    also counts its rows. With no sample to draw the rest is not read, and
+    its row count is None when any rows remain.
+    """
+    with open_csv_text(csv_path) as f:
+        reader = csv.reader(f)
+
+        header = next(reader, None)
+        if header is None:
+            return [], [], [], 0
+
+        head = _read_head(reader, head_rows)
+
+        if not sample_size:
+            more = next(filter(None, reader), None) is not None
+            return header, head, [], None if more else 0
+
+        sample = []
+        tail_rows = 0
+        for record in reader:
+            if not record:
+                continue
+            tail_rows += 1
+            if len(sample) < sample_size:
+                sample.append(record)
+            else:
+                slot = rng.randrange(tail_rows)
+                if slot < sample_size:
+                    sample[slot] = record
+
+    return header, head, sample, tail_rows
+
+
+def sample_records(csv_path: str, head_rows: int, sample_size: int, rng: random.Random = None):
+    """
+    Reads the header and the first `head_rows` records, then draws up to
+    `sample_size` distinct records uniformly from the rest. Returns
+    (header, head, sample, tail_rows) where tail_rows counts the records
+    past the head (None when unknown). Records are taken as parsed, whatever
+    their width. CSVs with a row index are sampled through it without
+    reading the rest of the file.
+    """
+    rng = rng or random.Random()
+
+    indexed = read_indexed_rows(csv_path, 1, head_rows)
+    if indexed is not None:
+        sampled = read_indexed_sample(csv_path, head_rows, sample_size, rng)
+        if sampled is not None:
+            header, head, total = indexed
+            _, sample, _ = sampled
+            return header, head, sample, total - len(head)
+
+    return _stream_sample(csv_path, head_rows, sample_size, rng)
+
+
+def wilson_interval(p: float, n: float, z: float = _Z):
+    """Wilson score interval for a proportion `p` observed over `n` trials."""
+    if n <= 0:
+        return 0.0, 1.0
+    z2 = z * z
+    denom = 1 + z2 / n
+    centre = (p + z2 / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def _count(counts: dict, errors: dict, weight):
+    if not errors:
+        return
+    counts[INVALID_ROW] = counts.get(INVALID_ROW, 0) + weight
+    for key in errors:
+        counts[key] = counts.get(key, 0) + weight
+
+
+class RateEstimator:
+    """
+    Error rates over a file from its first rows (counted exactly) and a
+    uniform random sample of the remaining `tail_rows` rows. Intervals are
+    Wilson intervals over the sample, mapped through the head/tail mix, and
+    collapse to the observed rate once every row has been checked. A tail
+    with no sampled rows is unmeasured: every rate interval spans 0..1, and
+    the row count is unknown when `tail_rows` is None.
+    """
+
+    def __init__(self, tail_rows):
+        self.tail_rows = tail_rows
+        self.head_rows = 0
+        self.head_errors = {}
+        self.sampled_rows = 0
+        self.tail_errors = {}
+
+    def add_head(self, errors: dict):
+        self.head_rows += 1
+        _count(self.head_errors, errors, 1)
+
+    def add_sample(self, errors: dict):
+        self.sampled_rows += 1
+        _count(self.tail_errors, errors, 1)
+
+    @property
+    def exact(self) -> bool:
+        return self.tail_rows == 0
+
+    @property
+    def unmeasured(self) -> bool:
+        return self.tail_rows != 0 and not self.sampled_rows
+
+    def estimated_rows(self):
+        if self.tail_rows is None:
+            return None
+        return self.head_rows + self.tail_rows
+
+    def rate(self, key) -> dict:
+        head_errors = self.head_errors.get(key, 0)
+
+        if self.unmeasured:
+            estimate = round(head_errors / self.head_rows, 6) if self.head_rows else 0.0
+            return {"estimate": estimate, "low": 0.0, "high": 1.0}
+
+        tail_rows = self.tail_rows
+        rows = self.head_rows + tail_rows
+        if not rows:
+            return {"estimate": 0.0, "low": 0.0, "high": 0.0}
+
+        if tail_rows:
+            tail_rate = self.tail_errors.get(key, 0) / self.sampled_rows
+            low, high = wilson_interval(tail_rate, self.sampled_rows)
+        else:
+            tail_rate = low = high = 0.0
+
+        def mixed(r):
+            return round((head_errors + r * tail_rows) / rows, 6)
+
+        if self.sampled_rows >= tail_rows:
+            low = high = tail_rate
+        return {"estimate": mixed(tail_rate), "low": mixed(low), "high": mixed(high)}
+
+
+def preview_file(
+    csv_path,
+    mapping,
+    template_fields,
+    head_rows: int,
+    sample_size: int,
+    plan_key=None,
+    rng: random.Random = None
+) -> dict:
+    """
+    Validates the first `head_rows` rows and a random sample of the rest
+    with the same compiled checks as a full run, and estimates per-field
+    error rates. Uniqueness is not checked: duplicates need every row.
+    """
+    header, head, sample, tail_rows = sample_records(csv_path, head_rows, sample_size, rng)
+
+    estimator = RateEstimator(tail_rows)
+    head_results = []
+
+    if head or sample:
+        plan = compile_plan(template_fields, mapping, header, cache_key=plan_key)
+        validate_row = plan.row_validator({})
+
+        for idx, record in enumerate(head, start=1):
+            errors = validate_row(record)
+            estimator.add_head(errors)
+            if errors:
+                head_results.append({"row": idx, "valid": False, "errors": errors})
+
+        for record in sample:
+            estimator.add_sample(validate_row(record))
+
+        fields = [field for field, _, _, _ in plan.fields]
+        # The price/MRP cross-check reports under "price" even when unmapped
+        if "price" not in fields and (plan.price_pos is not None or plan.mrp_pos is not None):
+            fields.append("price")
+    else:
+        fields = []
+
+    logger.info(
+        f"CSV preview completed | head_rows={estimator.head_rows} | sampled_rows={estimator.sampled_rows} | "
+        f"exact={estimator.exact}"
+    )
+
+    return {
+        "head_rows": estimator.head_rows,
+        "sampled_rows": estimator.sampled_rows,
+        "exact": estimator.exact,
+        "estimated_rows": estimator.estimated_rows(),
+        "confidence": PREVIEW_CONFIDENCE,
+        "invalid_rate": estimator.rate(INVALID_ROW),
+        "field_error_rates": {field: estimator.rate(field) for field in fields},
+        "errors": head_results
+    }
@@ -0,0 +1,222 @@
+import csv
+import io
+import logging
+import mmap
+import os
+import random
+import uuid
+from array import array
+from itertools import islice
+from typing import List, Optional, Tuple
+
+from source.constants.constants import ENCODING
+from source.utility.fileHelper import detect_compression, iter_csv_records
+
+logger = logging.getLogger(__name__)
+
+# Magic plus the array typecode, padded to 8 bytes so the offsets stay aligned
+_MAGIC = b"RIX1"
+_HEADER_SIZE = 8
+
+
+def index_path(csv_path: str) -> str:
+    """Row index stored beside the CSV (blobs are immutable, so it never goes stale)."""
+    return f"{csv_path}.rows"
+
+
+class RowIndexBuilder:
+    """
+    Sink for the stored bytes of an upload that records the byte offset of
+    every data record. A newline ends a record when the number of '"'
+    before it is even, which holds for RFC 4180 CSVs (as in
+    parallelValidation.find_row_boundaries); blank lines are skipped the way
+    the CSV readers skip them. Compressed uploads get no index.
+    """
+
+    def __init__(self):
+        self.size = 0
+        self.parity = 0
+        self.line_start = 0
+        self.last_byte = b""
+        self.header_seen = False
+        self.starts = array("Q")
+        self.disabled = False
+
+    def write(self, data) -> int:
+        if self.disabled:
+            return len(data)
+        if self.size == 0 and detect_compression(bytes(data[:4])) is not None:
+            self.disabled = True
+            return len(data)
+
+        base = self.size
+        cursor = 0
+        while True:
+            nl = data.find(b"\n", cursor)
+            if nl == -1:
+                break
+            self.parity = (self.parity + data.count(b'"', cursor, nl)) % 2
+            cursor = nl + 1
+
+            if self.parity == 0:
+                before = data[nl - 1:nl] if nl else self.last_byte
+                self._end_record(base + nl, before)
+                self.line_start = base + nl + 1
+
+        self.parity = (self.parity + data.count(b'"', cursor)) % 2
+        self.last_byte = data[-1:]
+        self.size += len(data)
+        return len(data)
+
+    def _end_record(self, end: int, before: bytes):
+        length = end - self.line_start
+        if length == 0 or (length == 1 and before == b"\r"):
+            return
+        if self.header_seen:
+            self.starts.append(self.line_start)
+        else:
+            self.header_seen = True
+
+    def finish(self, row_count: int) -> Optional[array]:
+        """
+        Offsets of the data records followed by the file size, or None when
+        the upload was compressed or the scan disagrees with the CSV parser's
+        `row_count` (e.g. a stray quote inside an unquoted field).
+        """
+        if self.disabled:
+            return None
+
+        self._end_record(self.size, self.last_byte)
+        if not self.header_seen or len(self.starts) != row_count:
+            logger.warning(
+                f"Row index skipped | indexed_rows={len(self.starts)} | parsed_rows={row_count}"
+            )
+            return None
+
+        typecode = "I" if self.size < 2 ** 32 else "Q"
+        offsets = array(typecode, self.starts)
+        offsets.append(self.size)
+        return offsets
+
+
+def save_row_index(csv_path: str, offsets: array):
+    path = index_path(csv_path)
+    if os.path.exists(path):
+        # Same content, same index
+        return
+
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_MAGIC + offsets.typecode.encode().ljust(_HEADER_SIZE - len(_MAGIC), b"\0"))
+            offsets.tofile(f)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    logger.info(f"Row index stored | path={path} | rows={len(offsets) - 1}")
+
+
+def _parse(data: bytes) -> List[List[str]]:
+    return [r for r in csv.reader(io.StringIO(data.decode(ENCODING), newline="")) if r]
+
+
+def _load_index(csv_path: str, pick):
+    """
+    (first, size, total, pick(offsets, total)) from the row index of
+    `csv_path`, or None when it has none. `offsets` is an mmap view that is
+    only valid inside `pick`.
+    """
+    path = index_path(csv_path)
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "rb") as f:
+        head = f.read(_HEADER_SIZE)
+        if len(head) < _HEADER_SIZE or not head.startswith(_MAGIC):
+            return None
+        typecode = head[len(_MAGIC):len(_MAGIC) + 1].decode()
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as index_map:
+            view = memoryview(index_map)
+            offsets = view[_HEADER_SIZE:].cast(typecode)
+            try:
+                total = len(offsets) - 1
+                return offsets[0], offsets[total], total, pick(offsets, total)
+            finally:
+                offsets.release()
+                view.release()
+
+
+def _read_spans(csv_path: str, first: int, size: int, spans):
+    """(header, [records parsed from each (begin, end) span]), or None when the CSV does not match its index."""
+    with open(csv_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size != size:
+            logger.warning(f"Row index does not match CSV | path={csv_path}")
+            return None
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as csv_map:
+            header = next(iter(_parse(csv_map[:first])), [])
+            return header, [_parse(csv_map[begin:end]) for begin, end in spans]
+
+
+def read_indexed_rows(csv_path: str, start: int, count: int):
+    """
+    (header, records, total_rows) for data rows start..start+count-1
+    (1-based), read through mmap from the row index; None when the CSV has
+    no usable index.
+    """
+    def pick(offsets, total):
+        return [(offsets[min(start - 1, total)], offsets[min(start - 1 + count, total)])]
+
+    loaded = _load_index(csv_path, pick)
+    if loaded is None:
+        return None
+    first, size, total, spans = loaded
+
+    read = _read_spans(csv_path, first, size, spans)
+    if read is None:
+        return None
+    header, (records,) = read
+    return header, records, total
+
+
+def read_indexed_sample(csv_path: str, skip: int, count: int, rng: random.Random):
+    """
+    (header, records, total_rows) for `count` distinct data rows drawn
+    uniformly from those after the first `skip`, in file order; None when
+    the CSV has no usable index.
+    """
+    def pick(offsets, total):
+        rows = range(skip, total)
+        return [(offsets[i], offsets[i + 1]) for i in sorted(rng.sample(rows, min(count, len(rows))))]
+
+    loaded = _load_index(csv_path, pick)
+    if loaded is None:
+        return None
+    first, size, total, spans = loaded
+
+    read = _read_spans(csv_path, first, size, spans)
+    if read is None:
+        return None
+    header, parsed = read
+    return header, [records[0] for records in parsed], total
+
+
+def read_rows(csv_path: str, start: int, count: int) -> Tuple[List[str], List[List[str]], Optional[int]]:
+    """
+    (header, records, total_rows) for data rows start..start+count-1.
+    Served from the row index when there is one; otherwise the CSV is
+    streamed up to the range and total_rows is None.
+    """
+    indexed = read_indexed_rows(csv_path, start, count)
+    if indexed is not None:
+        return indexed
+
+    records = iter_csv_records(csv_path)
+    try:
+        header = next(records, [])
+        return header, list(islice(records, start - 1, start - 1 + count)), None
+    finally:
+        records.close()
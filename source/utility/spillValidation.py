@@ -0,0 +1,111 @@
+import logging
+import struct
+from hashlib import blake2b
+
+from source.constants.constants import ENCODING
+from source.utility.externalSort import ExternalSorter, split_budget
+from source.utility.uniqueTracker import VALUE_RECORD
+from source.utility.validationPlan import ValidationPlan
+
+logger = logging.getLogger(__name__)
+
+# (row, unique field index, first-occurrence row), ordered by row
+DUPLICATE_RECORD = struct.Struct(">QHQ")
+
+
+def _digest(value: str) -> bytes:
+    return blake2b(value.encode(ENCODING), digest_size=16).digest()
+
+
+def find_duplicates(plan: ValidationPlan, records, unique_seen, start: int = 1) -> ExternalSorter:
+    """
+    First pass: records (digest, row) of every unique value that passes its
+    check in one external sorter per field, then walks each sorted stream.
+    Equal digests are adjacent and ordered by row, so the first row of a
+    run is the first occurrence and the rest are duplicates of it. The
+    field sorters and the duplicate sorter split one spill budget.
+    """
+    steps = [
+        (plan.unique_fields.index(field), pos, check, unique_seen[field])
+        for field, pos, _, check in plan.fields
+        if field in plan.unique_fields
+    ]
+    extract = plan.extract
+    budget = split_budget(len(steps) + 1)
+    for _, _, _, sorter in steps:
+        sorter.budget_bytes = budget
+    duplicates = ExternalSorter(DUPLICATE_RECORD.size, budget_bytes=budget)
+
+    try:
+        for row, record in enumerate(records, start=start):
+            values = extract(record)
+            for _, pos, check, sorter in steps:
+                value = values[pos]
+                if value and check(value):
+                    sorter.add(VALUE_RECORD.pack(_digest(value), row))
+
+        for index, _, _, sorter in steps:
+            previous = None
+            first_row = None
+            for item in sorter.sorted():
+                digest, row = VALUE_RECORD.unpack(item)
+                if digest == previous:
+                    duplicates.add(DUPLICATE_RECORD.pack(row, index, first_row))
+                else:
+                    previous, first_row = digest, row
+    except BaseException:
+        duplicates.close()
+        raise
+    finally:
+        for _, _, _, sorter in steps:
+            sorter.close()
+
+    return duplicates
+
+
+def iter_spill_results(plan: ValidationPlan, open_records, unique_seen, start: int = 1, verdicts=None):
+    """
+    Validates with uniqueness resolved by external sort, so memory stays
+    within the spill budget whatever the input size. `open_records()` must
+    return a fresh iterator over the same records each time: they are read
+    once to find duplicates and once to validate. Duplicate rows carry
+    "duplicate_of" with the first-occurrence row per field.
+    """
+    duplicates = find_duplicates(plan, open_records(), unique_seen, start)
+    unique_fields = plan.unique_fields
+
+    try:
+        current = {}
+        validate_row = plan.row_validator(
+            {
+                field: (lambda value, field=field: field in current)
+                for field in unique_fields
+            },
+            verdicts.checks_for(plan) if verdicts is not None else None
+        )
+
+        pending = (DUPLICATE_RECORD.unpack(item) for item in duplicates.sorted())
+        next_duplicate = next(pending, None)
+
+        for row, record in enumerate(open_records(), start=start):
+            current.clear()
+            while next_duplicate is not None and next_duplicate[0] == row:
+                _, index, first_row = next_duplicate
+                current[unique_fields[index]] = first_row
+                next_duplicate = next(pending, None)
+
+            errors = validate_row(record)
+            result = {
+                "row": row,
+                "valid": not errors,
+                "errors": errors
+            }
+            if current:
+                result["duplicate_of"] = dict(current)
+            yield result
+
+        logger.debug(
+            f"Spill validation completed | spilled_bytes={duplicates.spilled_bytes}"
+        )
+    finally:
+        duplicates.close()
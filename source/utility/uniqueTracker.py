@@ -0,0 +1,198 @@
+import struct
+import sys
+from array import array
+from hashlib import blake2b
+
+from source.constants.constants import ENCODING
+from source.utility.externalSort import ExternalSorter
+
+UNIQUE_TRACKERS = ("set", "digest64", "digest128", "spill")
+
+# Trackers that take `exact`; set compares the values themselves
+DIGEST_TRACKERS = ("digest64", "digest128")
+
+# Spill trackers sort (value digest, row) records, ordered by digest then row
+VALUE_RECORD = struct.Struct(">16sQ")
+
+_MASK64 = (1 << 64) - 1
+
+
+class DigestSet:
+    """
+    Set of strings kept as fixed-width digests in an array-backed
+    open-addressing table (linear probing), 12-24 bytes per value at 64
+    bits instead of a Python str plus its set slot (~100 bytes for a SKU).
+
+    The high 64 bits are the interpreter's str hash (SipHash, cached on the
+    string and stable within the process, which is all a validation run
+    needs); 128-bit digests add 64 bits of blake2b.
+
+    With `exact=True` the value bytes are also packed into one bytearray
+    and compared whenever digests match, so a digest collision can never
+    report a false duplicate. Without it, a false duplicate needs a full
+    64/128-bit digest collision.
+    """
+
+    def __init__(self, bits: int = 64, exact: bool = False, capacity: int = 1024):
+        if bits not in (64, 128):
+            raise ValueError("DigestSet supports 64 or 128-bit digests")
+
+        self.bits = bits
+        self.exact = exact
+        self._size = 0
+        self._allocate(max(8, 1 << (capacity - 1).bit_length()))
+
+        if exact:
+            self._values = bytearray()
+            self._offsets = array("Q", [0])
+
+    def _allocate(self, capacity: int):
+        self._capacity = capacity
+        self._mask = capacity - 1
+        # Slot is empty when its high word is 0; stored high words are never 0
+        self._hi = array("Q", bytes(8 * capacity))
+        self._lo = array("Q", bytes(8 * capacity)) if self.bits == 128 else None
+        self._entry = array("Q", bytes(8 * capacity)) if self.exact else None
+
+    def _digest(self, value: str, data: bytes):
+        hi = (hash(value) & _MASK64) or 1
+        if self._lo is None:
+            return hi, 0
+        return hi, int.from_bytes(blake2b(data, digest_size=8).digest(), "little")
+
+    def _stored(self, slot: int) -> bytes:
+        entry = self._entry[slot]
+        return bytes(self._values[self._offsets[entry]:self._offsets[entry + 1]])
+
+    def _find(self, data: bytes, hi: int, lo: int):
+        """Returns (found, slot); slot is the free slot when not found."""
+        table_hi = self._hi
+        table_lo = self._lo
+        mask = self._mask
+        slot = hi & mask
+
+        while True:
+            stored = table_hi[slot]
+            if stored == 0:
+                return False, slot
+            if (
+                stored == hi
+                and (table_lo is None or table_lo[slot] == lo)
+                and (not self.exact or self._stored(slot) == data)
+            ):
+                return True, slot
+            slot = (slot + 1) & mask
+
+    def _insert(self, slot: int, data: bytes, hi: int, lo: int):
+        self._hi[slot] = hi
+        if self._lo is not None:
+            self._lo[slot] = lo
+        if self.exact:
+            self._entry[slot] = len(self._offsets) - 1
+            self._values += data
+            self._offsets.append(len(self._values))
+
+        self._size += 1
+        if self._size * 3 >= self._capacity * 2:
+            self._grow()
+
+    def _grow(self):
+        old_hi, old_lo, old_entry = self._hi, self._lo, self._entry
+        self._allocate(self._capacity * 2)
+        mask = self._mask
+
+        for i, hi in enumerate(old_hi):
+            if hi == 0:
+                continue
+            slot = hi & mask
+            while self._hi[slot]:
+                slot = (slot + 1) & mask
+            self._hi[slot] = hi
+            if old_lo is not None:
+                self._lo[slot] = old_lo[i]
+            if old_entry is not None:
+                self._entry[slot] = old_entry[i]
+
+    def check_and_add(self, value: str) -> bool:
+        """Adds `value`; returns True when it was already present."""
+        data = value.encode(ENCODING) if self._lo is not None or self.exact else None
+        hi, lo = self._digest(value, data)
+        found, slot = self._find(data, hi, lo)
+        if not found:
+            self._insert(slot, data, hi, lo)
+        return found
+
+    def add(self, value: str):
+        self.check_and_add(value)
+
+    def __contains__(self, value: str) -> bool:
+        data = value.encode(ENCODING)
+        return self._find(data, *self._digest(value, data))[0]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def nbytes(self) -> int:
+        tables = [self._hi, self._lo, self._entry]
+        total = sum(t.itemsize * len(t) for t in tables if t is not None)
+        if self.exact:
+            total += len(self._values) + self._offsets.itemsize * len(self._offsets)
+        return total
+
+
+def check_tracker_options(kind: str, exact: bool):
+    if kind not in UNIQUE_TRACKERS:
+        raise ValueError(f"Unknown unique tracker: {kind}")
+    if exact and kind == "spill":
+        # Spill runs sort 128-bit value digests; the values are never kept
+        raise ValueError("exact_unique is not supported with unique_tracker=spill")
+
+
+def new_unique_tracker(kind: str = "set", exact: bool = False):
+    check_tracker_options(kind, exact)
+    if kind == "set":
+        return set()
+    if kind == "digest64":
+        return DigestSet(64, exact)
+    if kind == "digest128":
+        return DigestSet(128, exact)
+    if kind == "spill":
+        # Resolved after a full pass by source.utility.spillValidation
+        return ExternalSorter(VALUE_RECORD.size)
+
+
+def tracker_nbytes(tracker) -> int:
+    if isinstance(tracker, (DigestSet, ExternalSorter)):
+        return tracker.nbytes()
+    return sys.getsizeof(tracker) + sum(sys.getsizeof(v) for v in tracker)
+
+
+def duplicate_check(tracker):
+    """is_duplicate(value) callable that records `value` in `tracker`."""
+    if isinstance(tracker, DigestSet):
+        return tracker.check_and_add
+
+    def is_duplicate(value) -> bool:
+        if value in tracker:
+            return True
+        tracker.add(value)
+        return False
+
+    return is_duplicate
+
+
+class UniqueTrackers(dict):
+    """Per-field uniqueness trackers of one validation run, created on first access."""
+
+    def __init__(self, kind: str = "set", exact: bool = False):
+        super().__init__()
+        check_tracker_options(kind, exact)
+        self.kind = kind
+        self.exact = exact
+
+    def __missing__(self, field):
+        tracker = self[field] = new_unique_tracker(self.kind, self.exact)
+        return tracker
+
+    def memory(self) -> dict:
+        return {field: tracker_nbytes(tracker) for field, tracker in self.items()}
@@ -1,115 +1,178 @@
 import logging
-from source.utility.validators import TYPE_DISPATCHER
+from itertools import chain, islice
 
-logger = logging.getLogger(__name__)
-
-
-def build_validators(template_fields: dict):
-    logger.debug("Building validators from template fields")
-
-    validators = {}
-    unique_fields = set()
+from source.utility.fileHelper import iter_csv_records, file_compression
+from source.utility.columnarValidation import iter_columnar_results
+from source.utility.parallelValidation import iter_parallel_results
+from source.utility.spillValidation import iter_spill_results
+from source.utility.incrementalValidation import IncrementalRun
+from source.utility.validationPlan import compile_plan
 
-    for field, rule in template_fields.items():
-        validators[field] = TYPE_DISPATCHER[rule["type"]](rule)
-        if rule.get("unique"):
-            unique_fields.add(field)
-
-    logger.debug(
-        f"Validators built | total={len(validators)} | unique_fields={len(unique_fields)}"
-    )
-
-    return validators, unique_fields
+logger = logging.getLogger(__name__)
 
 
 def validate_price(price, mrp):
     return price <= mrp
 
-def validate_csv(rows, mapping, template_fields):
+
+def validate_csv(rows, mapping, template_fields, unique_seen=None, verdicts=None):
     logger.info(f"CSV validation started | rows={len(rows)}")
 
     if not rows:
         return []
 
-    mapping = {
-        k: v.strip()
-        for k, v in mapping.items()
-        if v
-    }
-
-    required_fields = {
-        name for name, meta in template_fields.items()
-        if meta.get("required") is True
-    }
-
-    validators, unique_fields = build_validators(template_fields)
-    unique_seen = {f: set() for f in unique_fields}
-
-    csv_headers = {
-        h.strip().lower(): h for h in rows[0].keys()
-    }
-
-    missing = []
-    for field in required_fields:
-        csv_col = mapping.get(field)
-
-        if not csv_col:
-            missing.append({
-                "field": field,
-                "error": "Required field not mapped"
-            })
-        elif csv_col.strip().lower() not in csv_headers:
-            missing.append({
-                "field": field,
-                "expected_csv_column": csv_col
-        })
-
-    if missing:
-        raise ValueError(f"CSV missing required columns: {missing}")
-    results = []
-
-    for idx, row in enumerate(rows, start=1):
-        errors = {}
-
-        mapped_row = {
-            field: row.get(csv_col, "")
-            for field, csv_col in mapping.items()
-        }
-
-        for field, validator in validators.items():
-            value = mapped_row.get(field, "")
-
-            if not value and field in required_fields:
-                errors[field] = "Required field missing"
-                continue
-
-            if value and not validator(value):
-                errors[field] = "Validation failed"
-                continue
-
-            if field in unique_fields:
-                v = str(value).strip()
-                if v:
-                    if v in unique_seen[field]:
-                        errors[field] = "Duplicate value"
-                    else:
-                        unique_seen[field].add(v)
-
+    plan = compile_plan(template_fields, mapping, rows[0].keys(), positional=False)
+
+    if _spills(unique_seen):
+        return list(iter_spill_results(plan, lambda: iter(rows), unique_seen, verdicts=verdicts))
+    return list(plan.new_run(unique_seen, verdicts).results(rows))
+
+
+class ErrorLimit:
+    """
+    Stops a result stream once `max_errors` invalid rows have been produced
+    (None for no limit). The source iterator is closed so it stops reading
+    and validating; `truncated` and `stopped_at_row` tell whether rows were
+    left unvalidated and the row the stream ended on. Whether rows were left
+    is asked of `has_more(row)` (see rows_after), so no row past the limit
+    is validated or recorded for uniqueness.
+    """
+
+    def __init__(self, max_errors: int = None):
+        if max_errors is not None and max_errors < 1:
+            raise ValueError("max_errors must be at least 1")
+        self.max_errors = max_errors
+        self.errors = 0
+        self.truncated = False
+        self.stopped_at_row = None
+
+    def apply(self, results, has_more):
+        if self.max_errors is None:
+            return results
+        return self._limited(iter(results), has_more)
+
+    def _limited(self, results, has_more):
         try:
-            price = float(mapped_row.get("price", 0))
-            mrp = float(mapped_row.get("mrp", 0))
-            if price > mrp:
-                errors["price"] = "Price cannot exceed MRP"
-        except Exception:
-            errors["price"] = "Invalid price/mrp"
-
-        results.append({
-            "row": idx,
-            "valid": not errors,
-            "errors": errors
-        })
-
-    return results
-
-
-
+            for result in results:
+                yield result
+                if result["valid"]:
+                    continue
+
+                self.errors += 1
+                if self.errors >= self.max_errors:
+                    # Only report truncation when rows were actually left
+                    if has_more(result["row"]):
+                        self.truncated = True
+                        self.stopped_at_row = result["row"]
+                    return
+        finally:
+            close = getattr(results, "close", None)
+            if close is not None:
+                close()
+
+    def summary(self) -> dict:
+        return {"truncated": self.truncated, "stopped_at_row": self.stopped_at_row}
+
+
+def error_limit(max_errors: int = None, fail_fast: bool = False) -> ErrorLimit:
+    """ErrorLimit for the max_errors/fail_fast request options."""
+    if fail_fast:
+        max_errors = 1
+    return ErrorLimit(max_errors)
+
+
+def _spills(unique_seen) -> bool:
+    return unique_seen is not None and unique_seen.kind == "spill"
+
+
+def _data_records(csv_path):
+    records = iter_csv_records(csv_path)
+    next(records, None)
+    return records
+
+
+def rows_after(csv_path, row_count=None):
+    """
+    has_more(row) for ErrorLimit: whether the CSV has data records after
+    `row`. Answered from the row count recorded at upload when known,
+    otherwise by reading (not validating) the records up to the next one.
+    """
+    if row_count is not None:
+        return lambda row: row < row_count
+
+    def has_more(row) -> bool:
+        records = _data_records(csv_path)
+        try:
+            return next(islice(records, row, None), None) is not None
+        finally:
+            records.close()
+
+    return has_more
+
+
+def iter_validate_file(
+    csv_path,
+    mapping,
+    template_fields,
+    engine="compiled",
+    plan_key=None,
+    unique_seen=None,
+    verdicts=None,
+    row_verdicts=None,
+    row_count=None
+):
+    """
+    Validates a stored CSV record by record. Mapping/header errors are
+    raised before the first result is produced. `plan_key` identifies the
+    template and mapping for the plan cache; `unique_seen` (UniqueTrackers)
+    selects how unique values are tracked and `verdicts` (VerdictCaches)
+    memoizes checks per column; both can be inspected afterwards. The
+    parallel engine validates in worker processes and does not use verdicts;
+    compressed files fall back to the compiled engine.
+    With `row_verdicts` (RowVerdicts) unchanged rows of the previous upload
+    are not re-validated (compiled engine with in-memory unique tracking).
+    `row_count` is the data row count recorded at upload, if known; the
+    parallel engine checks its shards against it.
+    """
+    records = iter_csv_records(csv_path)
+    header = next(records, None)
+    first = next(records, None)
+
+    if first is None:
+        return iter(())
+
+    plan = compile_plan(template_fields, mapping, header, cache_key=plan_key)
+
+    if engine == "parallel" and file_compression(csv_path) is not None:
+        # Shards are byte ranges of the stored file; a compressed file is read sequentially
+        logger.info(f"Compressed CSV validated in-process | path={csv_path}")
+        engine = "compiled"
+
+    if row_verdicts is not None:
+        if engine != "compiled" or _spills(unique_seen):
+            raise ValueError(
+                "Incremental validation is only supported by the compiled engine "
+                "without spill unique tracking"
+            )
+        row_verdicts.open(header)
+        return IncrementalRun(plan, row_verdicts, unique_seen, verdicts).results(chain([first], records))
+
+    if _spills(unique_seen):
+        if engine != "compiled":
+            raise ValueError("Spill unique tracking is only supported by the compiled engine")
+        records.close()
+        return iter_spill_results(
+            plan, lambda: _data_records(csv_path), unique_seen, verdicts=verdicts
+        )
+
+    if engine == "parallel":
+        records.close()
+        return iter_parallel_results(
+            csv_path, template_fields, mapping, header, unique_seen=unique_seen, expected_rows=row_count
+        )
+
+    records = chain([first], records)
+
+    if engine == "columnar":
+        return iter_columnar_results(plan, records, unique_seen=unique_seen, verdicts=verdicts)
+    return plan.new_run(unique_seen, verdicts).results(records)
@@ -0,0 +1,238 @@
+import json
+import logging
+from operator import itemgetter
+
+from source.utility.cache import plan_cache
+from source.utility.uniqueTracker import UniqueTrackers, duplicate_check
+from source.utility.verdictCache import VerdictCaches
+from source.utility.validators import CHECK_DISPATCHER
+
+logger = logging.getLogger(__name__)
+
+# Position of the constant "" appended to every extracted row, used by
+# template fields whose CSV column is not mapped or not present.
+EMPTY = -1
+
+
+def normalize_mapping(mapping: dict) -> dict:
+    return {
+        k: v.strip()
+        for k, v in mapping.items()
+        if v
+    }
+
+
+def required_fields_of(template_fields: dict) -> set:
+    return {
+        name for name, meta in template_fields.items()
+        if meta.get("required") is True
+    }
+
+
+def check_required_columns(mapping: dict, required_fields: set, csv_headers):
+    csv_headers = {
+        h.strip().lower(): h for h in csv_headers
+    }
+
+    missing = []
+    for field in required_fields:
+        csv_col = mapping.get(field)
+
+        if not csv_col:
+            missing.append({
+                "field": field,
+                "error": "Required field not mapped"
+            })
+        elif csv_col.strip().lower() not in csv_headers:
+            missing.append({
+                "field": field,
+                "expected_csv_column": csv_col
+        })
+
+    if missing:
+        raise ValueError(f"CSV missing required columns: {missing}")
+
+
+class ValidationPlan:
+    """
+    Row validator specialised for one (template fields, mapping, CSV header)
+    triple. Rows are read through a single itemgetter and every field check
+    is resolved at compile time, so no per-row mapping dict is built.
+
+    `positional=True` plans take csv.reader lists, otherwise DictReader rows.
+    Plans hold no per-run state and are shared across requests.
+    """
+
+    def __init__(self, template_fields: dict, mapping: dict, csv_headers, positional: bool):
+        mapping = normalize_mapping(mapping)
+        required_fields = required_fields_of(template_fields)
+        check_required_columns(mapping, required_fields, csv_headers)
+
+        if positional:
+            # DictReader keeps the last column when headers repeat
+            index_of = {h: i for i, h in enumerate(csv_headers)}
+        else:
+            index_of = {h: h for h in csv_headers}
+
+        keys = []
+        positions = {}
+
+        def position(field):
+            csv_col = mapping.get(field)
+            if csv_col is None or csv_col not in index_of:
+                return EMPTY
+            if field not in positions:
+                positions[field] = len(keys)
+                keys.append(index_of[csv_col])
+            return positions[field]
+
+        self.fields = []
+        self.rules = {}
+        self.unique_fields = []
+        for field, rule in template_fields.items():
+            self.rules[field] = rule
+            check = CHECK_DISPATCHER[rule["type"]](rule)
+            self.fields.append((field, position(field), field in required_fields, check))
+            if rule.get("unique"):
+                self.unique_fields.append(field)
+
+        # price/mrp default to 0 only when they are not mapped at all
+        self.price_pos = position("price") if "price" in mapping else None
+        self.mrp_pos = position("mrp") if "mrp" in mapping else None
+
+        self.keys = tuple(keys)
+        self.positional = positional
+        self.getter = _make_getter(self.keys)
+
+        logger.debug(
+            f"Validation plan compiled | fields={len(self.fields)} | columns={len(self.keys)} | "
+            f"unique_fields={len(self.unique_fields)}"
+        )
+
+    def extract(self, row) -> list:
+        try:
+            values = [v.strip() for v in self.getter(row)]
+        except (IndexError, KeyError, AttributeError):
+            values = [_cell(row, k) for k in self.keys]
+        values.append("")
+        return values
+
+    def row_validator(self, unique_checks: dict, checks: dict = None):
+        """
+        `unique_checks` maps unique fields to a callable that records a value
+        and returns True when it has been seen before. `checks` replaces the
+        compiled value check of some fields (e.g. memoized ones).
+        """
+        checks = checks or {}
+        steps = tuple(
+            (field, pos, required, checks.get(field, check), unique_checks.get(field))
+            for field, pos, required, check in self.fields
+        )
+        extract = self.extract
+        price_pos = self.price_pos
+        mrp_pos = self.mrp_pos
+        cross_check = price_pos is not None or mrp_pos is not None
+
+        def validate_row(row) -> dict:
+            values = extract(row)
+            errors = {}
+
+            for field, pos, required, check, is_duplicate in steps:
+                value = values[pos]
+
+                if not value:
+                    if required:
+                        errors[field] = "Required field missing"
+                    continue
+
+                if not check(value):
+                    errors[field] = "Validation failed"
+                    continue
+
+                if is_duplicate is not None and is_duplicate(value):
+                    errors[field] = "Duplicate value"
+
+            if cross_check:
+                try:
+                    price = float(values[price_pos]) if price_pos is not None else 0.0
+                    mrp = float(values[mrp_pos]) if mrp_pos is not None else 0.0
+                    if price > mrp:
+                        errors["price"] = "Price cannot exceed MRP"
+                except Exception:
+                    errors["price"] = "Invalid price/mrp"
+
+            return errors
+
+        return validate_row
+
+    def new_run(self, unique_seen: UniqueTrackers = None, verdicts: VerdictCaches = None) -> "PlanRun":
+        return PlanRun(self, unique_seen, verdicts)
+
+
+class PlanRun:
+    """
+    Per-validation state for a shared ValidationPlan: uniqueness trackers
+    and, when `verdicts` is given, per-column memoized checks.
+    """
+
+    def __init__(self, plan: ValidationPlan, unique_seen: UniqueTrackers = None, verdicts: VerdictCaches = None):
+        self.plan = plan
+        trackers = UniqueTrackers() if unique_seen is None else unique_seen
+        self.unique_seen = {f: trackers[f] for f in plan.unique_fields}
+        self.validate_row = plan.row_validator(
+            {f: duplicate_check(seen) for f, seen in self.unique_seen.items()},
+            verdicts.checks_for(plan) if verdicts is not None else None
+        )
+
+    def results(self, rows, start: int = 1):
+        validate_row = self.validate_row
+
+        for idx, row in enumerate(rows, start=start):
+            errors = validate_row(row)
+            yield {
+                "row": idx,
+                "valid": not errors,
+                "errors": errors
+            }
+
+
+def _make_getter(keys: tuple):
+    if not keys:
+        return lambda row: ()
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda row: (row[key],)
+    return itemgetter(*keys)
+
+
+def _cell(row, key) -> str:
+    try:
+        value = row[key]
+    except (IndexError, KeyError):
+        return ""
+    return "" if value is None else str(value).strip()
+
+
+def compile_plan(
+    template_fields: dict,
+    mapping: dict,
+    csv_headers,
+    positional: bool = True,
+    cache_key=None
+) -> ValidationPlan:
+    """
+    Returns a cached plan. `cache_key` identifies the template and mapping
+    (their Files ids) so the lookup skips serializing them; without it the
+    plan is keyed by its serialized inputs.
+    """
+    csv_headers = list(csv_headers)
+
+    if cache_key is not None:
+        key = (tuple(cache_key), tuple(csv_headers), positional)
+    else:
+        key = json.dumps([template_fields, mapping, csv_headers, positional], sort_keys=True)
+
+    return plan_cache.get_or_load(
+        key,
+        lambda: ValidationPlan(template_fields, mapping, csv_headers, positional)
+    )
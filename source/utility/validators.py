@@ -1,36 +1,54 @@
 import logging
+import re
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Fast path for the url/urlArray rule: scheme http/https (any case) followed
+# by "//" and a non-empty netloc, i.e. what urlparse accepts for plain ASCII
+# values. urlsplit lstrips C0 controls/space before reading the scheme and the
+# netloc ends at the first of "/?#".
+_HTTP_URL = re.compile(r"[\x00-\x20]*[Hh][Tt][Tt][Pp][Ss]?://[^/?#]")
+
+# Values urlsplit rewrites (embedded tab/CR/LF are removed) or may reject
+# (brackets of IPv6 hosts, NFKC checks on non-ASCII netlocs) go through
+# urlparse itself, so its verdicts and ValueErrors are kept as they are.
+_URLPARSE_CHARS = re.compile(r"[\[\]\t\r\n]")
+
 
 def is_not_empty(v):
     return v is not None and str(v).strip() != ""
 
 
-def validate_str(rule):
-    logger.debug("Creating string validator")
+def with_required(rule, check):
     required = rule.get("required", False)
-    max_len = rule.get("maxLen")
 
     def validator(v):
         if not is_not_empty(v):
             return not required
+        return check(v)
+
+    return validator
+
+
+# Value checks assume a non-empty value; the empty/required decision is
+# made once by the caller (with_required or a compiled validation plan).
+
+def str_check(rule):
+    max_len = rule.get("maxLen")
+
+    def check(v):
         if max_len and len(str(v)) > max_len:
             return False
         return True
 
-    return validator
+    return check
 
 
-def validate_int(rule):
-    logger.debug("Creating int validator")
-    required = rule.get("required", False)
+def int_check(rule):
     min_v = rule.get("min")
 
-    def validator(v):
-        if not is_not_empty(v):
-            return not required
+    def check(v):
         try:
             n = int(v)
         except ValueError:
@@ -39,17 +57,13 @@ def validate_int(rule):
             return False
         return True
 
-    return validator
+    return check
 
 
-def validate_number(rule):
-    logger.debug("Creating number validator")
-    required = rule.get("required", False)
+def number_check(rule):
     min_v = rule.get("min")
 
-    def validator(v):
-        if not is_not_empty(v):
-            return not required
+    def check(v):
         try:
             n = float(v)
         except ValueError:
@@ -58,57 +72,78 @@ def validate_number(rule):
             return False
         return True
 
-    return validator
+    return check
 
 
-def validate_enum(rule):
-    logger.debug("Creating enum validator")
-    required = rule.get("required", False)
+def enum_check(rule):
     allowed = set(rule.get("allowed", []))
 
-    def validator(v):
-        if not is_not_empty(v):
-            return not required
+    def check(v):
         return v in allowed
 
-    return validator
+    return check
 
 
-def validate_url(rule):
-    logger.debug("Creating URL validator")
-    required = rule.get("required", False)
+def is_http_url(v: str) -> bool:
+    """
+    Same verdict as `urlparse(v).scheme in ("http", "https") and
+    bool(urlparse(v).netloc)` without building a ParseResult.
+    """
+    if v.isascii() and _URLPARSE_CHARS.search(v) is None:
+        return _HTTP_URL.match(v) is not None
 
-    def validator(v):
-        if not is_not_empty(v):
-            return not required
-        p = urlparse(v)
-        return p.scheme in ("http", "https") and bool(p.netloc)
+    p = urlparse(v)
+    return p.scheme in ("http", "https") and bool(p.netloc)
 
-    return validator
 
+def url_check(rule):
+    def check(v):
+        return is_http_url(v)
 
-def validate_url_array(rule):
-    logger.debug("Creating URL array validator")
-    required = rule.get("required", False)
+    return check
 
-    def validator(v):
-        v = (v or "").strip()
 
-        if v == "":
-            return not required
+def url_array_check(rule):
+    required = rule.get("required", False)
 
-        parts = [x.strip() for x in v.split("|") if x.strip()]
+    def check(v):
+        parts = [x for x in map(str.strip, v.split("|")) if x]
         if not parts:
             return not required
 
-        for url in parts:
-            p = urlparse(url)
-            if p.scheme not in ("http", "https") or not p.netloc:
-                return False
+        return all(map(is_http_url, parts))
 
-        return True
+    return check
 
-    return validator
+
+def validate_str(rule):
+    logger.debug("Creating string validator")
+    return with_required(rule, str_check(rule))
+
+
+def validate_int(rule):
+    logger.debug("Creating int validator")
+    return with_required(rule, int_check(rule))
+
+
+def validate_number(rule):
+    logger.debug("Creating number validator")
+    return with_required(rule, number_check(rule))
+
+
+def validate_enum(rule):
+    logger.debug("Creating enum validator")
+    return with_required(rule, enum_check(rule))
+
+
+def validate_url(rule):
+    logger.debug("Creating URL validator")
+    return with_required(rule, url_check(rule))
+
+
+def validate_url_array(rule):
+    logger.debug("Creating URL array validator")
+    return with_required(rule, url_array_check(rule))
 
 
 TYPE_DISPATCHER = {
@@ -119,3 +154,12 @@ TYPE_DISPATCHER = {
     "url": validate_url,
     "urlArray": validate_url_array,
 }
+
+CHECK_DISPATCHER = {
+    "string": str_check,
+    "int": int_check,
+    "number": number_check,
+    "enum": enum_check,
+    "url": url_check,
+    "urlArray": url_array_check,
+}
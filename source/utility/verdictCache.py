@@ -0,0 +1,96 @@
+from source.constants.constants import (
+    VERDICT_CACHE_TYPES,
+    VERDICT_CACHE_MAX_DISTINCT,
+    VERDICT_CACHE_SAMPLE,
+    VERDICT_CACHE_MIN_HIT_RATE,
+)
+
+
+class MemoizedCheck:
+    """
+    Value check that validates each distinct value of a column once
+    (dictionary encoding) and reuses the verdict for repeats.
+
+    Columns that turn out unique-ish stop caching: after `sample` calls
+    when the hit rate is below `min_hit_rate`, or once `max_distinct`
+    values are cached. Later calls go straight to the check.
+    """
+
+    __slots__ = (
+        "check", "verdicts", "calls", "misses", "cached", "evaluated",
+        "max_distinct", "sample", "min_hit_rate"
+    )
+
+    def __init__(
+        self,
+        check,
+        max_distinct: int = VERDICT_CACHE_MAX_DISTINCT,
+        sample: int = VERDICT_CACHE_SAMPLE,
+        min_hit_rate: float = VERDICT_CACHE_MIN_HIT_RATE
+    ):
+        self.check = check
+        self.verdicts = {}
+        self.calls = 0
+        self.misses = 0
+        self.cached = True
+        # Whether the hit rate over the first `sample` calls has been checked
+        self.evaluated = False
+        self.max_distinct = max_distinct
+        self.sample = sample
+        self.min_hit_rate = min_hit_rate
+
+    def __call__(self, value) -> bool:
+        self.calls += 1
+        if not self.cached:
+            self.misses += 1
+            return self.check(value)
+
+        verdict = self.verdicts.get(value)
+        if verdict is not None:
+            if not self.evaluated and self.calls >= self.sample:
+                self._evaluate()
+            return verdict
+
+        self.misses += 1
+        verdict = self.check(value)
+        self.verdicts[value] = verdict
+
+        if len(self.verdicts) >= self.max_distinct:
+            self.cached = False
+        elif not self.evaluated and self.calls >= self.sample:
+            self._evaluate()
+
+        return verdict
+
+    def _evaluate(self):
+        self.evaluated = True
+        if self.calls - self.misses < self.calls * self.min_hit_rate:
+            self.cached = False
+
+    def stats(self) -> dict:
+        hits = self.calls - self.misses
+        return {
+            "distinct": len(self.verdicts),
+            "cached": self.cached,
+            "calls": self.calls,
+            "hits": hits,
+            "hit_rate": round(hits / self.calls, 4) if self.calls else 0.0
+        }
+
+
+class VerdictCaches(dict):
+    """Per-column MemoizedChecks of one validation run, keyed by template field."""
+
+    def checks_for(self, plan) -> dict:
+        """Memoized replacements for the plan's checks of cacheable types."""
+        checks = {}
+        for field, _, _, check in plan.fields:
+            if plan.rules[field]["type"] not in VERDICT_CACHE_TYPES:
+                continue
+            if field not in self:
+                self[field] = MemoizedCheck(check)
+            checks[field] = self[field]
+        return checks
+
+    def stats(self) -> dict:
+        return {field: memo.stats() for field, memo in self.items()}
@@ -0,0 +1,95 @@
+"""
+Interpreted row-by-row validator, the reference the compiled plans
+(source.utility.validationPlan) are checked and benchmarked against.
+"""
+import logging
+
+from source.utility.validators import TYPE_DISPATCHER
+from source.utility.validationPlan import (
+    normalize_mapping,
+    required_fields_of,
+    check_required_columns,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def build_validators(template_fields: dict):
+    logger.debug("Building validators from template fields")
+
+    validators = {}
+    unique_fields = set()
+
+    for field, rule in template_fields.items():
+        validators[field] = TYPE_DISPATCHER[rule["type"]](rule)
+        if rule.get("unique"):
+            unique_fields.add(field)
+
+    logger.debug(
+        f"Validators built | total={len(validators)} | unique_fields={len(unique_fields)}"
+    )
+
+    return validators, unique_fields
+
+
+def prepare_validation(mapping, template_fields, csv_headers):
+    mapping = normalize_mapping(mapping)
+    required_fields = required_fields_of(template_fields)
+    validators, unique_fields = build_validators(template_fields)
+    check_required_columns(mapping, required_fields, csv_headers)
+
+    return {
+        "mapping": mapping,
+        "required_fields": required_fields,
+        "validators": validators,
+        "unique_fields": unique_fields,
+    }
+
+
+def iter_validate_rows(rows, context):
+    mapping = context["mapping"]
+    required_fields = context["required_fields"]
+    validators = context["validators"]
+    unique_fields = context["unique_fields"]
+    unique_seen = {f: set() for f in unique_fields}
+
+    for idx, row in enumerate(rows, start=1):
+        errors = {}
+
+        mapped_row = {
+            field: row.get(csv_col, "")
+            for field, csv_col in mapping.items()
+        }
+
+        for field, validator in validators.items():
+            value = mapped_row.get(field, "")
+
+            if not value and field in required_fields:
+                errors[field] = "Required field missing"
+                continue
+
+            if value and not validator(value):
+                errors[field] = "Validation failed"
+                continue
+
+            if field in unique_fields:
+                v = str(value).strip()
+                if v:
+                    if v in unique_seen[field]:
+                        errors[field] = "Duplicate value"
+                    else:
+                        unique_seen[field].add(v)
+
+        try:
+            price = float(mapped_row.get("price", 0))
+            mrp = float(mapped_row.get("mrp", 0))
+            if price > mrp:
+                errors["price"] = "Price cannot exceed MRP"
+        except Exception:
+            errors["price"] = "Invalid price/mrp"
+
+        yield {
+            "row": idx,
+            "valid": not errors,
+            "errors": errors
+        }
@@ -7,6 +7,7 @@ from fastapi import HTTPException
 
 from source.handlers.authHandler import createJWTToken, verify_token, getToken
 from source.constants.constants import SECRET_KEY, ALGORITHM
+from source.utility.cache import token_cache
 
 class DummyRequest:
     def __init__(self, headers: dict):
@@ -32,6 +33,20 @@ def test_verify_token_valid_token():
     assert decoded["sub"] == "20002"
 
 
+def test_verify_token_caches_verified_payload(monkeypatch):
+    token = createJWTToken(30003)
+    first = verify_token(token)
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("cached token was decoded again")
+
+    monkeypatch.setattr("source.handlers.authHandler.jwt.decode", fail_decode)
+    hits = token_cache.hits
+
+    assert verify_token(token) == first
+    assert token_cache.hits == hits + 1
+
+
 def test_verify_token_invalid_token():
     with pytest.raises(HTTPException) as exc:
         verify_token("fake.token.value")
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from source.db import backfill
+from source.db.base import Base
+from source.db.model import Files, MarketplaceTemplate, SellerTemplateMapping
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_sqlite_json(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine,
+        tables=[Files.__table__, MarketplaceTemplate.__table__, SellerTemplateMapping.__table__]
+    )
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    monkeypatch.setattr(backfill, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+def write_json(tmp_path, name, content) -> str:
+    path = tmp_path / name
+    path.write_text(json.dumps(content))
+    return str(path)
+
+
+def test_backfill_fills_content_of_existing_rows_once(tmp_path, session_factory, monkeypatch):
+    template = {"templateName": "myntra", "fields": {"sku": {"type": "string"}}}
+    mapping = {"sku": "SKU"}
+
+    db = session_factory()
+    db.add_all([
+        Files(id=1, file_name="t.json", file_path=write_json(tmp_path, "t.json", template), file_type="json"),
+        Files(id=2, file_name="m.json", file_path=write_json(tmp_path, "m.json", mapping), file_type="json"),
+        Files(id=3, file_name="gone.json", file_path=str(tmp_path / "gone.json"), file_type="json"),
+        Files(id=4, file_name="new.json", file_path=str(tmp_path / "new.json"), file_type="json"),
+    ])
+    db.add_all([
+        MarketplaceTemplate(id=1, template_name="myntra", version="1", file_id=1),
+        SellerTemplateMapping(id=1, seller_id="seller_1", marketplace="myntra", template_id=1, mapping_file_id=2),
+        # Its file is missing: skipped, left NULL
+        SellerTemplateMapping(id=2, seller_id="seller_2", marketplace="myntra", template_id=1, mapping_file_id=3),
+        # Stored since the content column exists: never read from disk
+        SellerTemplateMapping(
+            id=3, seller_id="seller_3", marketplace="myntra", template_id=1, mapping_file_id=4,
+            content={"sku": "Sku"}
+        ),
+    ])
+    db.commit()
+    db.close()
+
+    loaded = []
+    load_json_file = backfill.load_json_file
+
+    def spy(file_path):
+        loaded.append(file_path)
+        return load_json_file(file_path)
+
+    monkeypatch.setattr(backfill, "load_json_file", spy)
+    monkeypatch.setattr(backfill, "BACKFILL_BATCH_SIZE", 1)
+
+    backfill.backfill_json_content()
+
+    db = session_factory()
+    assert db.get(MarketplaceTemplate, 1).content == template
+    assert db.get(SellerTemplateMapping, 1).content == mapping
+    assert db.get(SellerTemplateMapping, 2).content is None
+    assert db.get(SellerTemplateMapping, 3).content == {"sku": "Sku"}
+    db.close()
+    assert sorted(loaded) == sorted([str(tmp_path / "t.json"), str(tmp_path / "m.json"), str(tmp_path / "gone.json")])
+
+    # Filled rows are not read again; only the one still missing its file is retried
+    loaded.clear()
+    backfill.backfill_json_content()
+
+    assert loaded == [str(tmp_path / "gone.json")]
+    db = session_factory()
+    assert db.get(MarketplaceTemplate, 1).content == template
+    assert db.get(SellerTemplateMapping, 1).content == mapping
+    db.close()
@@ -0,0 +1,100 @@
+import hashlib
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from source.db.blobStore import (
+    BlobWriter,
+    WrittenBlob,
+    acquire_blob,
+    blob_path,
+    release_blob,
+    store_blob,
+    write_blob,
+)
+from source.db.model import StoredBlob
+from source.utility.rowIndex import index_path
+
+
+def test_equal_content_is_stored_once_in_sharded_path(tmp_path):
+    first = write_blob(b"SKU\nA1\n", tmp_path)
+    second = write_blob(b"SKU\nA1\n", tmp_path)
+    other = write_blob(b"SKU\nB2\n", tmp_path)
+
+    sha256 = hashlib.sha256(b"SKU\nA1\n").hexdigest()
+    assert first.sha256 == second.sha256 == sha256
+    assert first.path == second.path == str(tmp_path / sha256[:2] / sha256[2:4] / sha256)
+    assert (first.created, second.created, other.created) == (True, False, True)
+    assert first.size == 7
+    assert list((tmp_path / "tmp").iterdir()) == []
+
+
+def test_streamed_chunks_hash_like_whole_content(tmp_path):
+    with BlobWriter(tmp_path) as writer:
+        for chunk in (b"SKU,", b"Price\n", b"A1,100\n"):
+            writer.write(chunk)
+        blob = writer.commit()
+
+    assert blob.sha256 == hashlib.sha256(b"SKU,Price\nA1,100\n").hexdigest()
+    assert blob_path(blob.sha256, tmp_path).read_bytes() == b"SKU,Price\nA1,100\n"
+
+
+def test_failed_write_leaves_no_file(tmp_path):
+    with pytest.raises(RuntimeError):
+        with BlobWriter(tmp_path) as writer:
+            writer.write(b"partial")
+            raise RuntimeError("client disconnected")
+
+    assert list((tmp_path / "tmp").iterdir()) == []
+
+
+def test_acquire_blob_counts_references_per_digest():
+    db = MagicMock()
+    acquire_blob(db, WrittenBlob("abcd", "/blobs/ab/cd/abcd", 10, True))
+
+    stmt = db.execute.call_args[0][0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (sha256) DO UPDATE SET ref_count = (stored_blobs.ref_count +" in sql
+
+
+def test_store_blob_acquires_before_the_file_is_stored(tmp_path):
+    db = MagicMock()
+    sha256 = hashlib.sha256(b"{}").hexdigest()
+    seen = []
+    db.execute.side_effect = lambda stmt: seen.append(blob_path(sha256, tmp_path).exists())
+
+    blob = store_blob(db, b"{}", tmp_path)
+
+    assert seen == [False]
+    assert blob.sha256 == sha256 and blob.created is True
+    assert Path(blob.path).read_bytes() == b"{}"
+
+
+def test_release_blob_removes_file_with_last_reference(tmp_path):
+    blob = write_blob(b"SKU\nA1\n", tmp_path)
+    Path(index_path(blob.path)).write_bytes(b"RIX1")
+    stored = StoredBlob(sha256=blob.sha256, file_path=blob.path, size_bytes=blob.size, ref_count=2)
+
+    db = MagicMock()
+    db.query.return_value.filter.return_value.with_for_update.return_value.first.return_value = stored
+
+    assert release_blob(db, blob.sha256, blob.path) is False
+    assert stored.ref_count == 1
+    assert Path(blob.path).exists()
+    db.delete.assert_not_called()
+
+    assert release_blob(db, blob.sha256, blob.path) is True
+    db.delete.assert_called_once_with(stored)
+    assert not Path(blob.path).exists()
+    assert not Path(index_path(blob.path)).exists()
+
+
+def test_release_blob_without_row_keeps_file(tmp_path):
+    blob = write_blob(b"SKU\nA1\n", tmp_path)
+    db = MagicMock()
+    db.query.return_value.filter.return_value.with_for_update.return_value.first.return_value = None
+
+    assert release_blob(db, blob.sha256, blob.path) is False
+    assert Path(blob.path).exists()
@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock, patch
+
+from source.utility.cache import (
+    LRUCache,
+    ExpiringLRUCache,
+    json_cache,
+    plan_cache,
+    invalidate_json_files,
+)
+from source.utility.validationPlan import compile_plan
+from source.handlers.mappingHandler import load_cached_json
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache("test", maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats() == {
+        "size": 2,
+        "maxsize": 2,
+        "hits": 3,
+        "misses": 1,
+        "hit_rate": 0.75,
+    }
+
+
+def test_get_or_load_calls_loader_once():
+    cache = LRUCache("test", maxsize=4)
+    loader = MagicMock(return_value={"x": 1})
+
+    assert cache.get_or_load(1, loader) == {"x": 1}
+    assert cache.get_or_load(1, loader) == {"x": 1}
+    loader.assert_called_once()
+
+
+@patch("source.handlers.mappingHandler.load_json_file")
+def test_load_cached_json_is_keyed_by_file_id(mock_load):
+    mock_load.return_value = {"mapping": {"sku": "SKU"}}
+    file = MagicMock(id=-101, file_path="map.json")
+
+    assert load_cached_json(file) == {"mapping": {"sku": "SKU"}}
+    assert load_cached_json(file) == {"mapping": {"sku": "SKU"}}
+    mock_load.assert_called_once_with("map.json")
+
+    invalidate_json_files([-101])
+    load_cached_json(file)
+    assert mock_load.call_count == 2
+
+
+def test_invalidation_drops_plans_built_from_file():
+    fields = {"sku": {"type": "string", "required": True}}
+    plan = compile_plan(fields, {"sku": "SKU"}, ["SKU"], cache_key=(-201, -202))
+
+    assert compile_plan(fields, {"sku": "SKU"}, ["SKU"], cache_key=(-201, -202)) is plan
+
+    invalidate_json_files([-202])
+
+    assert compile_plan(fields, {"sku": "SKU"}, ["SKU"], cache_key=(-201, -202)) is not plan
+    assert json_cache.get(-202) is None
+    assert plan_cache.stats()["size"] >= 1
+
+
+def test_expiring_cache_drops_entries_at_expiry():
+    cache = ExpiringLRUCache("test", maxsize=4)
+
+    with patch("source.utility.cache.time.time", return_value=1000.0):
+        cache.put("token", {"sub": "1"}, expires_at=1010.0)
+        cache.put("stale", {"sub": "2"}, expires_at=999.0)
+        assert cache.get("token") == {"sub": "1"}
+        assert cache.get("stale") is None
+
+    with patch("source.utility.cache.time.time", return_value=1010.0):
+        assert cache.get("token") is None
+
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from source.utility.columnarValidation import iter_columnar_results
+from source.utility.uniqueTracker import UniqueTrackers
+from source.utility.validationPlan import compile_plan
+
+HEADERS = ["SKU", "Qty", "Price", "MRP", "Gender", "Name", "Image"]
+
+MAPPING = {
+    "sku": "SKU",
+    "qty": "Qty",
+    "price": "Price",
+    "mrp": "MRP",
+    "gender": "Gender",
+    "name": "Name",
+    "image": "Image",
+}
+
+TEMPLATE_FIELDS = {
+    "sku": {"type": "string", "required": True, "unique": True},
+    "qty": {"type": "int", "min": 1},
+    "price": {"type": "number", "required": True, "min": 0},
+    "mrp": {"type": "number", "required": True, "min": 0},
+    "gender": {"type": "enum", "required": True, "allowed": ["Men", "Women"]},
+    "name": {"type": "string", "maxLen": 5},
+    "image": {"type": "url"},
+}
+
+CELLS = {
+    "SKU": [str(n) for n in range(30)] + ["", " 7 "],
+    "Qty": ["1", "0", "+3", "1_000", "1.5", "", "x", "99999999999999999999"],
+    "Price": ["10", "200", "-1", "nan", "inf", "1e3", "", "abc"],
+    "MRP": ["100", "50", "", " 75 ", "x"],
+    "Gender": ["Men", "Women", "Alien", ""],
+    "Name": ["abc", "abcdefgh", ""],
+    "Image": ["https://a.com/x.jpg", "ftp://a", ""],
+}
+
+
+def random_records(count, seed):
+    rnd = random.Random(seed)
+    records = [[rnd.choice(CELLS[h]) for h in HEADERS] for _ in range(count)]
+    records[3] = records[3][:2]
+    return records
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 1000])
+def test_columnar_engine_matches_compiled_plan(batch_size):
+    records = random_records(400, seed=batch_size)
+    plan = compile_plan(TEMPLATE_FIELDS, MAPPING, HEADERS)
+
+    expected = list(plan.new_run().results(records))
+    actual = list(iter_columnar_results(plan, records, batch_size=batch_size))
+
+    assert actual == expected
+    assert [list(r["errors"]) for r in actual] == [list(r["errors"]) for r in expected]
+
+
+def test_columnar_engine_without_price_mapping():
+    fields = {"qty": {"type": "int", "required": True}}
+    plan = compile_plan(fields, {"qty": "Qty"}, ["Qty"])
+
+    results = list(iter_columnar_results(plan, [["5"], [""], ["a"]]))
+
+    assert [r["valid"] for r in results] == [True, False, False]
+    assert results[1]["errors"] == {"qty": "Required field missing"}
+    assert results[2]["errors"] == {"qty": "Validation failed"}
+
+
+def test_columnar_engine_with_digest_tracker():
+    records = random_records(400, seed=11)
+    plan = compile_plan(TEMPLATE_FIELDS, MAPPING, HEADERS)
+
+    expected = list(plan.new_run().results(records))
+    actual = list(iter_columnar_results(plan, records, unique_seen=UniqueTrackers("digest128")))
+
+    assert actual == expected
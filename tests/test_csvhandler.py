@@ -1,3 +1,4 @@
+import hashlib
 import pytest
 from pathlib import Path
 from fastapi import UploadFile
@@ -32,7 +33,7 @@ def test_upload_csv_with_sample_file(tmp_path, monkeypatch):
     upload_file = make_upload_file_from_disk(sample_csv)
 
     monkeypatch.setattr(
-        "source.handlers.csvhandler.UPLOAD_DIR",
+        "source.db.blobStore.BLOB_DIR",
         tmp_path
     )
 
@@ -47,13 +48,17 @@ def test_upload_csv_with_sample_file(tmp_path, monkeypatch):
         lambda: mock_db
     )
 
-    def refresh_side_effect(obj):
-        if isinstance(obj, Files):
-            obj.id = 1
-        elif isinstance(obj, SellerCsvUpload):
-            obj.id = 10
+    added = []
+    mock_db.add.side_effect = added.append
 
-    mock_db.refresh.side_effect = refresh_side_effect
+    def flush_side_effect():
+        for obj in added:
+            if isinstance(obj, Files):
+                obj.id = 1
+            elif isinstance(obj, SellerCsvUpload):
+                obj.id = 10
+
+    mock_db.flush.side_effect = flush_side_effect
 
     response = uploadfile(
         seller_id="seller_1",
@@ -88,5 +93,197 @@ def test_upload_csv_with_sample_file(tmp_path, monkeypatch):
     assert first_row["Price"] == "1290"
 
     assert mock_db.add.call_count == 2
-    assert mock_db.commit.call_count == 2
+    sha256 = hashlib.sha256(sample_csv.read_bytes()).hexdigest()
+    assert added[0].content_sha256 == sha256
+    assert added[0].file_path == str(tmp_path / sha256[:2] / sha256[2:4] / sha256)
+    assert Path(added[0].file_path).read_bytes() == sample_csv.read_bytes()
+    mock_db.execute.assert_called_once()
+    assert added[1].csv_file_id == 1
+    mock_db.commit.assert_called_once()
+    mock_db.refresh.assert_not_called()
     mock_db.close.assert_called_once()
+
+
+def test_upload_gzip_csv_is_stored_compressed(tmp_path, monkeypatch):
+    import gzip
+
+    csv_data = b"SKU,Price\nA1,10\nA2,20\n"
+    compressed = gzip.compress(csv_data)
+
+    monkeypatch.setattr("source.db.blobStore.BLOB_DIR", tmp_path)
+    mock_db = MagicMock()
+    monkeypatch.setattr("source.handlers.csvhandler.SessionLocal", lambda: mock_db)
+    added = []
+    mock_db.add.side_effect = added.append
+
+    response = uploadfile(
+        seller_id="seller_1",
+        file=UploadFile(filename="feed.csv.gz", file=io.BytesIO(compressed))
+    )
+
+    assert response["headers"] == ["SKU", "Price"]
+    assert response["rowCount"] == 2
+    assert Path(added[0].file_path).read_bytes() == compressed
+    assert added[0].content_sha256 == hashlib.sha256(compressed).hexdigest()
+
+
+def test_upload_rejects_truncated_compressed_csv(tmp_path, monkeypatch):
+    import gzip
+    from fastapi import HTTPException
+
+    monkeypatch.setattr("source.db.blobStore.BLOB_DIR", tmp_path)
+    mock_db = MagicMock()
+    monkeypatch.setattr("source.handlers.csvhandler.SessionLocal", lambda: mock_db)
+
+    truncated = gzip.compress(b"SKU,Price\n" + b"A1,10\n" * 1000)[:-40]
+
+    with pytest.raises(HTTPException) as exc:
+        uploadfile(
+            seller_id="seller_1",
+            file=UploadFile(filename="feed.csv.gz", file=io.BytesIO(truncated))
+        )
+
+    assert exc.value.status_code == 400
+    assert list((tmp_path / "tmp").iterdir()) == []
+    mock_db.commit.assert_not_called()
+
+
+def test_upload_persists_stats(tmp_path, monkeypatch):
+    csv_data = b'SKU,Name\r\nA1,"comma, quoted"\r\nA2,plain\r\n'
+
+    monkeypatch.setattr("source.db.blobStore.BLOB_DIR", tmp_path)
+    mock_db = MagicMock()
+    monkeypatch.setattr("source.handlers.csvhandler.SessionLocal", lambda: mock_db)
+    added = []
+    mock_db.add.side_effect = added.append
+
+    response = uploadfile(
+        seller_id="seller_1",
+        file=UploadFile(filename="feed.csv", file=io.BytesIO(csv_data))
+    )
+
+    csv_upload = added[1]
+    assert response["rowCount"] == 2
+    assert csv_upload.headers == response["headers"] == ["SKU", "Name"]
+    assert csv_upload.row_count == 2
+    assert csv_upload.sample_rows == response["sampleRows"] == [
+        {"SKU": "A1", "Name": "comma, quoted"},
+        {"SKU": "A2", "Name": "plain"},
+    ]
+    assert csv_upload.size_bytes == len(csv_data)
+
+
+def test_get_upload_details_reads_only_db(monkeypatch):
+    from fastapi import HTTPException
+    from source.handlers.csvhandler import get_upload_details
+
+    mock_db = MagicMock()
+    monkeypatch.setattr("source.handlers.csvhandler.SessionLocal", lambda: mock_db)
+    query = mock_db.query.return_value.join.return_value.filter.return_value
+    query.first.return_value = (
+        SellerCsvUpload(id=10, headers=["SKU"], row_count=2, sample_rows=[{"SKU": "A1"}],
+                        size_bytes=17),
+        Files(id=1, file_name="feed.csv", content_sha256="a" * 64),
+    )
+
+    details = get_upload_details(10, seller_id="seller_1")
+
+    assert details["csvUploadId"] == 10
+    assert details["fileName"] == "feed.csv"
+    assert details["rowCount"] == 2
+    assert details["contentSha256"] == "a" * 64
+    assert "dialect" not in details
+    mock_db.close.assert_called_once()
+
+    query.first.return_value = None
+    with pytest.raises(HTTPException) as exc:
+        get_upload_details(11, seller_id="seller_1")
+    assert exc.value.status_code == 404
+
+
+def test_upload_writes_row_index_served_by_rows_endpoint(tmp_path, monkeypatch):
+    from source.handlers.csvhandler import get_upload_rows
+
+    csv_data = b'SKU,Desc\nA1,"multi\nline"\nA2,plain\nA3,last\n'
+
+    monkeypatch.setattr("source.db.blobStore.BLOB_DIR", tmp_path)
+    mock_db = MagicMock()
+    monkeypatch.setattr("source.handlers.csvhandler.SessionLocal", lambda: mock_db)
+    added = []
+    mock_db.add.side_effect = added.append
+
+    uploadfile(seller_id="seller_1", file=UploadFile(filename="feed.csv", file=io.BytesIO(csv_data)))
+
+    db_file, csv_upload = added
+    assert Path(db_file.file_path + ".rows").exists()
+
+    mock_db.query.return_value.join.return_value.filter.return_value.first.return_value = (
+        csv_upload, db_file
+    )
+
+    page = get_upload_rows(10, seller_id="seller_1", start=2, limit=1)
+
+    assert page["rowCount"] == 3
+    assert page["rows"] == [{"row": 2, "values": {"SKU": "A2", "Desc": "plain"}}]
+    assert page["nextStart"] == 3
+
+    last = get_upload_rows(10, seller_id="seller_1", start=3, limit=5)
+    assert last["rows"] == [{"row": 3, "values": {"SKU": "A3", "Desc": "last"}}]
+    assert last["nextStart"] is None
+
+
+def test_delete_upload_releases_its_blob(monkeypatch):
+    from source.handlers.csvhandler import delete_upload
+
+    mock_db = MagicMock()
+    monkeypatch.setattr("source.handlers.csvhandler.SessionLocal", lambda: mock_db)
+    release = MagicMock(return_value=True)
+    monkeypatch.setattr("source.handlers.csvhandler.release_blob", release)
+
+    csv_upload = SellerCsvUpload(id=10, csv_file_id=1)
+    db_file = Files(id=1, file_name="feed.csv", file_path="/blobs/aa/aa/" + "a" * 64, content_sha256="a" * 64)
+    mock_db.query.return_value.join.return_value.filter.return_value.first.return_value = (
+        csv_upload, db_file
+    )
+
+    response = delete_upload(10, seller_id="seller_1")
+
+    assert response == {"csvUploadId": 10, "fileId": 1, "blobRemoved": True}
+    assert [c.args[0] for c in mock_db.delete.call_args_list] == [csv_upload, db_file]
+    release.assert_called_once_with(mock_db, "a" * 64, "/blobs/aa/aa/" + "a" * 64)
+    mock_db.commit.assert_called_once()
+
+    # Files stored before content addressing have no blob
+    release.reset_mock()
+    db_file.content_sha256 = None
+    assert delete_upload(10, seller_id="seller_1")["blobRemoved"] is False
+    release.assert_not_called()
+
+
+def test_delete_hashed_legacy_upload_keeps_blob_of_identical_upload(tmp_path, monkeypatch):
+    from source.db.blobStore import write_blob
+    from source.db.model import StoredBlob
+    from source.handlers.csvhandler import delete_upload
+
+    csv_data = b"SKU\nA1\n"
+    blob = write_blob(csv_data, tmp_path / "blobs")
+    stored = StoredBlob(sha256=blob.sha256, file_path=blob.path, size_bytes=blob.size, ref_count=1)
+
+    # Stored under uploads/ before content addressing; its hash was recorded later
+    legacy_path = tmp_path / "uploads" / "feed.csv"
+    legacy_path.parent.mkdir()
+    legacy_path.write_bytes(csv_data)
+    legacy_file = Files(id=1, file_name="feed.csv", file_path=str(legacy_path), content_sha256=blob.sha256)
+
+    mock_db = MagicMock()
+    monkeypatch.setattr("source.handlers.csvhandler.SessionLocal", lambda: mock_db)
+    mock_db.query.return_value.join.return_value.filter.return_value.first.return_value = (
+        SellerCsvUpload(id=10, csv_file_id=1), legacy_file
+    )
+    mock_db.query.return_value.filter.return_value.with_for_update.return_value.first.return_value = stored
+
+    assert delete_upload(10, seller_id="seller_1")["blobRemoved"] is False
+
+    assert stored.ref_count == 1
+    assert Path(blob.path).read_bytes() == csv_data
+    assert stored not in [c.args[0] for c in mock_db.delete.call_args_list]
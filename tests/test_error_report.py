@@ -0,0 +1,120 @@
+import asyncio
+import csv
+import gzip
+import io
+
+import pytest
+from fastapi import HTTPException
+from unittest.mock import patch
+
+from source.handlers.mappingHandler import validation_report
+from source.utility.errorReport import iter_report, gzip_chunks, format_errors
+from source.utility.fileHelper import iter_csv_records
+from source.utility.validationHelper import iter_validate_file
+
+MAPPING = {"sku": "SKU", "price": "Price", "mrp": "MRP"}
+TEMPLATE_FIELDS = {
+    "sku": {"type": "string", "required": True, "unique": True},
+    "price": {"type": "number", "required": True},
+    "mrp": {"type": "number", "required": True},
+}
+CSV_DATA = 'SKU,Price,MRP,Desc\nA1,100,120,"multi\nline"\nA1,200,100,dup\n\nA3,x,100\nA4,10,20,ok\n'
+
+
+def write_csv(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(CSV_DATA)
+    return str(path)
+
+
+def report(csv_path, only_invalid=False, batch_rows=2):
+    records = iter_csv_records(csv_path)
+    header = next(records)
+    results = iter_validate_file(csv_path, MAPPING, TEMPLATE_FIELDS)
+    return iter_report(header, records, results, only_invalid, batch_rows=batch_rows)
+
+
+def test_report_appends_verdicts_to_original_records(tmp_path):
+    csv_path = write_csv(tmp_path)
+
+    rows = list(csv.reader(io.StringIO("".join(report(csv_path)))))
+
+    assert rows[0] == ["SKU", "Price", "MRP", "Desc", "_valid", "_errors"]
+    assert rows[1] == ["A1", "100", "120", "multi\nline", "true", ""]
+    assert rows[2] == [
+        "A1", "200", "100", "dup", "false", "sku: Duplicate value; price: Price cannot exceed MRP"
+    ]
+    # Short records are padded so the verdict columns line up
+    assert rows[3][3:] == ["", "false", "price: Invalid price/mrp"]
+    assert rows[4][4] == "true"
+    assert len(rows) == 5
+
+
+def test_report_of_failing_rows_only_keeps_row_numbers(tmp_path):
+    csv_path = write_csv(tmp_path)
+    expected = [r for r in iter_validate_file(csv_path, MAPPING, TEMPLATE_FIELDS) if not r["valid"]]
+
+    rows = list(csv.reader(io.StringIO("".join(report(csv_path, only_invalid=True)))))
+
+    assert rows[0][-3:] == ["_row", "_valid", "_errors"]
+    assert [(int(r[4]), r[6]) for r in rows[1:]] == [
+        (r["row"], format_errors(r["errors"])) for r in expected
+    ]
+
+
+def test_report_closes_file_readers_when_consumer_stops(tmp_path):
+    csv_path = write_csv(tmp_path)
+    records = iter_csv_records(csv_path)
+    header = next(records)
+    results = iter_validate_file(csv_path, MAPPING, TEMPLATE_FIELDS)
+
+    chunks = iter_report(header, records, results, batch_rows=1)
+    next(chunks)
+    chunks.close()
+
+    assert records.gi_frame is None
+    assert results.gi_frame is None
+
+
+def test_gzip_report_decompresses_to_plain_report(tmp_path):
+    csv_path = write_csv(tmp_path)
+
+    compressed = b"".join(gzip_chunks(report(csv_path)))
+
+    assert gzip.decompress(compressed).decode() == "".join(report(csv_path))
+
+
+def _collect(response) -> bytes:
+    async def consume():
+        return [chunk async for chunk in response.body_iterator]
+
+    return b"".join(
+        c if isinstance(c, bytes) else c.encode() for c in asyncio.run(consume())
+    )
+
+
+@patch("source.handlers.mappingHandler.SessionLocal")
+@patch("source.handlers.mappingHandler.load_validation_inputs")
+def test_validation_report_streams_download(mock_inputs, mock_session, tmp_path):
+    csv_path = write_csv(tmp_path)
+    mock_inputs.return_value = (MAPPING, TEMPLATE_FIELDS, csv_path, None, None, 4)
+
+    response = validation_report("seller_1", 10, gzip=True)
+
+    assert response.media_type == "application/gzip"
+    assert 'filename="validation-report-10.csv.gz"' in response.headers["content-disposition"]
+    assert gzip.decompress(_collect(response)).decode() == "".join(report(csv_path))
+    mock_session.return_value.close.assert_called_once()
+
+
+@patch("source.handlers.mappingHandler.SessionLocal")
+@patch("source.handlers.mappingHandler.load_validation_inputs")
+def test_validation_report_rejects_missing_columns_before_streaming(mock_inputs, mock_session, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("Name\nA1\n")
+    mock_inputs.return_value = (MAPPING, TEMPLATE_FIELDS, str(csv_path), None, None, None)
+
+    with pytest.raises(HTTPException) as exc:
+        validation_report("seller_1", 10)
+
+    assert exc.value.status_code == 400
@@ -1,5 +1,11 @@
+import io
 import tempfile
-from source.utility.fileHelper import load_json_file, read_csv_rows
+from source.utility.fileHelper import (
+    load_json_file,
+    read_csv_rows,
+    open_tee_text,
+    scan_csv_stream,
+)
 
 
 def test_load_json_file():
@@ -24,3 +30,42 @@ def test_read_csv_rows_normalization():
             {"name": "Apple", "price": "10"},
             {"name": "Orange", "price": ""}
         ]
+
+
+def test_tee_stream_copies_bytes_and_scans_rows():
+    csv_data = b'name,desc\nApple,"multi\nline"\nOrange,plain\n'
+    sink = io.BytesIO()
+
+    stream = open_tee_text(io.BytesIO(csv_data), sink, chunk_size=4)
+    headers, row_count, sample_rows = scan_csv_stream(stream, sample_size=1)
+
+    assert sink.getvalue() == csv_data
+    assert headers == ["name", "desc"]
+    assert row_count == 2
+    assert sample_rows == [{"name": "Apple", "desc": "multi\nline"}]
+
+
+def test_compressed_csv_is_stored_as_received_and_read_decompressed(tmp_path):
+    import gzip
+    import zstandard
+
+    csv_data = b'name,desc\nApple,"multi\nline"\nOrange,plain\n'
+    zstd_frames = (
+        zstandard.ZstdCompressor().compress(csv_data[:20])
+        + zstandard.ZstdCompressor().compress(csv_data[20:])
+    )
+
+    for name, stored in (("data.csv.gz", gzip.compress(csv_data)), ("data.csv.zst", zstd_frames)):
+        sink = io.BytesIO()
+        stream = open_tee_text(io.BytesIO(stored), sink, chunk_size=4)
+        headers, row_count, _ = scan_csv_stream(stream, sample_size=1)
+
+        assert sink.getvalue() == stored
+        assert (headers, row_count) == (["name", "desc"], 2)
+
+        path = tmp_path / name
+        path.write_bytes(stored)
+        assert read_csv_rows(str(path)) == [
+            {"name": "Apple", "desc": "multi\nline"},
+            {"name": "Orange", "desc": "plain"}
+        ]
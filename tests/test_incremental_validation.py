@@ -0,0 +1,154 @@
+import pytest
+
+from source.utility import incrementalValidation
+from source.utility.incrementalValidation import RowVerdicts, RowVerdictStore, RowVerdictWriter, store_key
+from source.utility.validationHelper import iter_validate_file
+from source.utility.uniqueTracker import UniqueTrackers
+
+MAPPING = {"sku": "SKU", "price": "Price", "mrp": "MRP", "image": "Image"}
+HEADER = ["SKU", "Price", "MRP", "Image"]
+TEMPLATE_FIELDS = {
+    "sku": {"type": "string", "required": True, "unique": True},
+    "price": {"type": "number", "required": True, "unique": True},
+    "mrp": {"type": "number", "required": True},
+    "image": {"type": "url"},
+}
+
+
+def write_csv(path, rows):
+    path.write_text(",".join(HEADER) + "\n" + "".join(",".join(r) + "\n" for r in rows))
+    return str(path)
+
+
+def make_rows(count):
+    return [
+        [f"S{i}", str(100 + i) if i % 5 else "x", str(150 + i), f"https://cdn.example.com/{i}.jpg" if i % 3 else "bad"]
+        for i in range(count)
+    ]
+
+
+def run(csv_path, store, **kwargs):
+    row_verdicts = RowVerdicts(store)
+    results = list(iter_validate_file(csv_path, MAPPING, TEMPLATE_FIELDS, row_verdicts=row_verdicts, **kwargs))
+    return results, row_verdicts.stats()
+
+
+def full(csv_path):
+    return list(iter_validate_file(csv_path, MAPPING, TEMPLATE_FIELDS))
+
+
+def test_incremental_runs_match_full_runs_and_reuse_unchanged_rows(tmp_path):
+    store = str(tmp_path / "store.rvs")
+    rows = make_rows(200)
+    first_csv = write_csv(tmp_path / "day1.csv", rows)
+
+    results, stats = run(first_csv, store)
+    assert results == full(first_csv)
+    assert stats == {"previous_rows": 0, "reused": 0, "validated": 200}
+
+    # Next day: a few rows change, one is added and duplicates appear in unchanged rows
+    rows[10][1] = "999"
+    rows[11][3] = "https://cdn.example.com/new.jpg"
+    rows.append(["S3", "103", "150", "https://cdn.example.com/3.jpg"])
+    rows.insert(0, ["S50", "1", "500", "bad"])
+    second_csv = write_csv(tmp_path / "day2.csv", rows)
+
+    results, stats = run(second_csv, store)
+    assert results == full(second_csv)
+    assert stats["previous_rows"] == 200
+    assert stats["validated"] == 4
+    assert stats["reused"] == 198
+    # Unchanged row whose SKU is now taken by the inserted first row
+    assert results[51]["errors"]["sku"] == "Duplicate value"
+
+
+def test_duplicate_in_reused_row_keeps_full_run_error_order(tmp_path):
+    store = str(tmp_path / "store.rvs")
+    write_csv(tmp_path / "day1.csv", [["A", "500", "100", "bad"]])
+    run(str(tmp_path / "day1.csv"), store)
+
+    csv_path = write_csv(tmp_path / "day2.csv", [["B", "500", "900", "bad"], ["A", "500", "100", "bad"]])
+    results, stats = run(csv_path, store)
+
+    assert stats["reused"] == 1
+    assert results == full(csv_path)
+    assert list(results[1]["errors"]) == ["price", "image"]
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_row_verdict_store_round_trip_and_unreadable_store(tmp_path, monkeypatch, with_numpy):
+    if with_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(incrementalValidation, "np", None)
+    path = str(tmp_path / "store.rvs")
+    writer = RowVerdictWriter()
+    writer.add(7, {})
+    writer.add(2**64 - 1, {"name": "Required field missing"})
+    writer.add(3, {"sku": "Validation failed"})
+    writer.add(7, {})
+    writer.save(path)
+
+    store = RowVerdictStore.load(path)
+    assert len(store) == 3
+    assert list(store.digests) == [3, 7, 2**64 - 1]
+    assert store.get(3) == {"sku": "Validation failed"}
+    assert store.get(7) == {}
+    assert store.get(2**64 - 1) == {"name": "Required field missing"}
+    assert store.get(5) is None
+
+    (tmp_path / "store.rvs").write_bytes(b"RVS1\n{\"rows\": 9, \"verdicts\": []}\n")
+    assert RowVerdictStore.load(path) is None
+    assert RowVerdictStore.load(str(tmp_path / "missing.rvs")) is None
+
+
+def test_incremental_requires_compiled_engine_and_in_memory_tracking(tmp_path):
+    csv_path = write_csv(tmp_path / "data.csv", make_rows(3))
+    row_verdicts = RowVerdicts(str(tmp_path / "store.rvs"))
+
+    with pytest.raises(ValueError):
+        iter_validate_file(csv_path, MAPPING, TEMPLATE_FIELDS, "parallel", row_verdicts=row_verdicts)
+    with pytest.raises(ValueError):
+        iter_validate_file(
+            csv_path, MAPPING, TEMPLATE_FIELDS,
+            unique_seen=UniqueTrackers("spill"), row_verdicts=row_verdicts
+        )
+
+
+def test_abandoned_run_keeps_previous_store(tmp_path):
+    store = str(tmp_path / "store.rvs")
+    csv_path = write_csv(tmp_path / "data.csv", make_rows(10))
+    run(csv_path, store)
+
+    results = iter_validate_file(csv_path, MAPPING, TEMPLATE_FIELDS, row_verdicts=RowVerdicts(store))
+    next(results)
+    results.close()
+
+    assert len(RowVerdictStore.load(store, store_key(HEADER))) == 10
+
+
+def test_reordered_columns_do_not_reuse_verdicts(tmp_path):
+    store = str(tmp_path / "store.rvs")
+    day1 = tmp_path / "day1.csv"
+    day1.write_text("SKU,Price,MRP,Image\nA,100,120,https://cdn.example.com/a.jpg\n")
+    run(str(day1), store)
+
+    day2 = tmp_path / "day2.csv"
+    day2.write_text("SKU,MRP,Price,Image\nA,100,120,https://cdn.example.com/a.jpg\n")
+    results, stats = run(str(day2), store)
+
+    assert stats == {"previous_rows": 0, "reused": 0, "validated": 1}
+    assert results == full(str(day2))
+    assert not results[0]["valid"]
+
+
+def test_store_written_by_other_engine_version_is_ignored(tmp_path, monkeypatch):
+    store = str(tmp_path / "store.rvs")
+    csv_path = write_csv(tmp_path / "data.csv", make_rows(10))
+    run(csv_path, store)
+
+    monkeypatch.setattr("source.utility.incrementalValidation.VALIDATION_ENGINE_VERSION", "next")
+    _, stats = run(csv_path, store)
+
+    assert stats["reused"] == 0
+    assert list(tmp_path.glob("*.tmp")) == []
@@ -0,0 +1,213 @@
+import time
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from unittest.mock import MagicMock, patch
+
+from source.handlers import jobHandler
+from source.jobs.jobQueue import InMemoryJobQueue, set_job_queue, JOB_SUCCEEDED, JOB_FAILED, JOB_RUNNING
+from source.jobs.worker import JobWorkerPool
+
+TEMPLATE_FIELDS = {
+    "sku": {"type": "string", "required": True, "unique": True},
+    "price": {"type": "number", "required": True},
+    "mrp": {"type": "number", "required": True},
+}
+MAPPING = {"sku": "SKU", "price": "Price", "mrp": "MRP"}
+
+
+@pytest.fixture
+def queue():
+    q = InMemoryJobQueue()
+    set_job_queue(q)
+    yield q
+    set_job_queue(None)
+
+
+def wait_for(queue, job_id, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job["status"] in (JOB_SUCCEEDED, JOB_FAILED):
+            return job
+        time.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_in_memory_queue_claims_in_order(queue):
+    first = queue.enqueue("seller_1", 1, "compiled", 7)
+    second = queue.enqueue("seller_1", 2, "compiled", 7)
+
+    assert queue.claim()["id"] == first["id"]
+    assert queue.claim()["id"] == second["id"]
+    assert queue.claim() is None
+    assert queue.get(first["id"])["status"] == "running"
+
+
+def test_stale_running_job_is_requeued_then_failed():
+    queue = InMemoryJobQueue(lease_seconds=60, max_attempts=2)
+    job_id = queue.enqueue("seller_1", 1, "compiled", 7)["id"]
+
+    def worker_dies():
+        job = queue.claim()
+        queue.update_progress(job["id"], job["attempts"], 500)
+        queue._jobs[job["id"]]["heartbeat_at"] -= timedelta(seconds=120)
+        return job
+
+    assert worker_dies()["attempts"] == 1
+
+    reclaimed = worker_dies()
+    assert reclaimed["id"] == job_id
+    assert reclaimed["attempts"] == 2
+    assert reclaimed["rows_processed"] == 0
+
+    assert queue.claim() is None
+    job = queue.get(job_id)
+    assert job["status"] == JOB_FAILED
+    assert "stopped responding" in job["error"]
+
+
+def test_heartbeat_keeps_lease_alive():
+    queue = InMemoryJobQueue(lease_seconds=60)
+    job_id = queue.enqueue("seller_1", 1, "compiled", 7)["id"]
+    attempt = queue.claim()["attempts"]
+
+    queue._jobs[job_id]["heartbeat_at"] -= timedelta(seconds=120)
+    assert queue.heartbeat(job_id, attempt) is True
+
+    assert queue.claim() is None
+    assert queue.get(job_id)["status"] == JOB_RUNNING
+
+
+def test_reclaimed_job_ignores_previous_worker():
+    queue = InMemoryJobQueue(lease_seconds=60)
+    job_id = queue.enqueue("seller_1", 1, "compiled", 7)["id"]
+
+    old = queue.claim()
+    queue._jobs[job_id]["heartbeat_at"] -= timedelta(seconds=120)
+    new = queue.claim()
+    assert new["attempts"] == old["attempts"] + 1
+
+    assert queue.update_progress(job_id, new["attempts"], 10) is True
+    assert queue.update_progress(job_id, old["attempts"], 500) is False
+    assert queue.heartbeat(job_id, old["attempts"]) is False
+    assert queue.fail(job_id, old["attempts"], "boom") is False
+    assert queue.complete(job_id, old["attempts"], 500, {"total": 500}) is False
+
+    job = queue.get(job_id)
+    assert job["status"] == JOB_RUNNING
+    assert job["rows_processed"] == 10
+    assert job["result"] is None and job["error"] is None
+
+    assert queue.complete(job_id, new["attempts"], 20, {"total": 20}) is True
+    assert queue.complete(job_id, new["attempts"], 30, {"total": 30}) is False
+    assert queue.get(job_id)["result"] == {"total": 20}
+
+
+def test_worker_that_lost_its_lease_drops_its_result():
+    queue = InMemoryJobQueue(lease_seconds=60)
+    job_id = queue.enqueue("seller_1", 1, "compiled", 7)["id"]
+    reclaimed = {}
+
+    def run_job(job, report_progress):
+        # Another worker takes over while this attempt is still running
+        queue._jobs[job_id]["heartbeat_at"] -= timedelta(seconds=120)
+        reclaimed.update(queue.claim())
+        return 3, {"total": 3}
+
+    pool = JobWorkerPool(queue, run_job)
+    pool._process(queue.claim())
+
+    job = queue.get(job_id)
+    assert job["status"] == JOB_RUNNING
+    assert job["attempts"] == reclaimed["attempts"] == 2
+    assert job["result"] is None
+
+    def slow_job(job, report_progress):
+        queue._jobs[job_id]["heartbeat_at"] -= timedelta(seconds=120)
+        queue.claim()
+        report_progress(100)
+        raise AssertionError("progress after a lost lease must stop the attempt")
+
+    pool.run_job = slow_job
+    pool._process(queue.get(job_id))
+
+    job = queue.get(job_id)
+    assert job["status"] == JOB_RUNNING
+    assert job["attempts"] == 3
+    assert job["error"] is None
+
+
+@patch("source.handlers.jobHandler.SessionLocal", MagicMock())
+@patch("source.handlers.jobHandler.latest_csv_upload_id", MagicMock(return_value=7))
+@patch("source.handlers.jobHandler.load_validation_inputs")
+def test_submitted_job_is_processed_by_worker_pool(mock_inputs, queue, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("SKU,Price,MRP\nA1,100,120\nA1,200,100\nB2,1,2\n")
+    mock_inputs.return_value = (MAPPING, TEMPLATE_FIELDS, str(csv_path), None, None, None)
+
+    submitted = jobHandler.submit_validation_job(seller_id="seller_1", mapping_file_id=3)
+    assert submitted["status"] == "queued"
+    assert submitted["csv_upload_id"] == 7
+
+    pool = JobWorkerPool(queue, jobHandler.run_validation_job, workers=2, poll_interval=0.01)
+    pool.start()
+    try:
+        wait_for(queue, submitted["job_id"])
+    finally:
+        pool.stop()
+
+    job_status = jobHandler.get_validation_job(submitted["job_id"])
+    assert job_status["status"] == JOB_SUCCEEDED
+    assert job_status["rows_processed"] == 3
+    assert job_status["rows_per_second"] >= 0
+    assert job_status["csv_upload_id"] == 7
+    # The worker validates the upload pinned at submit, not whichever is latest when it runs
+    assert mock_inputs.call_args.args[1:] == ("seller_1", 3, 7)
+
+    result = jobHandler.get_validation_job_result(submitted["job_id"])
+    assert result["csv_upload_id"] == 7
+    assert result["total"] == 3
+    assert result["valid"] == 2
+    assert [e["row"] for e in result["errors"]] == [2]
+
+
+@patch("source.handlers.jobHandler.SessionLocal", MagicMock())
+@patch("source.handlers.jobHandler.latest_csv_upload_id", MagicMock(return_value=7))
+@patch("source.handlers.jobHandler.load_validation_inputs")
+def test_failed_job_reports_error(mock_inputs, queue, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("Other\nx\n")
+    mock_inputs.return_value = (MAPPING, TEMPLATE_FIELDS, str(csv_path), None, None, None)
+
+    job_id = jobHandler.submit_validation_job(seller_id="seller_1", mapping_file_id=3)["job_id"]
+
+    pool = JobWorkerPool(queue, jobHandler.run_validation_job, workers=1, poll_interval=0.01)
+    pool.start()
+    try:
+        job = wait_for(queue, job_id)
+    finally:
+        pool.stop()
+
+    assert job["status"] == JOB_FAILED
+    assert "CSV missing required columns" in job["error"]
+
+    with pytest.raises(HTTPException) as exc:
+        jobHandler.get_validation_job_result(job_id)
+    assert exc.value.status_code == 409
+
+
+@patch("source.handlers.jobHandler.SessionLocal", MagicMock())
+@patch("source.handlers.jobHandler.latest_csv_upload_id", MagicMock(return_value=None))
+def test_submit_without_upload_returns_404(queue):
+    with pytest.raises(HTTPException) as exc:
+        jobHandler.submit_validation_job(seller_id="seller_1", mapping_file_id=3)
+    assert exc.value.status_code == 404
+    assert queue.claim() is None
+
+
+def test_unknown_job_returns_404(queue):
+    with pytest.raises(HTTPException) as exc:
+        jobHandler.get_validation_job(999)
+    assert exc.value.status_code == 404
@@ -1,8 +1,13 @@
 import pytest
+import asyncio
 import csv
+import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
-from source.handlers.mappingHandler import validate_file
+from fastapi import HTTPException
+from source.handlers.mappingHandler import validate_file, stream_validation, load_stored_json, _result_options
+from source.utility.validationHelper import ErrorLimit
+from source.db.model import SellerCsvUpload
 
 TEST_DIR = Path(__file__).parent
 SAMPLE_CSV_PATH = TEST_DIR / "seller_1_mapping.json" 
@@ -11,7 +16,11 @@ SAMPLE_CSV_PATH = TEST_DIR / "seller_1_mapping.json"
 @patch("source.handlers.mappingHandler.load_json_file")
 @patch("source.handlers.mappingHandler.read_csv_rows")
 @patch("source.handlers.mappingHandler.validate_csv")
-def test_validate_file_success(mock_val_csv, mock_read_csv, mock_load_json, mock_session):
+@patch("source.handlers.mappingHandler.load_result", return_value=None)
+@patch("source.handlers.mappingHandler.save_result")
+def test_validate_file_success(
+    mock_save_result, mock_load_result, mock_val_csv, mock_read_csv, mock_load_json, mock_session
+):
     with open(SAMPLE_CSV_PATH, mode='r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         csv_data = [row for row in reader]
@@ -19,31 +28,289 @@ def test_validate_file_success(mock_val_csv, mock_read_csv, mock_load_json, mock
     mock_db = MagicMock()
     mock_session.return_value = mock_db
 
-    mock_db.query.return_value.filter.return_value.first.return_value = MagicMock(
-        template_id=1, 
-        mapping_file_id=10
-    )
-    
-    mock_db.query.return_value.get.side_effect = [
-        MagicMock(file_path="map.json"),  
-        MagicMock(file_id=20),            
-        MagicMock(file_path="temp.json"), 
-        MagicMock(csv_file_id=30),        
-        MagicMock(file_path="data.csv")  
-    ]
+    mock_db.query.return_value.outerjoin.return_value.outerjoin.return_value.outerjoin.return_value \
+        .filter.return_value.first.return_value = (
+            MagicMock(
+                template_id=1,
+                mapping_file_id=10,
+                content={"mapping": {"source_col": "target_col"}}
+            ),
+            MagicMock(file_id=20, content={"fields": [{"name": "target_col", "required": True}]}),
+            SellerCsvUpload(id=30),
+            "data.csv",
+            "c" * 64
+        )
 
-    mock_load_json.side_effect = [
-        {"mapping": {"source_col": "target_col"}},
-        {"fields": [{"name": "target_col", "required": True}]} 
-    ]
-    
     mock_read_csv.return_value = csv_data
     
-    mock_val_csv.return_value = [{"valid": True} for _ in csv_data]
+    mock_val_csv.return_value = [{"row": i, "valid": True} for i in range(1, len(csv_data) + 1)]
 
     result = validate_file(seller_id="seller_1", mapping_file_id=10)
 
     assert result["total"] == len(csv_data)
     assert result["valid"] == len(csv_data)
+    assert result["cached"] is False
+    key = mock_load_result.call_args.args[1]
+    assert key["csv_sha256"] == "c" * 64
+    mock_save_result.assert_called_once_with(
+        mock_db, key, {"total": len(csv_data), "valid": len(csv_data), "errors": []}
+    )
     mock_val_csv.assert_called_once()
-    mock_session.return_value.close.assert_called() 
\ No newline at end of file
+    mock_read_csv.assert_called_once_with("data.csv")
+    mock_load_json.assert_not_called()
+    assert mock_db.query.call_count == 1
+    mock_session.return_value.close.assert_called() 
+
+
+@patch("source.handlers.mappingHandler.SessionLocal")
+@patch("source.handlers.mappingHandler.fetch_validation_records")
+def test_validate_file_without_csv_upload_returns_404(mock_fetch, mock_session):
+    mock_fetch.return_value = (
+        MagicMock(content={"mapping": {"sku": "SKU"}}),
+        MagicMock(content={"fields": {"sku": {"type": "string"}}}),
+        None,
+        None,
+        None
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        validate_file(seller_id="seller_1", mapping_file_id=10)
+
+    assert exc.value.status_code == 404
+    assert exc.value.detail == "No CSV uploaded for seller"
+
+
+@patch("source.handlers.mappingHandler.load_json_file")
+def test_load_stored_json_falls_back_to_file_when_not_backfilled(mock_load_json):
+    mock_db = MagicMock()
+    mock_db.query.return_value.get.return_value = MagicMock(id=-301, file_path="map.json")
+    mock_load_json.return_value = {"mapping": {"sku": "SKU"}}
+
+    assert load_stored_json(mock_db, {"mapping": {}}, 7, "missing") == {"mapping": {}}
+    mock_load_json.assert_not_called()
+
+    assert load_stored_json(mock_db, None, 7, "missing") == {"mapping": {"sku": "SKU"}}
+    mock_load_json.assert_called_once_with("map.json")
+
+def _collect_stream(response):
+    async def consume():
+        return [chunk async for chunk in response.body_iterator]
+
+    return "".join(asyncio.run(consume()))
+
+
+def test_stream_validation_emits_ndjson_rows_and_summary(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("SKU,Price,MRP\nA1,100,120\nA1,200,100\n")
+
+    mapping = {"sku": "SKU", "price": "Price", "mrp": "MRP"}
+    template_fields = {
+        "sku": {"type": "string", "required": True, "unique": True},
+        "price": {"type": "number", "required": True},
+        "mrp": {"type": "number", "required": True},
+    }
+
+    response = stream_validation("seller_1", 10, str(csv_path), mapping, template_fields)
+    lines = [json.loads(line) for line in _collect_stream(response).splitlines()]
+
+    assert response.media_type == "application/x-ndjson"
+    assert lines[0] == {"row": 1, "valid": True, "errors": {}}
+    assert lines[1]["errors"] == {
+        "sku": "Duplicate value",
+        "price": "Price cannot exceed MRP",
+    }
+    summary = lines[-1]["summary"]
+    assert summary.pop("unique_memory_bytes")["sku"] > 0
+    assert summary.pop("column_cache") == {}
+    assert summary == {
+        "seller_id": "seller_1",
+        "mapping_file_id": 10,
+        "total": 2,
+        "valid": 1,
+        "truncated": False,
+        "stopped_at_row": None,
+    }
+
+
+def test_stream_validation_stops_at_max_errors(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("SKU,Price,MRP\nA1,100,120\nA2,x,100\nA3,x,100\nA4,x,100\n")
+
+    mapping = {"sku": "SKU", "price": "Price", "mrp": "MRP"}
+    template_fields = {
+        "sku": {"type": "string", "required": True},
+        "price": {"type": "number", "required": True},
+        "mrp": {"type": "number", "required": True},
+    }
+
+    response = stream_validation(
+        "seller_1", 10, str(csv_path), mapping, template_fields, limit=ErrorLimit(2)
+    )
+    lines = [json.loads(line) for line in _collect_stream(response).splitlines()]
+
+    assert [line["row"] for line in lines[:-1]] == [1, 2, 3]
+    summary = lines[-1]["summary"]
+    assert summary["total"] == 3
+    assert summary["truncated"] is True
+    assert summary["stopped_at_row"] == 3
+
+
+@patch("source.handlers.mappingHandler.SessionLocal")
+def test_validate_file_rejects_non_positive_max_errors(mock_session):
+    with pytest.raises(HTTPException) as exc:
+        validate_file(seller_id="seller_1", mapping_file_id=10, max_errors=0)
+
+    assert exc.value.status_code == 400
+    mock_session.assert_not_called()
+
+
+@patch("source.handlers.mappingHandler.SessionLocal")
+def test_validate_file_rejects_exact_unique_with_spill_tracker(mock_session):
+    with pytest.raises(HTTPException) as exc:
+        validate_file(seller_id="seller_1", mapping_file_id=10, unique_tracker="spill", exact_unique=True)
+
+    assert exc.value.status_code == 400
+    mock_session.assert_not_called()
+
+
+def test_result_options_ignore_exact_for_trackers_without_it():
+    assert _result_options("set", True) == _result_options("set", False) == "set"
+    assert _result_options("digest64", True) == "digest64+exact"
+    assert _result_options("digest64", False) == "digest64"
+
+
+def test_stream_validation_rejects_missing_columns_before_streaming(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("Price\n100\n")
+
+    with pytest.raises(ValueError):
+        stream_validation(
+            "seller_1", 10, str(csv_path),
+            {"sku": "SKU"},
+            {"sku": {"type": "string", "required": True}}
+        )
+
+
+@patch("source.handlers.mappingHandler.SessionLocal")
+@patch("source.handlers.mappingHandler.fetch_validation_records")
+def test_validate_file_preview_returns_estimates(mock_fetch, mock_session, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("SKU,Price,MRP\nA1,100,120\nA2,x,100\n")
+
+    mock_fetch.return_value = (
+        MagicMock(mapping_file_id=10, content={"mapping": {"sku": "SKU", "price": "Price", "mrp": "MRP"}}),
+        MagicMock(file_id=20, content={"fields": {
+            "sku": {"type": "string", "required": True, "unique": True},
+            "price": {"type": "number", "required": True},
+            "mrp": {"type": "number", "required": True},
+        }}),
+        SellerCsvUpload(id=30, headers=["SKU", "Price", "MRP"], row_count=2),
+        str(csv_path),
+        None
+    )
+
+    result = validate_file(seller_id="seller_1", mapping_file_id=10, preview=True)
+
+    assert result["preview"] is True
+    assert result["exact"] is True
+    assert result["head_rows"] == 2
+    assert result["invalid_rate"]["estimate"] == 0.5
+    assert result["field_error_rates"]["price"]["estimate"] == 0.5
+    assert [r["row"] for r in result["errors"]] == [2]
+
+
+@pytest.mark.parametrize("kwargs", [{"preview_rows": 100001}, {"sample_size": 10001}, {"sample_size": -1}])
+@patch("source.handlers.mappingHandler.SessionLocal")
+def test_validate_file_preview_limits(mock_session, kwargs):
+    with pytest.raises(HTTPException) as exc:
+        validate_file(seller_id="seller_1", mapping_file_id=10, preview=True, **kwargs)
+
+    assert exc.value.status_code == 400
+    mock_session.assert_not_called()
+
+
+@patch("source.handlers.mappingHandler.SessionLocal")
+@patch("source.handlers.mappingHandler.fetch_validation_records")
+@patch("source.handlers.mappingHandler.load_result")
+@patch("source.handlers.mappingHandler.save_result")
+@patch("source.handlers.mappingHandler.iter_validate_file")
+def test_validate_file_served_from_result_store(
+    mock_iter, mock_save_result, mock_load_result, mock_fetch, mock_session
+):
+    mock_fetch.return_value = (
+        MagicMock(mapping_file_id=10, content={"mapping": {"sku": "SKU"}}),
+        MagicMock(file_id=20, content={"fields": {"sku": {"type": "string"}}}),
+        SellerCsvUpload(id=30),
+        "data.csv",
+        "c" * 64
+    )
+    failing = {"row": 2, "valid": False, "errors": {"sku": "Validation failed"}}
+    mock_load_result.return_value = {"total": 3, "valid": 2, "errors": [failing]}
+
+    result = validate_file(seller_id="seller_1", mapping_file_id=10, engine="parallel")
+
+    assert result["cached"] is True
+    assert result["errors"] == [
+        {"row": 1, "valid": True, "errors": {}},
+        failing,
+        {"row": 3, "valid": True, "errors": {}},
+    ]
+    mock_iter.assert_not_called()
+    mock_save_result.assert_not_called()
+
+    mock_iter.return_value = iter([failing])
+    result = validate_file(seller_id="seller_1", mapping_file_id=10, engine="parallel", refresh=True)
+
+    assert result["cached"] is False
+    assert mock_load_result.call_count == 1
+    mock_save_result.assert_called_once()
+
+
+@patch("source.handlers.mappingHandler.SessionLocal")
+@patch("source.handlers.mappingHandler.fetch_validation_records")
+@patch("source.handlers.mappingHandler.iter_validate_file")
+@patch("source.handlers.mappingHandler.read_csv_rows")
+def test_validate_file_checks_recorded_headers_without_opening_csv(
+    mock_read_csv, mock_iter, mock_fetch, mock_session
+):
+    mock_fetch.return_value = (
+        MagicMock(mapping_file_id=10, content={"mapping": {"sku": "SKU"}}),
+        MagicMock(file_id=20, content={"fields": {"sku": {"type": "string", "required": True}}}),
+        SellerCsvUpload(id=30, headers=["Name", "Price"], row_count=5),
+        "missing.csv",
+        "c" * 64
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        validate_file(seller_id="seller_1", mapping_file_id=10)
+
+    assert exc.value.status_code == 400
+    assert "CSV missing required columns" in exc.value.detail
+    mock_read_csv.assert_not_called()
+    mock_iter.assert_not_called()
+
+
+@patch("source.handlers.mappingHandler.SessionLocal")
+@patch("source.handlers.mappingHandler.fetch_validation_records")
+@patch("source.handlers.mappingHandler.load_result", return_value=None)
+@patch("source.handlers.mappingHandler.save_result")
+@patch("source.handlers.mappingHandler.iter_validate_file")
+@patch("source.handlers.mappingHandler.read_csv_rows")
+def test_validate_file_reads_large_upload_lazily(
+    mock_read_csv, mock_iter, mock_save_result, mock_load_result, mock_fetch, mock_session, monkeypatch
+):
+    monkeypatch.setattr("source.handlers.mappingHandler.VALIDATION_IN_MEMORY_MAX_ROWS", 2)
+    mock_fetch.return_value = (
+        MagicMock(mapping_file_id=10, content={"mapping": {"sku": "SKU"}}),
+        MagicMock(file_id=20, content={"fields": {"sku": {"type": "string"}}}),
+        SellerCsvUpload(id=30, headers=["SKU"], row_count=3),
+        "data.csv",
+        "c" * 64
+    )
+    mock_iter.return_value = iter([{"row": i, "valid": True, "errors": {}} for i in (1, 2, 3)])
+
+    result = validate_file(seller_id="seller_1", mapping_file_id=10)
+
+    assert result["total"] == 3
+    mock_iter.assert_called_once()
+    mock_read_csv.assert_not_called()
@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+from fastapi import FastAPI, Request
+
+from source.handlers.authHandler import createJWTToken
+from source.middleware import AuthMiddleware
+
+
+def make_app():
+    app = FastAPI()
+
+    @app.get("/v1")
+    def ping():
+        return {"message": "ok"}
+
+    @app.get("/v1/whoami")
+    def whoami(request: Request):
+        return {"sub": request.state.user["sub"]}
+
+    app.add_middleware(AuthMiddleware)
+    return app
+
+
+def call(app, path, headers=()):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+
+    status_code = messages[0]["status"]
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return status_code, json.loads(body)
+
+
+def test_unauthenticated_path_skips_token_check():
+    assert call(make_app(), "/v1") == (200, {"message": "ok"})
+
+
+def test_missing_and_malformed_authorization_header():
+    app = make_app()
+
+    assert call(app, "/v1/whoami") == (401, {"detail": "Authorization header missing"})
+    assert call(app, "/v1/whoami", [("Authorization", "Basic abc")]) == (
+        401, {"detail": "Invalid Authorization header format"}
+    )
+
+
+def test_invalid_token_is_rejected():
+    status_code, body = call(make_app(), "/v1/whoami", [("Authorization", "Bearer x.y.z")])
+
+    assert status_code == 401
+    assert "Invalid token" in body["detail"]
+
+
+def test_verified_payload_is_exposed_as_request_state_user():
+    token = createJWTToken(40004)
+
+    assert call(make_app(), "/v1/whoami", [("Authorization", f"Bearer {token}")]) == (
+        200, {"sub": "40004"}
+    )
@@ -0,0 +1,115 @@
+import csv
+import io
+import random
+
+from source.utility.parallelValidation import (
+    find_row_boundaries,
+    plan_shards,
+    iter_parallel_results,
+    shutdown_executor,
+)
+from source.utility.validationPlan import compile_plan
+
+HEADER = ["SKU", "Price", "MRP", "Description"]
+MAPPING = {"sku": "SKU", "price": "Price", "mrp": "MRP", "description": "Description"}
+TEMPLATE_FIELDS = {
+    "sku": {"type": "string", "required": True, "unique": True},
+    "price": {"type": "number", "required": True, "unique": True},
+    "mrp": {"type": "number", "required": True},
+    "description": {"type": "string", "maxLen": 20},
+}
+
+
+def write_catalog(path, rows=300, seed=3):
+    rnd = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        for i in range(rows):
+            writer.writerow([
+                str(rnd.randint(0, 150)),
+                rnd.choice(["10", "20", "x", "", "500", str(i)]),
+                rnd.choice(["100", "15", ""]),
+                rnd.choice(['plain', 'multi\nline "quoted"', "a,b\n\nc", "x" * 30]),
+            ])
+        f.write("\n")
+
+
+def test_find_row_boundaries_skips_newlines_inside_quotes():
+    data = b'h1,h2\n1,"a\nb"\n2,"c""\nd"\n3,e\n'
+    f = io.BytesIO(data)
+
+    assert find_row_boundaries(f, [0]) == [6]
+    assert find_row_boundaries(f, [7, 15]) == [14, 24]
+
+
+def test_plan_shards_cover_data_rows(tmp_path):
+    path = tmp_path / "catalog.csv"
+    write_catalog(path)
+    size = path.stat().st_size
+
+    shards = plan_shards(str(path), 8, min_shard_bytes=64)
+
+    assert len(shards) == 8
+    assert shards[-1][1] == size
+    assert all(a[1] == b[0] for a, b in zip(shards, shards[1:]))
+
+
+def test_parallel_results_match_sequential_run(tmp_path):
+    path = tmp_path / "catalog.csv"
+    write_catalog(path)
+
+    with open(path, newline="", encoding="utf-8") as f:
+        records = [r for r in csv.reader(f) if r]
+    plan = compile_plan(TEMPLATE_FIELDS, MAPPING, records[0])
+    expected = list(plan.new_run().results(records[1:]))
+
+    try:
+        actual = list(iter_parallel_results(
+            str(path), TEMPLATE_FIELDS, MAPPING, HEADER, workers=3, min_shard_bytes=64
+        ))
+    finally:
+        shutdown_executor()
+
+    assert actual == expected
+    assert [list(r["errors"]) for r in actual] == [list(r["errors"]) for r in expected]
+
+
+def test_parallel_engine_validates_compressed_file_in_process(tmp_path):
+    import gzip
+    from source.utility.validationHelper import iter_validate_file
+
+    path = tmp_path / "catalog.csv"
+    write_catalog(path)
+    gz_path = tmp_path / "catalog.csv.gz"
+    gz_path.write_bytes(gzip.compress(path.read_bytes()))
+
+    expected = list(iter_validate_file(str(path), MAPPING, TEMPLATE_FIELDS))
+    actual = list(iter_validate_file(str(gz_path), MAPPING, TEMPLATE_FIELDS, engine="parallel"))
+
+    assert actual == expected
+
+
+def test_stray_quote_falls_back_to_sequential_results(tmp_path):
+    path = tmp_path / "catalog.csv"
+    rnd = random.Random(5)
+    lines = [",".join(HEADER)]
+    for i in range(400):
+        description = rnd.choice(['TV 55" wide', '"multi\nline"', "plain"])
+        lines.append(f"{i},{rnd.choice(['10', 'x', str(i)])},100,{description}")
+    path.write_text("\n".join(lines) + "\n")
+
+    with open(path, newline="", encoding="utf-8") as f:
+        records = [r for r in csv.reader(f) if r]
+    plan = compile_plan(TEMPLATE_FIELDS, MAPPING, records[0])
+    expected = list(plan.new_run().results(records[1:]))
+
+    try:
+        for expected_rows in (None, len(records) - 1):
+            actual = list(iter_parallel_results(
+                str(path), TEMPLATE_FIELDS, MAPPING, HEADER, workers=3, min_shard_bytes=64,
+                expected_rows=expected_rows
+            ))
+            assert actual == expected
+    finally:
+        shutdown_executor()
@@ -0,0 +1,159 @@
+import random
+
+import pytest
+
+from source.utility.previewValidation import preview_file, sample_records, wilson_interval
+from source.utility.rowIndex import RowIndexBuilder, save_row_index
+from source.utility.validationHelper import iter_validate_file
+
+MAPPING = {"sku": "SKU", "price": "Price", "mrp": "MRP", "desc": "Desc"}
+TEMPLATE_FIELDS = {
+    "sku": {"type": "string", "required": True},
+    "price": {"type": "number", "required": True},
+    "mrp": {"type": "number", "required": True},
+    "desc": {"type": "string", "maxLen": 20},
+}
+
+
+def write_csv(path, row_count, bad_every=5):
+    lines = ["SKU,Price,MRP,Desc"]
+    for i in range(row_count):
+        price = "x" if i % bad_every == 0 else "100"
+        desc = '"two\nlines, quoted"' if i % 7 == 0 else "plain"
+        lines.append(f"S{i},{price},120,{desc}")
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def add_row_index(csv_path, row_count):
+    builder = RowIndexBuilder()
+    with open(csv_path, "rb") as f:
+        builder.write(f.read())
+    save_row_index(csv_path, builder.finish(row_count))
+
+
+def test_preview_of_small_file_is_exact_and_matches_full_run(tmp_path):
+    csv_path = write_csv(tmp_path / "data.csv", 50)
+
+    preview = preview_file(csv_path, MAPPING, TEMPLATE_FIELDS, 1000, 100)
+    full = list(iter_validate_file(csv_path, MAPPING, TEMPLATE_FIELDS))
+
+    invalid = [r for r in full if not r["valid"]]
+    rate = len(invalid) / len(full)
+
+    assert preview["exact"] is True
+    assert preview["sampled_rows"] == 0
+    assert preview["estimated_rows"] == 50
+    assert preview["errors"] == invalid
+    assert preview["invalid_rate"] == {"estimate": rate, "low": rate, "high": rate}
+    assert preview["field_error_rates"]["desc"]["estimate"] == 0.0
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+def test_sampled_records_stay_aligned_across_multiline_fields(tmp_path, indexed):
+    csv_path = write_csv(tmp_path / "data.csv", 5000)
+    if indexed:
+        add_row_index(csv_path, 5000)
+
+    header, head, sample, tail_rows = sample_records(csv_path, 10, 300, random.Random(7))
+
+    assert header == ["SKU", "Price", "MRP", "Desc"]
+    assert len(head) == 10
+    assert tail_rows == 4990
+    assert len(sample) == 300
+    assert len({record[0] for record in sample}) == 300
+    for record in sample:
+        assert record[0].startswith("S") and int(record[0][1:]) >= 10 and record[2] == "120"
+        assert record[3] in ("plain", "two\nlines, quoted")
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+def test_preview_interval_covers_file_error_rate(tmp_path, indexed):
+    csv_path = write_csv(tmp_path / "data.csv", 20000, bad_every=4)
+    if indexed:
+        add_row_index(csv_path, 20000)
+
+    preview = preview_file(csv_path, MAPPING, TEMPLATE_FIELDS, 100, 800, rng=random.Random(11))
+
+    price = preview["field_error_rates"]["price"]
+    assert preview["exact"] is False
+    assert price["low"] <= 0.25 <= price["high"]
+    assert price["high"] - price["low"] < 0.1
+    assert preview["field_error_rates"]["sku"]["estimate"] == 0.0
+    assert preview["estimated_rows"] == 20000
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+def test_preview_samples_short_rows(tmp_path, indexed):
+    lines = ["SKU,Price,MRP,Desc"]
+    for i in range(20000):
+        lines.append(f"S{i}" if i % 2 else f"S{i},100,120,plain")
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("\n".join(lines) + "\n")
+    csv_path = str(csv_path)
+    if indexed:
+        add_row_index(csv_path, 20000)
+
+    preview = preview_file(csv_path, MAPPING, TEMPLATE_FIELDS, 100, 800, rng=random.Random(3))
+
+    invalid = preview["invalid_rate"]
+    assert preview["estimated_rows"] == 20000
+    assert preview["sampled_rows"] == 800
+    assert invalid["low"] <= 0.5 <= invalid["high"]
+    assert invalid["high"] - invalid["low"] < 0.1
+    assert preview["errors"][0]["errors"]["mrp"] == "Required field missing"
+
+
+def test_preview_without_sample_reports_unknown_tail(tmp_path):
+    csv_path = write_csv(tmp_path / "data.csv", 2000, bad_every=4)
+
+    preview = preview_file(csv_path, MAPPING, TEMPLATE_FIELDS, 100, 0)
+
+    assert preview["exact"] is False
+    assert preview["sampled_rows"] == 0
+    assert preview["estimated_rows"] is None
+    assert preview["invalid_rate"] == {"estimate": 0.25, "low": 0.0, "high": 1.0}
+    assert preview["field_error_rates"]["price"]["high"] == 1.0
+
+    add_row_index(csv_path, 2000)
+    preview = preview_file(csv_path, MAPPING, TEMPLATE_FIELDS, 100, 0)
+
+    assert preview["estimated_rows"] == 2000
+    assert preview["invalid_rate"] == {"estimate": 0.25, "low": 0.0, "high": 1.0}
+
+
+def test_preview_sampling_every_remaining_row_is_exact(tmp_path):
+    csv_path = write_csv(tmp_path / "data.csv", 300, bad_every=4)
+    add_row_index(csv_path, 300)
+
+    preview = preview_file(csv_path, MAPPING, TEMPLATE_FIELDS, 100, 500)
+
+    assert preview["sampled_rows"] == 200
+    assert preview["invalid_rate"] == {"estimate": 0.25, "low": 0.25, "high": 0.25}
+
+
+def test_wilson_interval():
+    assert wilson_interval(0.5, 0) == (0.0, 1.0)
+    low, high = wilson_interval(0.0, 100)
+    assert low == 0.0 and 0.0 < high < 0.05
+    low, high = wilson_interval(0.5, 100)
+    assert round(low, 3) == 0.404 and round(high, 3) == 0.596
+
+
+def test_preview_of_compressed_file_samples_tail_in_one_pass(tmp_path):
+    import gzip
+
+    plain_path = write_csv(tmp_path / "data.csv", 3000)
+    gz_path = tmp_path / "data.csv.gz"
+    gz_path.write_bytes(gzip.compress((tmp_path / "data.csv").read_bytes()))
+
+    header, head, sample, tail_rows = sample_records(str(gz_path), 100, 200, random.Random(5))
+    assert len(head) == 100
+    assert tail_rows == 2900
+    assert len(sample) == 200
+
+    preview = preview_file(str(gz_path), MAPPING, TEMPLATE_FIELDS, 100, 200, rng=random.Random(5))
+    full = list(iter_validate_file(plain_path, MAPPING, TEMPLATE_FIELDS))
+
+    assert preview["estimated_rows"] == len(full)
+    assert preview["errors"] == [r for r in full[:100] if not r["valid"]]
@@ -0,0 +1,50 @@
+import hashlib
+from unittest.mock import MagicMock
+
+from source.db.resultStore import (
+    content_hash,
+    result_key,
+    ensure_csv_sha256,
+    compact_result,
+    expand_result,
+)
+
+
+def test_content_hash_ignores_key_order():
+    assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+    assert content_hash({"a": 1}) != content_hash({"a": 2})
+
+
+def test_result_key_changes_with_inputs():
+    key = result_key("c" * 64, {"sku": "SKU"}, {"sku": {"type": "string"}}, "set")
+
+    assert key["csv_sha256"] == "c" * 64
+    assert key["options"] == "set"
+    assert key != result_key("c" * 64, {"sku": "Sku"}, {"sku": {"type": "string"}}, "set")
+    assert key != result_key("c" * 64, {"sku": "SKU"}, {"sku": {"type": "string"}}, "spill")
+
+
+def test_compact_and_expand_round_trip():
+    results = [
+        {"row": 1, "valid": True, "errors": {}},
+        {"row": 2, "valid": False, "errors": {"sku": "Duplicate value"}, "duplicate_of": {"sku": 1}},
+        {"row": 3, "valid": True, "errors": {}},
+    ]
+
+    compact = compact_result(results)
+
+    assert compact == {"total": 3, "valid": 2, "errors": [results[1]]}
+    assert expand_result(compact) == results
+
+
+def test_ensure_csv_sha256_hashes_legacy_files_once(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(b"SKU\nA1\n")
+    db = MagicMock()
+
+    assert ensure_csv_sha256(db, str(csv_path), "f" * 64) == "f" * 64
+    db.commit.assert_not_called()
+
+    assert ensure_csv_sha256(db, str(csv_path)) == hashlib.sha256(b"SKU\nA1\n").hexdigest()
+    db.query.return_value.filter.return_value.update.assert_called_once()
+    db.commit.assert_called_once()
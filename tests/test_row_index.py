@@ -0,0 +1,90 @@
+import gzip
+import random
+
+from source.utility.fileHelper import iter_csv_records
+from source.utility.rowIndex import (
+    RowIndexBuilder,
+    save_row_index,
+    read_indexed_rows,
+    read_rows,
+)
+
+CSV_DATA = (
+    b'SKU,Desc\r\n'
+    b'A1,"multi\r\nline, quoted"\r\n'
+    b'\r\n'
+    b'A2,"say ""hi""\n"\n'
+    b'\n'
+    b'A3,plain\r\n'
+    b' ,\n'
+    b'A4,"a\n\nb"\n'
+    b'A5,last'
+)
+
+
+def build(data: bytes, chunk_size: int):
+    builder = RowIndexBuilder()
+    for i in range(0, len(data), chunk_size):
+        builder.write(data[i:i + chunk_size])
+    return builder
+
+
+def indexed_csv(tmp_path, data: bytes, chunk_size: int = 7) -> str:
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(data)
+    records = list(iter_csv_records(str(csv_path)))
+
+    offsets = build(data, chunk_size).finish(len(records) - 1)
+    assert offsets is not None
+    save_row_index(str(csv_path), offsets)
+    return str(csv_path)
+
+
+def test_index_matches_csv_reader_for_any_chunking(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(CSV_DATA)
+    header, *records = list(iter_csv_records(str(csv_path)))
+
+    for chunk_size in (1, 2, 3, 5, 64):
+        offsets = build(CSV_DATA, chunk_size).finish(len(records))
+        assert list(offsets) == list(build(CSV_DATA, 1024).finish(len(records)))
+
+    save_row_index(str(csv_path), offsets)
+
+    for start in range(1, len(records) + 2):
+        for count in range(1, len(records) + 2):
+            assert read_indexed_rows(str(csv_path), start, count) == (
+                header, records[start - 1:start - 1 + count], len(records)
+            )
+
+
+def test_large_index_pages_match_full_read(tmp_path):
+    rnd = random.Random(3)
+    lines = [b"SKU,Desc,Price"]
+    for i in range(5000):
+        desc = rnd.choice([b"plain", b'"two\nlines"', b'"q ""x"""', b'""'])
+        lines.append(b"S%d,%s,%d" % (i, desc, rnd.randint(1, 999)))
+    csv_path = indexed_csv(tmp_path, b"\n".join(lines) + b"\n", chunk_size=4096)
+    header, *records = list(iter_csv_records(csv_path))
+
+    assert read_rows(csv_path, 4990, 100) == (header, records[4989:], 5000)
+    assert read_rows(csv_path, 2500, 3)[1] == records[2499:2502]
+
+
+def test_stray_quote_or_compression_gives_no_index():
+    stray = b'SKU,Desc\nA1,5" wide\nA2,plain\nA3,plain\n'
+    assert build(stray, 4).finish(3) is None
+
+    assert build(gzip.compress(CSV_DATA), 4).finish(7) is None
+
+
+def test_read_rows_streams_when_no_index(tmp_path):
+    csv_path = tmp_path / "data.csv.gz"
+    csv_path.write_bytes(gzip.compress(CSV_DATA))
+
+    header, rows, total = read_rows(str(csv_path), 2, 2)
+
+    assert header == ["SKU", "Desc"]
+    assert rows == [["A2", 'say "hi"\n'], ["A3", "plain"]]
+    assert total is None
+    assert not (tmp_path / "data.csv.gz.rows").exists()
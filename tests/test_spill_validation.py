@@ -0,0 +1,119 @@
+import os
+import random
+import struct
+
+import pytest
+
+import source.utility.externalSort as externalSort
+from source.utility.externalSort import ExternalSorter
+from source.utility.spillValidation import iter_spill_results
+from source.utility.uniqueTracker import UniqueTrackers
+from source.utility.validationHelper import iter_validate_file
+from source.utility.validationPlan import compile_plan
+
+FIELDS = {
+    "sku": {"type": "string", "required": True, "unique": True},
+    "ean": {"type": "int", "unique": True},
+    "price": {"type": "number", "required": True},
+    "mrp": {"type": "number", "required": True},
+}
+MAPPING = {"sku": "SKU", "ean": "EAN", "price": "Price", "mrp": "MRP"}
+HEADERS = ["SKU", "EAN", "Price", "MRP"]
+
+
+@pytest.fixture
+def small_budget(monkeypatch, tmp_path):
+    monkeypatch.setattr(externalSort, "UNIQUE_SPILL_BUDGET_BYTES", 4096)
+    monkeypatch.setattr(externalSort, "UNIQUE_SPILL_DIR", str(tmp_path))
+    return tmp_path
+
+
+def random_records(count, seed):
+    rnd = random.Random(seed)
+    return [
+        [
+            rnd.choice([str(rnd.randrange(count // 3)), ""]),
+            rnd.choice(["", "x", str(rnd.randrange(50))]),
+            rnd.choice(["10", "200", "a"]),
+            rnd.choice(["100", ""]),
+        ]
+        for _ in range(count)
+    ]
+
+
+def test_external_sorter_spills_and_merges(small_budget):
+    record = struct.Struct(">Q")
+    values = [random.Random(3).randrange(10**9) for _ in range(5000)]
+
+    with ExternalSorter(record.size, fan_in=2) as sorter:
+        for v in values:
+            sorter.add(record.pack(v))
+        assert sorter.spilled_bytes > 0
+        assert [record.unpack(r)[0] for r in sorter.sorted()] == sorted(values)
+        assert sorter.nbytes() <= 4096 + 64
+
+    assert os.listdir(small_budget) == []
+
+
+def test_spill_results_match_in_memory_results(small_budget):
+    records = random_records(3000, seed=5)
+    plan = compile_plan(FIELDS, MAPPING, HEADERS)
+    expected = list(plan.new_run().results(records))
+
+    trackers = UniqueTrackers("spill")
+    actual = list(iter_spill_results(plan, lambda: iter(records), trackers))
+
+    assert [{k: r[k] for k in ("row", "valid", "errors")} for r in actual] == expected
+    assert [list(r["errors"]) for r in actual] == [list(r["errors"]) for r in expected]
+    assert set(trackers.memory()) == {"sku", "ean"}
+    assert os.listdir(small_budget) == []
+
+
+def test_spill_sorters_share_one_budget(small_budget):
+    records = random_records(3000, seed=11)
+    plan = compile_plan(FIELDS, MAPPING, HEADERS)
+
+    trackers = UniqueTrackers("spill")
+    list(iter_spill_results(plan, lambda: iter(records), trackers))
+
+    # Two unique fields and the duplicate rows: a third of the budget each
+    assert all(tracker.budget_bytes == 4096 // 3 for tracker in trackers.values())
+    assert sum(trackers.memory().values()) <= 2 * (4096 // 3 + 64)
+
+
+def test_spill_results_name_first_occurrence(small_budget):
+    plan = compile_plan(FIELDS, MAPPING, HEADERS)
+    records = [
+        ["A", "1", "1", "2"],
+        ["B", "1", "1", "2"],
+        ["A", "2", "1", "2"],
+        ["A", "1", "1", "2"],
+    ]
+
+    results = list(iter_spill_results(plan, lambda: iter(records), UniqueTrackers("spill")))
+
+    assert "duplicate_of" not in results[0]
+    assert results[1]["duplicate_of"] == {"ean": 1}
+    assert results[2]["duplicate_of"] == {"sku": 1}
+    assert results[3]["duplicate_of"] == {"sku": 1, "ean": 1}
+    assert results[3]["errors"] == {"sku": "Duplicate value", "ean": "Duplicate value"}
+
+
+def test_spill_requires_compiled_engine(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("SKU,EAN,Price,MRP\nA,1,1,2\n")
+
+    with pytest.raises(ValueError):
+        iter_validate_file(str(csv_path), MAPPING, FIELDS, "columnar", unique_seen=UniqueTrackers("spill"))
+
+
+def test_spill_file_validation(small_budget, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("SKU,EAN,Price,MRP\nA,1,1,2\nA,2,1,2\n")
+
+    results = list(iter_validate_file(
+        str(csv_path), MAPPING, FIELDS, unique_seen=UniqueTrackers("spill")
+    ))
+
+    assert [r["valid"] for r in results] == [True, False]
+    assert results[1]["duplicate_of"] == {"sku": 1}
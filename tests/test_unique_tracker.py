@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from source.utility.uniqueTracker import DigestSet, UniqueTrackers, duplicate_check
+from source.utility.validationPlan import compile_plan
+
+
+def random_values(count, seed):
+    rnd = random.Random(seed)
+    return [f"SKU-{rnd.randrange(count // 2)}" for _ in range(count)]
+
+
+@pytest.mark.parametrize("bits,exact", [(64, False), (128, False), (64, True), (128, True)])
+def test_digest_set_matches_set(bits, exact):
+    values = random_values(20000, seed=bits + exact)
+    expected = duplicate_check(set())
+    actual = DigestSet(bits, exact, capacity=8)
+
+    assert [actual.check_and_add(v) for v in values] == [expected(v) for v in values]
+    assert len(actual) == len(set(values))
+    assert all(v in actual for v in values[:100])
+    assert "missing" not in actual
+
+
+def test_exact_confirm_survives_digest_collisions(monkeypatch):
+    tracker = DigestSet(64, exact=True)
+    monkeypatch.setattr(tracker, "_digest", lambda value, data: (7, 0))
+
+    results = [tracker.check_and_add(v) for v in ["a", "b", "a", "c", "b"]]
+
+    assert results == [False, False, True, False, True]
+    assert len(tracker) == 3
+
+
+def test_digest_tracker_uses_less_memory_than_set():
+    values = [f"SKU-{n:08d}" for n in range(50000)]
+    trackers = UniqueTrackers("set")
+    digests = UniqueTrackers("digest64")
+
+    for v in values:
+        trackers["sku"].add(v)
+        digests["sku"].add(v)
+
+    assert digests.memory()["sku"] * 3 < trackers.memory()["sku"]
+
+
+def test_plan_results_do_not_depend_on_tracker():
+    fields = {
+        "sku": {"type": "string", "required": True, "unique": True},
+        "ean": {"type": "string", "unique": True},
+    }
+    plan = compile_plan(fields, {"sku": "SKU", "ean": "EAN"}, ["SKU", "EAN"])
+    rnd = random.Random(1)
+    records = [[str(rnd.randrange(300)), rnd.choice(["", "x", "y", str(n)])] for n in range(1000)]
+
+    expected = list(plan.new_run().results(records))
+
+    for kind in ("digest64", "digest128"):
+        for exact in (False, True):
+            trackers = UniqueTrackers(kind, exact)
+            assert list(plan.new_run(trackers).results(records)) == expected
+            assert set(trackers.memory()) == {"sku", "ean"}
+
+
+def test_unknown_tracker_is_rejected():
+    with pytest.raises(ValueError):
+        UniqueTrackers("bloom")
+
+
+def test_spill_tracker_rejects_exact():
+    with pytest.raises(ValueError):
+        UniqueTrackers("spill", exact=True)
+    assert UniqueTrackers("spill").kind == "spill"
@@ -0,0 +1,153 @@
+import hashlib
+import io
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from unittest.mock import MagicMock
+
+from source.handlers import uploadSessionHandler
+from source.db.model import Files, SellerCsvUpload, UploadSession
+from source.utility.chunkStore import write_chunk, ChunkChecksumError
+
+
+def sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr("source.utility.chunkStore.UPLOAD_SESSION_DIR", tmp_path / "sessions")
+    monkeypatch.setattr("source.db.blobStore.BLOB_DIR", tmp_path / "blobs")
+    return tmp_path
+
+
+def make_db(monkeypatch, session, received=None):
+    db = MagicMock()
+    monkeypatch.setattr(uploadSessionHandler, "SessionLocal", lambda: db)
+
+    session_query = MagicMock()
+    session_query.filter.return_value.first.return_value = session
+    session_query.filter.return_value.with_for_update.return_value.first.return_value = session
+
+    chunk_query = MagicMock()
+    # (chunk_index, sha256) rows
+    chunk_query.filter.return_value.all.return_value = list((received or {}).items())
+
+    db.query.side_effect = lambda *entities: session_query if entities[0] is UploadSession else chunk_query
+
+    added = []
+    db.add.side_effect = added.append
+
+    def flush():
+        for obj in added:
+            if isinstance(obj, Files):
+                obj.id = 1
+            elif isinstance(obj, SellerCsvUpload):
+                obj.id = 10
+
+    db.flush.side_effect = flush
+    db.added = added
+    return db
+
+
+def put(upload_id, index, data, checksum=None):
+    return uploadSessionHandler.put_chunk(
+        upload_id, index, seller_id="seller_1", sha256=checksum or sha(data),
+        file=UploadFile(filename="blob", file=io.BytesIO(data))
+    )
+
+
+def test_write_chunk_rejects_checksum_mismatch_and_keeps_previous_copy(tmp_path):
+    write_chunk("u1", 0, io.BytesIO(b"good"), sha(b"good"), root=tmp_path)
+
+    with pytest.raises(ChunkChecksumError):
+        write_chunk("u1", 0, io.BytesIO(b"corrupt"), sha(b"good"), root=tmp_path)
+
+    assert [p.name for p in (tmp_path / "u1").iterdir()] == [f"000000.{sha(b'good')}.part"]
+    assert (tmp_path / "u1" / f"000000.{sha(b'good')}.part").read_bytes() == b"good"
+
+
+def test_chunks_uploaded_out_of_order_are_finalized_into_csv_upload(dirs, monkeypatch):
+    csv_data = b'SKU,Description\nA1,"multi\nline"\nA2,plain\nA3,last\n'
+    parts = [csv_data[:9], csv_data[9:25], csv_data[25:]]
+
+    session = UploadSession(id="u1", seller_id="seller_1", file_name="feed.csv", chunk_count=3, status="open")
+    db = make_db(monkeypatch, session, received={i: sha(part) for i, part in enumerate(parts)})
+
+    for index in (2, 0, 1):
+        assert put("u1", index, parts[index])["size"] == len(parts[index])
+
+    response = uploadSessionHandler.complete_upload("u1", seller_id="seller_1")
+
+    assert response["uploadId"] == "u1"
+    assert response["csvUploadId"] == 10
+    assert response["headers"] == ["SKU", "Description"]
+    assert response["rowCount"] == 3
+    assert response["sampleRows"][0] == {"SKU": "A1", "Description": "multi\nline"}
+
+    stored = db.added[0]
+    assert stored.content_sha256 == sha(csv_data)
+    assert Path(stored.file_path).read_bytes() == csv_data
+    assert db.added[1].csv_file_id == 1
+
+    assert session.status == "completed"
+    assert session.csv_upload_id == 10
+    assert not (dirs / "sessions" / "u1").exists()
+
+
+def test_complete_uses_chunk_file_of_recorded_digest(dirs, monkeypatch):
+    header, first, second = b"SKU,Price\n", b"A1,10\n", b"B2,20\n"
+
+    session = UploadSession(id="u1", seller_id="seller_1", file_name="feed.csv", chunk_count=2, status="open")
+    # Two PUTs of chunk 1 raced; the row recorded is the first one's
+    db = make_db(monkeypatch, session, received={0: sha(header), 1: sha(first)})
+
+    put("u1", 0, header)
+    put("u1", 1, first)
+    write_chunk("u1", 1, io.BytesIO(second), sha(second), root=dirs / "sessions")
+
+    response = uploadSessionHandler.complete_upload("u1", seller_id="seller_1")
+
+    assert response["sampleRows"] == [{"SKU": "A1", "Price": "10"}]
+    assert Path(db.added[0].file_path).read_bytes() == header + first
+
+
+def test_complete_rejects_missing_chunks(dirs, monkeypatch):
+    session = UploadSession(id="u1", seller_id="seller_1", file_name="feed.csv", chunk_count=3, status="open")
+    db = make_db(monkeypatch, session, received={1: sha(b"x")})
+
+    with pytest.raises(HTTPException) as exc:
+        uploadSessionHandler.complete_upload("u1", seller_id="seller_1")
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail["missingChunks"] == [0, 2]
+    assert session.status == "open"
+    db.commit.assert_not_called()
+
+
+def test_put_chunk_rejects_bad_checksum_and_completed_upload(dirs, monkeypatch):
+    session = UploadSession(id="u1", seller_id="seller_1", file_name="feed.csv", chunk_count=2, status="open")
+    db = make_db(monkeypatch, session)
+
+    with pytest.raises(HTTPException) as exc:
+        put("u1", 0, b"data", checksum=sha(b"other"))
+    assert exc.value.status_code == 400
+    db.execute.assert_not_called()
+
+    with pytest.raises(HTTPException) as exc:
+        put("u1", 2, b"data")
+    assert exc.value.status_code == 400
+
+    session.status = "completed"
+    with pytest.raises(HTTPException) as exc:
+        put("u1", 0, b"data")
+    assert exc.value.status_code == 409
+
+
+def test_initiate_rejects_non_csv_and_bad_chunk_count(dirs):
+    with pytest.raises(HTTPException):
+        uploadSessionHandler.initiate_upload(seller_id="seller_1", filename="feed.xlsx", chunk_count=2)
+
+    with pytest.raises(HTTPException):
+        uploadSessionHandler.initiate_upload(seller_id="seller_1", filename="feed.csv", chunk_count=0)
@@ -0,0 +1,105 @@
+import random
+from urllib.parse import urlparse
+
+import pytest
+
+from source.utility.validators import is_http_url, url_array_check
+
+
+def reference_url(v):
+    p = urlparse(v)
+    return p.scheme in ("http", "https") and bool(p.netloc)
+
+
+def reference_url_array(v, required):
+    parts = [x.strip() for x in v.strip().split("|") if x.strip()]
+    if not parts:
+        return not required
+    return all(reference_url(url) for url in parts)
+
+
+def verdict(check, *args):
+    try:
+        return check(*args)
+    except ValueError:
+        return ValueError
+
+
+EDGE_CASES = [
+    "",
+    "http://example.com",
+    "https://example.com/a.jpg?x=1#top",
+    "HTTPS://EXAMPLE.COM",
+    "hTtP://a",
+    "http://",
+    "http:///path",
+    "http://?q",
+    "http://#f",
+    "http:/example.com",
+    "http:example.com",
+    "http//example.com",
+    "https:",
+    "httpx://example.com",
+    "htp://example.com",
+    "ftp://example.com",
+    "mailto:a@b.com",
+    "//example.com",
+    "example.com",
+    "   http://example.com",
+    "\x00\x1fhttp://example.com",
+    "\x7fhttp://example.com",
+    "http://example.com   ",
+    "http:// ",
+    "http://user:pw@host:8080/p",
+    "http://:80",
+    "http://@",
+    "ht\ttp://example.com",
+    "http:/\n/example.com",
+    "\thttp://example.com",
+    "http://\r",
+    "http://[::1]/",
+    "http://[::1",
+    "http://::1]/",
+    "http://[bad]/",
+    "ftp://[x",
+    "//[x",
+    "http://example.com/[x]",
+    "http://exämple.com",
+    "http://ex\u2100ample.com",
+    "\u00a0http://example.com",
+    "http\u0130://example.com",
+    "\u212ahttp://example.com",
+    "1http://example.com",
+    "a+b.c-d://example.com",
+    "https:a://b",
+    "http:://example.com",
+    "https://a:b:c",
+]
+
+
+@pytest.mark.parametrize("value", EDGE_CASES)
+def test_url_edge_cases_match_urlparse(value):
+    assert verdict(is_http_url, value) == verdict(reference_url, value)
+
+
+def random_value(rng):
+    alphabet = "hHtTpPsSxf:/?#@[]. \t\r\n\x00\x1fa1-+|\u00e4\u2100\u212a"
+    prefix = rng.choice(["", "http://", "https://", "HTTP:", "//", " ", "\x01https:/"])
+    body = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+    return prefix + body
+
+
+def test_url_check_matches_urlparse_on_random_values():
+    rng = random.Random(15)
+    for _ in range(20000):
+        value = random_value(rng)
+        assert verdict(is_http_url, value) == verdict(reference_url, value), repr(value)
+
+
+@pytest.mark.parametrize("required", [True, False])
+def test_url_array_check_matches_urlparse_on_random_values(required):
+    rng = random.Random(16)
+    check = url_array_check({"required": required})
+    for _ in range(5000):
+        value = "|".join(random_value(rng) for _ in range(rng.randint(0, 4)))
+        assert verdict(check, value) == verdict(reference_url_array, value, required), repr(value)
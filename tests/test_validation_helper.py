@@ -1,4 +1,6 @@
-from source.utility.validationHelper import validate_csv
+import pytest
+
+from source.utility.validationHelper import validate_csv, error_limit, rows_after
 
 
 def test_validate_csv_success():
@@ -36,3 +38,59 @@ def test_validate_csv_price_gt_mrp():
 
     assert result[0]["valid"] is False
     assert "price" in result[0]["errors"]
+
+
+def _results(valid_flags):
+    for row, valid in enumerate(valid_flags, start=1):
+        yield {"row": row, "valid": valid, "errors": {} if valid else {"sku": "Validation failed"}}
+
+
+def test_error_limit_stops_after_max_errors_and_closes_source():
+    validated = []
+    flags = [True, False, True, False, False, True]
+
+    def source():
+        for result in _results(flags):
+            validated.append(result["row"])
+            yield result
+
+    results = source()
+    limit = error_limit(max_errors=2)
+
+    assert [r["row"] for r in limit.apply(results, lambda row: row < len(flags))] == [1, 2, 3, 4]
+    assert limit.summary() == {"truncated": True, "stopped_at_row": 4}
+    # No row past the limit is validated to find out whether rows were left
+    assert validated == [1, 2, 3, 4]
+    assert results.gi_frame is None
+
+
+def test_error_limit_not_truncated_when_limit_hit_on_last_row():
+    limit = error_limit(fail_fast=True)
+
+    assert [r["row"] for r in limit.apply(_results([True, False]), lambda row: row < 2)] == [1, 2]
+    assert limit.summary() == {"truncated": False, "stopped_at_row": None}
+
+
+def test_error_limit_without_limit_passes_results_through():
+    source = _results([False, False])
+    limit = error_limit()
+
+    assert limit.apply(source, lambda row: True) is source
+    assert len(list(source)) == 2
+    assert limit.truncated is False
+
+
+def test_error_limit_rejects_non_positive_max_errors():
+    with pytest.raises(ValueError):
+        error_limit(max_errors=0)
+
+
+def test_rows_after_reads_records_without_row_count(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("SKU\nA1\n\nA2\n")
+
+    has_more = rows_after(str(csv_path))
+    assert [has_more(row) for row in (0, 1, 2)] == [True, True, False]
+
+    assert rows_after(str(csv_path), row_count=5)(4) is True
+    assert rows_after(str(csv_path), row_count=5)(5) is False
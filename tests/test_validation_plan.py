@@ -0,0 +1,104 @@
+import csv
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from tests.referenceValidator import prepare_validation, iter_validate_rows
+from source.utility.validationPlan import compile_plan
+
+TEST_DIR = Path(__file__).parent
+
+MAPPING = json.loads((TEST_DIR / "seller_1_mapping.json").read_text())["mapping"]
+TEMPLATE_FIELDS = json.loads((TEST_DIR / "seller_1_myntra_template.json").read_text())["fields"]
+
+
+def random_rows(count, seed=7):
+    rnd = random.Random(seed)
+    choices = {
+        "Name": ["TShirt", "", "x" * 250],
+        "BrandName": ["Otto", ""],
+        "Gender": ["Men", "Women", "Alien", ""],
+        "Category": ["Shirt", ""],
+        "Color": ["Blue"],
+        "Size": ["32", ""],
+        "MRP": ["100", "abc", "", "-5", "1e3"],
+        "Price": ["90", "150", "", "x"],
+        "SKU": [str(n) for n in range(20)] + [""],
+        "Image1": ["https://a.com/1.jpg|https://b.com", "ftp://x", "|", ""],
+        "Description": ["d", "y" * 600],
+        "Material": ["", "Wool"],
+    }
+    return [
+        {col: rnd.choice(values) for col, values in choices.items()}
+        for _ in range(count)
+    ]
+
+
+def reference(rows, mapping, template_fields):
+    context = prepare_validation(mapping, template_fields, rows[0].keys())
+    return list(iter_validate_rows(rows, context))
+
+
+def test_dict_plan_matches_reference():
+    rows = random_rows(500)
+
+    plan = compile_plan(TEMPLATE_FIELDS, MAPPING, rows[0].keys(), positional=False)
+    results = list(plan.new_run().results(rows))
+
+    assert results == reference(rows, MAPPING, TEMPLATE_FIELDS)
+
+
+def test_positional_plan_matches_reference():
+    rows = random_rows(500, seed=11)
+    headers = list(rows[0].keys())
+    records = [[row[h] for h in headers] for row in rows]
+
+    plan = compile_plan(TEMPLATE_FIELDS, MAPPING, headers)
+    results = list(plan.new_run().results(records))
+
+    assert results == reference(rows, MAPPING, TEMPLATE_FIELDS)
+
+
+def test_positional_plan_on_sample_csv():
+    with open(TEST_DIR / "sample.csv", newline="", encoding="utf-8") as f:
+        records = list(csv.reader(f))
+    with open(TEST_DIR / "sample.csv", newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    plan = compile_plan(TEMPLATE_FIELDS, MAPPING, records[0])
+
+    assert list(plan.new_run().results(records[1:])) == reference(rows, MAPPING, TEMPLATE_FIELDS)
+
+
+def test_short_records_are_padded_with_empty_values():
+    plan = compile_plan(
+        {"sku": {"type": "string", "required": True}, "brand": {"type": "string"}},
+        {"sku": "SKU", "brand": "Brand"},
+        ["SKU", "Brand"],
+    )
+
+    results = list(plan.new_run().results([["A1"], []]))
+
+    assert results[0]["valid"] is True
+    assert results[1]["errors"] == {"sku": "Required field missing"}
+
+
+def test_plan_is_cached_and_runs_are_independent():
+    headers = ["SKU"]
+    fields = {"sku": {"type": "string", "unique": True}}
+
+    plan = compile_plan(fields, {"sku": "SKU"}, headers)
+    assert compile_plan(fields, {"sku": "SKU"}, headers) is plan
+
+    first = list(plan.new_run().results([["A"], ["A"]]))
+    second = list(plan.new_run().results([["A"]]))
+
+    assert first[1]["errors"] == {"sku": "Duplicate value"}
+    assert second[0]["valid"] is True
+
+
+def test_plan_rejects_missing_required_columns():
+    with pytest.raises(ValueError):
+        compile_plan({"sku": {"type": "string", "required": True}}, {"sku": "SKU"}, ["Other"])
@@ -0,0 +1,91 @@
+import random
+from unittest.mock import MagicMock
+
+from source.utility.validationPlan import compile_plan
+from source.utility.verdictCache import MemoizedCheck, VerdictCaches
+
+FIELDS = {
+    "sku": {"type": "string", "required": True},
+    "image": {"type": "url", "required": True},
+    "gallery": {"type": "urlArray"},
+}
+MAPPING = {"sku": "SKU", "image": "Image", "gallery": "Gallery"}
+
+
+def test_memoized_check_validates_each_value_once():
+    check = MagicMock(side_effect=lambda v: v.startswith("https://"))
+    memo = MemoizedCheck(check)
+
+    values = ["https://a", "ftp://b", "https://a", "ftp://b", "https://a"]
+
+    assert [memo(v) for v in values] == [True, False, True, False, True]
+    assert check.call_count == 2
+    assert memo.stats() == {
+        "distinct": 2,
+        "cached": True,
+        "calls": 5,
+        "hits": 3,
+        "hit_rate": 0.6,
+    }
+
+
+def test_unique_column_stops_caching_after_sample():
+    check = MagicMock(return_value=True)
+    memo = MemoizedCheck(check, sample=10, min_hit_rate=0.5)
+
+    for n in range(30):
+        memo(str(n))
+
+    assert memo.cached is False
+    assert memo.stats()["distinct"] == 10
+    assert check.call_count == 30
+
+
+def test_hit_rate_checked_when_sample_boundary_is_a_hit():
+    memo = MemoizedCheck(lambda v: True, sample=4, min_hit_rate=0.5)
+
+    for value in ["a", "a", "b", "a"]:
+        memo(value)
+    for n in range(1000):
+        memo(str(n))
+
+    # 2 hits in the first 4 calls meets the rate, so caching stays on
+    assert memo.cached is True
+
+    memo = MemoizedCheck(lambda v: True, sample=4, min_hit_rate=0.8)
+
+    for value in ["a", "a", "b", "a"]:
+        memo(value)
+    for n in range(1000):
+        memo(str(n))
+
+    assert memo.cached is False
+    assert memo.stats()["distinct"] == 2
+
+
+def test_cardinality_cutoff_bounds_cache():
+    memo = MemoizedCheck(lambda v: True, max_distinct=5, sample=10**9)
+
+    for n in range(20):
+        memo(str(n))
+
+    assert memo.cached is False
+    assert len(memo.verdicts) == 5
+
+
+def test_memoized_plan_results_match_and_report_stats():
+    rnd = random.Random(2)
+    urls = ["https://cdn.example.com/a.jpg", "http://x", "notaurl", "https://b.com/1|ftp://c"]
+    records = [[str(n), rnd.choice(urls), rnd.choice(urls + [""])] for n in range(500)]
+    plan = compile_plan(FIELDS, MAPPING, ["SKU", "Image", "Gallery"])
+
+    verdicts = VerdictCaches()
+    expected = list(plan.new_run().results(records))
+
+    assert list(plan.new_run(verdicts=verdicts).results(records)) == expected
+
+    stats = verdicts.stats()
+    assert set(stats) == {"image", "gallery"}
+    assert stats["image"]["distinct"] == 4
+    assert stats["image"]["calls"] == 500
+    assert stats["image"]["hit_rate"] > 0.9